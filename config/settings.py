@@ -10,6 +10,11 @@ WINDOW_WIDTH = 1280
 WINDOW_HEIGHT = 720
 WINDOW_TITLE = "DARK SANCTUM - Survive. Evolve. Dominate."
 FPS = 60
+SPRITE_SCALE = 1.5                   # Sprite render scale (Sprint 27: 1.5x for visibility)
+
+# === WORLD SETTINGS ===
+WORLD_WIDTH = 4096                   # Arena size in world pixels (camera follows the player)
+WORLD_HEIGHT = 4096
 
 # === COLORS (Gothic Theme) ===
 COLOR_BACKGROUND = (15, 10, 25)      # Deep purple-black
@@ -83,7 +88,38 @@ ABILITY_R_DURATION = 3.0              # Seconds
 # === PERFORMANCE SETTINGS ===
 MAX_ENTITIES = 500                   # Maximum entities at once
 MAX_PROJECTILES = 200                # Maximum projectiles
+MAX_PARTICLES = 4096                 # Particle pool capacity (oldest recycled when full)
+MAX_DAMAGE_NUMBERS = 80              # Floating numbers at once (extra hits merge into nearby numbers)
+DAMAGE_COALESCE_WINDOW = 0.3         # Hits on one target this close together add up in one number (s)
+DAMAGE_NUMBER_SPAWN_BUDGET = 12      # New damage numbers per frame (extra hits merge)
+DAMAGE_MERGE_RADIUS = 48             # Over-budget damage merges into a live number this close (pixels)
+MAX_VFX_ENTITIES = 150               # Trails, glows, impacts and timed ability effects
+PARTICLE_EMIT_BUDGET = 800           # New particles per frame (bursts thinned beyond this)
 CULLING_DISTANCE = 1000              # Don't render beyond this
+CULL_MARGIN = 64                     # Off-screen margin kept when culling (largest sprite half-extent)
+SPATIAL_CELL_SIZE = 128              # Spatial index grid cell (pixels)
+ATLAS_PATH = "assets/atlas.npz"      # Packed sprite atlas (tools/build_atlas.py), optional
+RENDER_CACHE_SIZE = 512              # Max cached render surfaces (LRU)
+TEXT_CACHE_SIZE = 1024               # Max cached text surfaces (LRU)
+TEXT_CACHE_MAX_BYTES = 16 * 1024 * 1024  # Text cache memory budget
+UI_CACHE_SIZE = 128                  # Max cached UI surfaces (panels, buttons, headers, cards)
+UI_CACHE_MAX_BYTES = 8 * 1024 * 1024   # UI cache memory budget (cards are ~350 KB each)
+GLYPH_ALPHA_LEVELS = 16              # Pre-baked fade levels for glyph atlases (damage numbers)
+GLOW_INTENSITY_LEVELS = 16           # Pre-rendered glow sprites per unit of VFX glow intensity
+DIRTY_RECT_RENDERING = False         # Present only changed regions (software rendering)
+DIRTY_RECT_MAX_COVERAGE = 0.5        # Full flip when dirty area exceeds this share of the screen
+THREADED_RENDERING = False           # Draw frame N on a worker thread while frame N+1 simulates
+RENDER_SCALE = 1                     # World drawn at 1/N resolution and upscaled (1 native, 2 half, 3 third)
+BACKGROUND_CHUNK_SIZE = 256          # Background cache chunk (world pixels, multiple of the 64px tile)
+BACKGROUND_CHUNK_MARGIN = 1          # Chunks streamed in around the view (evicted beyond margin + 1)
+UPSCALE_FILTER = "nearest"           # "nearest" or "scale2x" (crisp edges, RENDER_SCALE 2 only)
+ANIMATED_BACKGROUND = False          # Parallax stars/fog + ambient particles instead of the static tiles
+STAR_TWINKLE_FRAMES = 6              # Pre-rendered brightness frames per background star
+AUDIO_CHANNELS = 16                  # Pooled mixer channels
+AUDIO_RESERVED_CHANNELS = 2          # Channels kept for boss spawn / level up
+AUDIO_VOICES_PER_SOUND = 3           # Concurrent voices of one sound
+AUDIO_ESCALATION = 0.15              # Extra volume per doubling of same-frame events (merged into one voice)
+AUDIO_SOUND_VARIANTS = 3             # Pitch variants per sound, rotated on each play
 
 # === BOSS SETTINGS ===
 BOSS_WAVE_INTERVAL = 5               # Boss every N waves
@@ -87,19 +87,39 @@ ANIM_PULSE = 1.5  # Pulse cycle duration
 class GothicPanel:
     """Gothic-styled panel with ornate borders"""
 
+    # Corner ornaments reach this far outside the panel rect
+    ORNAMENT_PAD = 8
+
     @staticmethod
     def draw(surface: pygame.Surface, rect: pygame.Rect,
              bg_color=GOTHIC_SHADOW, border_color=GOTHIC_GOLD,
              border_width=BORDER_MEDIUM, alpha=255):
-        """Draw gothic panel with decorative border"""
+        """Draw gothic panel with decorative border (cached per size/colors/border)"""
+        panel_surf = GothicPanel.get_surface(rect.size, bg_color, border_color, border_width, alpha)
+        pad = GothicPanel.ORNAMENT_PAD
+        return surface.blit(panel_surf, (rect.x - pad, rect.y - pad))
 
-        # Create surface with alpha if needed
-        if alpha < 255:
-            panel_surf = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-            panel_surf.fill((*bg_color, alpha))
-            surface.blit(panel_surf, rect)
-        else:
-            pygame.draw.rect(surface, bg_color, rect)
+    @staticmethod
+    def get_surface(size: tuple, bg_color=GOTHIC_SHADOW, border_color=GOTHIC_GOLD,
+                    border_width=BORDER_MEDIUM, alpha=255) -> pygame.Surface:
+        """Cached panel surface, padded by ORNAMENT_PAD on every side"""
+        from src.core.asset_manager import asset_manager
+        cache_key = ("gothic_panel", tuple(size), tuple(bg_color), tuple(border_color), border_width, alpha)
+        panel_surf = asset_manager.ui_cache.get(cache_key)
+        if panel_surf is None:
+            panel_surf = GothicPanel._build_surface(size, bg_color, border_color, border_width, alpha)
+            asset_manager.ui_cache.put(cache_key, panel_surf)
+        return panel_surf
+
+    @staticmethod
+    def _build_surface(size: tuple, bg_color, border_color, border_width, alpha) -> pygame.Surface:
+        """Render background, borders and corner ornaments once"""
+        pad = GothicPanel.ORNAMENT_PAD
+        surface = pygame.Surface((size[0] + pad * 2, size[1] + pad * 2), pygame.SRCALPHA)
+        rect = pygame.Rect(pad, pad, size[0], size[1])
+
+        # Background (translucent when alpha < 255)
+        surface.fill((*bg_color[:3], alpha), rect)
 
         # Outer border
         pygame.draw.rect(surface, border_color, rect, border_width)
@@ -108,7 +128,7 @@ class GothicPanel:
         inner_rect = rect.inflate(-border_width * 2, -border_width * 2)
         pygame.draw.rect(surface, GOTHIC_BLACK, inner_rect, 1)
 
-        # Corner ornaments (small triangles)
+        # Corner ornaments (small diamonds)
         corner_size = 8
         corners = [
             (rect.left + border_width, rect.top + border_width),  # Top-left
@@ -117,19 +137,12 @@ class GothicPanel:
             (rect.right - border_width, rect.bottom - border_width),  # Bottom-right
         ]
 
-        for i, (cx, cy) in enumerate(corners):
-            # Draw small ornamental diamond
-            if i == 0:  # Top-left
-                points = [(cx, cy + corner_size), (cx + corner_size, cy), (cx, cy - corner_size), (cx - corner_size, cy)]
-            elif i == 1:  # Top-right
-                points = [(cx, cy + corner_size), (cx + corner_size, cy), (cx, cy - corner_size), (cx - corner_size, cy)]
-            elif i == 2:  # Bottom-left
-                points = [(cx, cy + corner_size), (cx + corner_size, cy), (cx, cy - corner_size), (cx - corner_size, cy)]
-            else:  # Bottom-right
-                points = [(cx, cy + corner_size), (cx + corner_size, cy), (cx, cy - corner_size), (cx - corner_size, cy)]
-
+        for cx, cy in corners:
+            points = [(cx, cy + corner_size), (cx + corner_size, cy), (cx, cy - corner_size), (cx - corner_size, cy)]
             pygame.draw.polygon(surface, border_color, points, 1)
 
+        return surface
+
 
 class GothicButton:
     """Gothic-styled button with hover effects"""
@@ -137,7 +150,23 @@ class GothicButton:
     @staticmethod
     def draw(surface: pygame.Surface, rect: pygame.Rect, text: str, font: pygame.font.Font,
              is_hovered=False, is_selected=False, is_disabled=False):
-        """Draw gothic button"""
+        """Draw gothic button (panel + label cached per size/text/state)"""
+        from src.core.asset_manager import asset_manager
+        cache_key = ("gothic_button", rect.size, text, font, is_hovered, is_selected, is_disabled)
+        button_surf = asset_manager.ui_cache.get(cache_key)
+        if button_surf is None:
+            button_surf = GothicButton._build_surface(rect.size, text, font,
+                                                      is_hovered, is_selected, is_disabled)
+            asset_manager.ui_cache.put(cache_key, button_surf)
+
+        pad = GothicPanel.ORNAMENT_PAD
+        return surface.blit(button_surf, (rect.x - pad, rect.y - pad))
+
+    @staticmethod
+    def _build_surface(size: tuple, text: str, font: pygame.font.Font,
+                       is_hovered, is_selected, is_disabled) -> pygame.Surface:
+        """Compose panel and centered label once"""
+        from src.core.asset_manager import asset_manager
 
         # Determine colors based on state
         if is_disabled:
@@ -157,13 +186,15 @@ class GothicButton:
             border_color = GOTHIC_PURPLE
             text_color = GOTHIC_SILVER
 
-        # Draw panel
-        GothicPanel.draw(surface, rect, bg_color, border_color, BORDER_MEDIUM)
+        # Panel
+        pad = GothicPanel.ORNAMENT_PAD
+        button_surf = GothicPanel.get_surface(size, bg_color, border_color, BORDER_MEDIUM).copy()
 
-        # Draw text centered
-        text_surf = font.render(text, True, text_color)
-        text_rect = text_surf.get_rect(center=rect.center)
-        surface.blit(text_surf, text_rect)
+        # Text centered
+        text_surf = asset_manager.render_text(font, text, text_color)
+        text_rect = text_surf.get_rect(center=(pad + size[0] // 2, pad + size[1] // 2))
+        button_surf.blit(text_surf, text_rect)
+        return button_surf
 
 
 class GothicProgressBar:
@@ -193,11 +224,29 @@ class GothicHeader:
     @staticmethod
     def draw(surface: pygame.Surface, text: str, y: int, font: pygame.font.Font,
              color=GOTHIC_GOLD, decoration=True):
-        """Draw gothic header with optional decoration lines"""
+        """Draw gothic header with optional decoration lines (cached strip)"""
+        from src.core.asset_manager import asset_manager
+        width = surface.get_width()
+        cache_key = ("gothic_header", text, font, tuple(color), decoration, width)
+        header_surf = asset_manager.ui_cache.get(cache_key)
+        if header_surf is None:
+            header_surf = GothicHeader._build_surface(width, text, font, color, decoration)
+            asset_manager.ui_cache.put(cache_key, header_surf)
+
+        return surface.blit(header_surf, (0, y - header_surf.get_height() // 2))
+
+    @staticmethod
+    def _build_surface(width: int, text: str, font: pygame.font.Font,
+                       color, decoration: bool) -> pygame.Surface:
+        """Full-width strip: text centered, decoration lines and diamonds"""
+        from src.core.asset_manager import asset_manager
 
         # Render text
-        text_surf = font.render(text, True, color)
-        text_rect = text_surf.get_rect(center=(surface.get_width() // 2, y))
+        text_surf = asset_manager.render_text(font, text, color)
+        diamond_size = 4
+        height = max(text_surf.get_height(), diamond_size * 2 + 2)
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        text_rect = text_surf.get_rect(center=(width // 2, height // 2))
         surface.blit(text_surf, text_rect)
 
         if decoration:
@@ -206,7 +255,7 @@ class GothicHeader:
             line_left_start = 50
             line_left_end = text_rect.left - 20
             line_right_start = text_rect.right + 20
-            line_right_end = surface.get_width() - 50
+            line_right_end = width - 50
 
             # Left line
             pygame.draw.line(surface, color,
@@ -219,7 +268,6 @@ class GothicHeader:
                            (line_right_end, line_y), 2)
 
             # Small diamonds at line ends
-            diamond_size = 4
             for x in [line_left_start, line_left_end, line_right_start, line_right_end]:
                 points = [
                     (x, line_y - diamond_size),
@@ -229,6 +277,8 @@ class GothicHeader:
                 ]
                 pygame.draw.polygon(surface, color, points)
 
+        return surface
+
 
 # === HELPER FUNCTIONS ===
 
@@ -263,5 +313,6 @@ def draw_ornate_border(surface: pygame.Surface, color=GOTHIC_GOLD, width=BORDER_
 # - Animation timing constants for smooth transitions
 # - Ornamental details without being overwhelming
 # - Focus on readability and visual hierarchy
+# - Panels, buttons and headers render once and are served from the render cache
 
 
@@ -9,6 +9,10 @@ with tactical abilities and positioning
 import pygame
 import sys
 from src.core.ecs import World
+from src.core.profiler import profiler
+from src.core.dirty_rects import dirty_rects
+from src.core.render_pipeline import render_pipeline
+from src.core.asset_manager import asset_manager
 from src.entities.factory import EntityFactory
 from src.components.components import *
 from src.systems.movement_system import MovementSystem, PlayerInputSystem
@@ -32,7 +36,11 @@ from src.systems.screen_effects import (
 )
 from src.systems.map_system import MapManager, EnvironmentalHazardSystem
 from src.systems.boss_abilities import BossAbilitySystem
+from src.systems.spatial_system import SpatialIndexSystem
+from src.systems.camera_system import CameraSystem
+from src.systems.budget_system import BudgetSystem
 from src.systems.simple_background import SimpleBackgroundSystem  # Sprint 27: Simplified background
+from src.systems.background_system import BackgroundSystem, EnvironmentalParticles
 from src.components.character_classes import *
 from src.components.weapons import *
 from config.settings import *
@@ -66,6 +74,21 @@ class DarkSanctum:
         self.state = GameState.MENU
         self.running = True
 
+        # Dirty-rect presenting: last state seen and last static screen drawn
+        self.last_state = None
+        self.static_screen_key = None
+
+        # Last gameplay frame with the dark overlay baked in (PAUSED / LEVEL_UP backdrop)
+        self.frozen_frame = None
+
+        # Low-resolution world target (RENDER_SCALE > 1): background + sprites drawn small,
+        # upscaled once per frame; the animated background only draws at native size
+        self.world_target = None
+        if RENDER_SCALE > 1 and not ANIMATED_BACKGROUND:
+            world_size = (-(-WINDOW_WIDTH // RENDER_SCALE), -(-WINDOW_HEIGHT // RENDER_SCALE))
+            self.world_target = pygame.Surface(world_size).convert()
+            dirty_rects.enabled = False  # The upscale rewrites the whole window every frame
+
         # ECS World
         self.world = World()
         self.factory = EntityFactory(self.world)
@@ -113,8 +136,8 @@ class DarkSanctum:
         # Create systems
         self._init_systems()
 
-        # Spawn player at center with selected class
-        player = self.factory.create_player(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2, self.selected_class)
+        # Spawn player at the world center with selected class
+        player = self.factory.create_player(WORLD_WIDTH // 2, WORLD_HEIGHT // 2, self.selected_class)
 
         # Add stats component to player
         player.add_component(GameStats())
@@ -137,14 +160,26 @@ class DarkSanctum:
 
     def _init_systems(self):
         """Initialize all game systems"""
-        # Background (priority 1) - Sprint 27: Simple static background for clarity
-        self.world.add_system(SimpleBackgroundSystem(self.world, self.screen))
+        # Camera (priority 11): follows the player after movement, read by every drawer
+        self.world.add_system(CameraSystem(self.world))
+
+        # Background (priority 12) - Sprint 27: Simple static background for clarity
+        if ANIMATED_BACKGROUND:
+            # Baked parallax layers (priority 12) + ambient particles (priority 13)
+            self.world.add_system(BackgroundSystem(self.world, self.screen))
+            self.world.add_system(EnvironmentalParticles(self.world, self.screen))
+        else:
+            self.world.add_system(SimpleBackgroundSystem(
+                self.world, self.world_target if self.world_target is not None else self.screen))
 
         # Map System (priority 5)
         self.map_manager = MapManager(self.world)
         self.world.add_system(self.map_manager)
         self.map_manager.set_map(self.selected_map_id)
 
+        # Spawn budget (priority 3): per-category caps, counted once per frame
+        self.world.add_system(BudgetSystem(self.world))
+
         # Screen Effects (priority 5)
         self.world.add_system(ScreenEffectsSystem(self.world))
 
@@ -158,6 +193,9 @@ class DarkSanctum:
         # Status Effects (priority 15)
         self.world.add_system(StatusEffectSystem(self.world))
 
+        # Spatial Index (priority 20)
+        self.world.add_system(SpatialIndexSystem(self.world))
+
         # AI (priority 25)
         self.world.add_system(AISystem(self.world))
 
@@ -202,37 +240,61 @@ class DarkSanctum:
         self.world.add_system(AudioSystem(self.world))
 
         # Rendering (priority 100)
-        self.world.add_system(RenderSystem(self.world, self.screen))
+        self.world.add_system(RenderSystem(self.world, self.screen, self.world_target))
 
     def run(self):
         """Main game loop"""
         while self.running:
             dt = self.clock.tick(FPS) / 1000.0  # Delta time in seconds
+            profiler.begin_frame()
 
             # Handle events
             self._handle_events()
 
+            # State changes repaint the whole screen
+            if self.state != self.last_state:
+                render_pipeline.flush()  # Finish the gameplay frame still on the render thread
+                dirty_rects.invalidate()
+                self.last_state = self.state
+                if self.state == GameState.PLAYING:
+                    self.frozen_frame = None  # Resumed: snapshot is stale
+
             # Update based on state
             if self.state == GameState.MENU:
-                self._render_menu()
+                self._render_static_screen(self._render_menu, self.selected_difficulty_index)
             elif self.state == GameState.CLASS_SELECT:
-                self._render_class_select()
+                self._render_static_screen(self._render_class_select, self.selected_class_index)
             elif self.state == GameState.PLAYING:
                 self._update_game(dt)
                 self._check_game_over()
                 self._check_level_up()
             elif self.state == GameState.PAUSED:
+                dirty_rects.invalidate()
                 self._render_pause()
             elif self.state == GameState.LEVEL_UP:
+                dirty_rects.invalidate()
                 self._render_level_up()
             elif self.state == GameState.GAME_OVER:
-                self._render_game_over()
+                self._render_static_screen(self._render_game_over, self.final_score)
 
-            pygame.display.flip()
+            # Full flip, or only the dirty regions in dirty-rect mode
+            # (threaded rendering presents gameplay frames one frame later)
+            render_pipeline.present()
 
+        render_pipeline.flush()
         pygame.quit()
         sys.exit()
 
+    def _render_static_screen(self, render, key):
+        """Render a menu-style screen (dirty-rect mode: only when its state key changed)"""
+        key = (self.state, key)
+        if dirty_rects.enabled and key == self.static_screen_key and not dirty_rects.full_redraw:
+            return
+
+        render()
+        self.static_screen_key = key
+        dirty_rects.invalidate()
+
     def _handle_events(self):
         """Handle input events"""
         for event in pygame.event.get():
@@ -243,6 +305,7 @@ class DarkSanctum:
                 # ESC key
                 if event.key == pygame.K_ESCAPE:
                     if self.state == GameState.PLAYING:
+                        self._freeze_frame()
                         self.state = GameState.PAUSED
                     elif self.state == GameState.PAUSED:
                         self.state = GameState.PLAYING
@@ -368,12 +431,12 @@ class DarkSanctum:
         GothicHeader.draw(self.screen, "DARK SANCTUM", 120, self.title_font, GLOW_CRIMSON, decoration=True)
 
         # Subtitle
-        subtitle = self.medium_font.render("Survive. Evolve. Dominate.", True, GOTHIC_BONE)
+        subtitle = asset_manager.render_text(self.medium_font, "Survive. Evolve. Dominate.", GOTHIC_BONE)
         subtitle_rect = subtitle.get_rect(center=(WINDOW_WIDTH // 2, 200))
         self.screen.blit(subtitle, subtitle_rect)
 
         # Difficulty selection title
-        diff_title = self.medium_font.render("SELECT DIFFICULTY", True, GOTHIC_GOLD)
+        diff_title = asset_manager.render_text(self.medium_font, "SELECT DIFFICULTY", GOTHIC_GOLD)
         diff_title_rect = diff_title.get_rect(center=(WINDOW_WIDTH // 2, 280))
         self.screen.blit(diff_title, diff_title_rect)
 
@@ -407,13 +470,13 @@ class DarkSanctum:
 
         y_offset = 485
         for line in instructions:
-            text = self.small_font.render(line, True, GOTHIC_SILVER)
+            text = asset_manager.render_text(self.small_font, line, GOTHIC_SILVER)
             text_rect = text.get_rect(center=(WINDOW_WIDTH // 2, y_offset))
             self.screen.blit(text, text_rect)
             y_offset += 30
 
         # Credits
-        credit = self.small_font.render("Created by Emre ÖZGÖZ", True, GOTHIC_MIST)
+        credit = asset_manager.render_text(self.small_font, "Created by Emre ÖZGÖZ", GOTHIC_MIST)
         credit_rect = credit.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT - 30))
         self.screen.blit(credit, credit_rect)
 
@@ -460,39 +523,9 @@ class DarkSanctum:
             border_width = BORDER_THICK if is_selected else BORDER_MEDIUM
 
             box_rect = pygame.Rect(x, y, class_width, 380)
-            GothicPanel.draw(self.screen, box_rect, box_color, border_color, border_width)
-
-            # Class name
-            name_color = GOTHIC_BONE if is_selected else GOTHIC_SILVER
-            name_surf = self.large_font.render(char_class.name, True, name_color)
-            name_rect = name_surf.get_rect(center=(x + class_width // 2, y + 40))
-            self.screen.blit(name_surf, name_rect)
-
-            # Stats
-            stats = [
-                f"HP: {int(char_class.health)}",
-                f"DMG: {int(char_class.damage)}",
-                f"SPD: {int(char_class.speed)}",
-                "",
-                f"{char_class.passive_name}",
-            ]
-
-            stat_y = y + 100
-            for stat in stats:
-                color = GOTHIC_GOLD if stat == char_class.passive_name else GOTHIC_BONE
-                stat_surf = self.small_font.render(stat, True, color)
-                stat_rect = stat_surf.get_rect(center=(x + class_width // 2, stat_y))
-                self.screen.blit(stat_surf, stat_rect)
-                stat_y += 30
-
-            # Description (small font)
-            desc_lines = self._wrap_text(char_class.passive_description, 35)
-            desc_y = stat_y + 10
-            for line in desc_lines:
-                desc_surf = self.small_font.render(line, True, GOTHIC_MIST)
-                desc_rect = desc_surf.get_rect(center=(x + class_width // 2, desc_y))
-                self.screen.blit(desc_surf, desc_rect)
-                desc_y += 25
+            self._draw_card(box_rect, (box_color, border_color, border_width),
+                            ("class", char_class.name, is_selected),
+                            lambda surf, c=char_class, sel=is_selected: self._draw_class_card_content(surf, c, sel))
 
         # Sprint 29: Navigation arrows (large visual indicators)
         arrow_y = y + 200  # Middle of the character cards
@@ -520,7 +553,7 @@ class DarkSanctum:
 
         # Class indicator (show which class is selected)
         indicator_text = f"{center_index + 1} / {total_classes}"
-        indicator_surf = self.medium_font.render(indicator_text, True, GOTHIC_GOLD)
+        indicator_surf = asset_manager.render_text(self.medium_font, indicator_text, GOTHIC_GOLD)
         indicator_rect = indicator_surf.get_rect(center=(WINDOW_WIDTH // 2, 110))
         self.screen.blit(indicator_surf, indicator_rect)
 
@@ -529,7 +562,7 @@ class DarkSanctum:
         GothicPanel.draw(self.screen, inst_panel_rect, GOTHIC_SHADOW, GOTHIC_PURPLE, BORDER_THIN)
 
         inst_text = "LEFT/RIGHT to Select | SPACE to Confirm | ESC to Back"
-        inst_surf = self.medium_font.render(inst_text, True, GOTHIC_SILVER)
+        inst_surf = asset_manager.render_text(self.medium_font, inst_text, GOTHIC_SILVER)
         inst_rect = inst_surf.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT - 60))
         self.screen.blit(inst_surf, inst_rect)
 
@@ -555,12 +588,25 @@ class DarkSanctum:
 
         return lines
 
-    def _render_pause(self):
-        """Render enhanced pause overlay with stats (Gothic UI - Sprint 24)"""
-        # Darken screen
+    def _freeze_frame(self):
+        """Snapshot the current gameplay frame with the dark overlay pre-blended"""
+        render_pipeline.flush()  # Threaded rendering: the latest frame may still be drawing
+        frame = self.screen.copy()
         overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
         overlay.fill(OVERLAY_DARK)
-        self.screen.blit(overlay, (0, 0))
+        frame.blit(overlay, (0, 0))
+        self.frozen_frame = frame
+
+    def _draw_frozen_frame(self):
+        """Draw the darkened gameplay snapshot (taken on demand if missing)"""
+        if self.frozen_frame is None:
+            self._freeze_frame()
+        self.screen.blit(self.frozen_frame, (0, 0))
+
+    def _render_pause(self):
+        """Render enhanced pause overlay with stats (Gothic UI - Sprint 24)"""
+        # Darkened snapshot of the last gameplay frame
+        self._draw_frozen_frame()
 
         # Gothic title
         GothicHeader.draw(self.screen, "PAUSED", 80, self.title_font, GOTHIC_GOLD, decoration=True)
@@ -589,7 +635,7 @@ class DarkSanctum:
 
                 # Character info
                 char_name = player.get_component(Player).character_class_name
-                char_text = self.large_font.render(f"⚔️  {char_name}", True, GOTHIC_GOLD)
+                char_text = asset_manager.render_text(self.large_font, f"⚔️  {char_name}", GOTHIC_GOLD)
                 char_rect = char_text.get_rect(center=(WINDOW_WIDTH // 2, panel_y + 50))
                 self.screen.blit(char_text, char_rect)
 
@@ -607,7 +653,7 @@ class DarkSanctum:
                 ]
 
                 for stat in left_stats:
-                    stat_surf = self.medium_font.render(stat, True, GOTHIC_BONE)
+                    stat_surf = asset_manager.render_text(self.medium_font, stat, GOTHIC_BONE)
                     stat_rect = stat_surf.get_rect(midleft=(left_x, stats_y))
                     self.screen.blit(stat_surf, stat_rect)
                     stats_y += 40
@@ -622,7 +668,7 @@ class DarkSanctum:
                 ]
 
                 for stat in right_stats:
-                    stat_surf = self.medium_font.render(stat, True, GOTHIC_BONE)
+                    stat_surf = asset_manager.render_text(self.medium_font, stat, GOTHIC_BONE)
                     stat_rect = stat_surf.get_rect(midleft=(right_x, stats_y))
                     self.screen.blit(stat_surf, stat_rect)
                     stats_y += 40
@@ -638,7 +684,7 @@ class DarkSanctum:
         ]
 
         for i, inst in enumerate(instructions):
-            inst_surf = self.small_font.render(inst, True, GOTHIC_SILVER)
+            inst_surf = asset_manager.render_text(self.small_font, inst, GOTHIC_SILVER)
             inst_rect = inst_surf.get_rect(center=(WINDOW_WIDTH // 2, inst_y + i * 30))
             self.screen.blit(inst_surf, inst_rect)
 
@@ -654,13 +700,13 @@ class DarkSanctum:
 
         # High score indicator
         if self.is_new_high_score:
-            hs_text = self.large_font.render("🏆 NEW HIGH SCORE! 🏆", True, GOTHIC_GOLD)
+            hs_text = asset_manager.render_text(self.large_font, "🏆 NEW HIGH SCORE! 🏆", GOTHIC_GOLD)
             hs_rect = hs_text.get_rect(center=(WINDOW_WIDTH // 2, 120))
             self.screen.blit(hs_text, hs_rect)
 
         # Character info
         char_text = f"{self.selected_class.name}"
-        char_surf = self.medium_font.render(char_text, True, self.selected_class.color)
+        char_surf = asset_manager.render_text(self.medium_font, char_text, self.selected_class.color)
         char_rect = char_surf.get_rect(center=(WINDOW_WIDTH // 2, 165))
         self.screen.blit(char_surf, char_rect)
 
@@ -669,7 +715,7 @@ class DarkSanctum:
         GothicPanel.draw(self.screen, score_panel_rect, GOTHIC_SHADOW, GOTHIC_GOLD, BORDER_ORNATE)
 
         score_text = f"SCORE: {self.final_score:,}"
-        score_surf = self.large_font.render(score_text, True, GOTHIC_GOLD)
+        score_surf = asset_manager.render_text(self.large_font, score_text, GOTHIC_GOLD)
         score_rect = score_surf.get_rect(center=(WINDOW_WIDTH // 2, 235))
         self.screen.blit(score_surf, score_rect)
 
@@ -694,7 +740,7 @@ class DarkSanctum:
             ]
 
             for stat in left_stats:
-                stat_surf = self.small_font.render(stat, True, GOTHIC_BONE)
+                stat_surf = asset_manager.render_text(self.small_font, stat, GOTHIC_BONE)
                 stat_rect = stat_surf.get_rect(midleft=(left_x, stats_y))
                 self.screen.blit(stat_surf, stat_rect)
                 stats_y += 35
@@ -709,7 +755,7 @@ class DarkSanctum:
             ]
 
             for stat in right_stats:
-                stat_surf = self.small_font.render(stat, True, GOTHIC_BONE)
+                stat_surf = asset_manager.render_text(self.small_font, stat, GOTHIC_BONE)
                 stat_rect = stat_surf.get_rect(midleft=(right_x, stats_y))
                 self.screen.blit(stat_surf, stat_rect)
                 stats_y += 35
@@ -718,7 +764,7 @@ class DarkSanctum:
         hs_panel_rect = pygame.Rect(WINDOW_WIDTH // 2 - 300, 440, 600, 200)
         GothicPanel.draw(self.screen, hs_panel_rect, GOTHIC_SHADOW, GLOW_ARCANE, BORDER_MEDIUM)
 
-        hs_title = self.medium_font.render("TOP SCORES", True, GLOW_ARCANE)
+        hs_title = asset_manager.render_text(self.medium_font, "TOP SCORES", GLOW_ARCANE)
         hs_title_rect = hs_title.get_rect(center=(WINDOW_WIDTH // 2, 465))
         self.screen.blit(hs_title, hs_title_rect)
 
@@ -728,7 +774,7 @@ class DarkSanctum:
             rank = i + 1
             score_line = f"{rank}. {entry['character'][:12]:<12} {entry['score']:>6,}  Lv.{entry['level']:<2}  W{entry['wave']:<2}"
             color = GOTHIC_GOLD if rank == 1 else GOTHIC_SILVER
-            score_surf = self.small_font.render(score_line, True, color)
+            score_surf = asset_manager.render_text(self.small_font, score_line, color)
             score_rect = score_surf.get_rect(center=(WINDOW_WIDTH // 2, hs_y))
             self.screen.blit(score_surf, score_rect)
             hs_y += 26
@@ -738,7 +784,7 @@ class DarkSanctum:
         GothicPanel.draw(self.screen, inst_panel_rect, GOTHIC_SHADOW, GOTHIC_PURPLE, BORDER_THIN)
 
         inst_y = WINDOW_HEIGHT - 55
-        inst1 = self.small_font.render("SPACE - Restart  |  ESC - Menu", True, GOTHIC_SILVER)
+        inst1 = asset_manager.render_text(self.small_font, "SPACE - Restart  |  ESC - Menu", GOTHIC_SILVER)
         inst1_rect = inst1.get_rect(center=(WINDOW_WIDTH // 2, inst_y))
         self.screen.blit(inst1, inst1_rect)
 
@@ -755,7 +801,8 @@ class DarkSanctum:
             self.level_up_choices = choice_system.generate_choices(inventory)
             self.selected_choice_index = 0
 
-            # Pause game for level-up
+            # Pause game for level-up (freeze the frame just rendered as backdrop)
+            self._freeze_frame()
             self.state = GameState.LEVEL_UP
 
             # Remove pending component
@@ -813,21 +860,158 @@ class DarkSanctum:
         self.state = GameState.PLAYING
         self.level_up_choices = []
 
+    def _draw_card(self, rect: pygame.Rect, frame: tuple, content_key: tuple, draw_content):
+        """Blit a selection card from cached layers
+
+        The frame is a cached GothicPanel surface, the icon/text layer is drawn once
+        per content_key (card-local coordinates), so changing selection only re-blits
+        """
+        GothicPanel.draw(self.screen, rect, *frame)
+
+        cache_key = ("card_content", rect.size) + content_key
+        content = asset_manager.ui_cache.get(cache_key)
+        if content is None:
+            content = pygame.Surface(rect.size, pygame.SRCALPHA)
+            draw_content(content)
+            asset_manager.ui_cache.put(cache_key, content)
+        self.screen.blit(content, rect)
+
+    def _blit_centered(self, surface: pygame.Surface, text_surf: pygame.Surface, center: tuple):
+        """Blit a surface centered on a point"""
+        surface.blit(text_surf, text_surf.get_rect(center=center))
+
+    def _draw_class_card_content(self, surface: pygame.Surface, char_class, is_selected: bool):
+        """Class card icon/text layer: name, stats and passive description"""
+        cx = surface.get_width() // 2
+
+        # Class name
+        name_color = GOTHIC_BONE if is_selected else GOTHIC_SILVER
+        self._blit_centered(surface, asset_manager.render_text(self.large_font, char_class.name, name_color), (cx, 40))
+
+        # Stats
+        stats = [
+            f"HP: {int(char_class.health)}",
+            f"DMG: {int(char_class.damage)}",
+            f"SPD: {int(char_class.speed)}",
+            "",
+            f"{char_class.passive_name}",
+        ]
+
+        stat_y = 100
+        for stat in stats:
+            color = GOTHIC_GOLD if stat == char_class.passive_name else GOTHIC_BONE
+            self._blit_centered(surface, asset_manager.render_text(self.small_font, stat, color), (cx, stat_y))
+            stat_y += 30
+
+        # Description (small font)
+        desc_y = stat_y + 10
+        for line in self._wrap_text(char_class.passive_description, 35):
+            self._blit_centered(surface, asset_manager.render_text(self.small_font, line, GOTHIC_MIST), (cx, desc_y))
+            desc_y += 25
+
+    def _draw_evolution_card_content(self, surface: pygame.Surface, choice: dict, evolved_weapon):
+        """Evolution card icon/text layer"""
+        evolution_data = choice['evolution_data']
+        cx = surface.get_width() // 2
+
+        # EVOLUTION banner
+        self._blit_centered(surface, asset_manager.render_text(self.medium_font, "⚡ EVOLUTION ⚡", (255, 215, 0)), (cx, 30))
+
+        # Evolved icon (Sprint 28: Pixel art sprite)
+        # Scale up 2x for better visibility (32x32 → 64x64)
+        scaled_icon = asset_manager.get_scaled_sprite(f'weapon_{choice["weapon_id"]}', 2.0)
+        if scaled_icon:
+            self._blit_centered(surface, scaled_icon, (cx, 80))
+        else:
+            # Fallback: emoji (if sprite not found)
+            self._blit_centered(surface, asset_manager.render_text(self.title_font, evolution_data.evolved_icon, GOTHIC_BONE), (cx, 80))
+
+        # Evolved name
+        self._blit_centered(surface, asset_manager.render_text(self.medium_font, evolution_data.evolved_name, GOTHIC_GOLD), (cx, 130))
+
+        # Stats preview
+        damage = evolved_weapon.damage_per_level[0]
+        cooldown = evolved_weapon.cooldown_per_level[0]
+
+        stats_text = [
+            f"Damage: {int(damage)}",
+            f"Cooldown: {cooldown:.1f}s",
+        ]
+
+        stat_y = 170
+        for stat in stats_text:
+            self._blit_centered(surface, asset_manager.render_text(self.small_font, stat, (255, 215, 0)), (cx, stat_y))
+            stat_y += 25
+
+        # Description
+        desc_y = stat_y + 10
+        for line in self._wrap_text(evolution_data.evolved_description, 28):
+            self._blit_centered(surface, asset_manager.render_text(self.small_font, line, (220, 220, 220)), (cx, desc_y))
+            desc_y += 20
+
+    def _draw_weapon_card_content(self, surface: pygame.Surface, choice: dict, is_selected: bool):
+        """Regular weapon card icon/text layer"""
+        weapon_data = choice['weapon_data']
+        current_level = choice['current_level']
+        next_level = choice['next_level']
+        cx = surface.get_width() // 2
+
+        # Weapon icon (Sprint 28: Pixel art sprite instead of emoji)
+        # Scale up 2x for better visibility (32x32 → 64x64)
+        scaled_icon = asset_manager.get_scaled_sprite(f'weapon_{choice["weapon_id"]}', 2.0)
+        if scaled_icon:
+            self._blit_centered(surface, scaled_icon, (cx, 60))
+        else:
+            # Fallback: emoji (if sprite not found)
+            self._blit_centered(surface, asset_manager.render_text(self.title_font, weapon_data.icon, GOTHIC_BONE), (cx, 60))
+            # Debug: print warning once per card layer (Sprint 29)
+            print(f"⚠️ Weapon icon NOT FOUND: {choice['weapon_id']}, using emoji fallback")
+
+        # Weapon name
+        name_color = GOTHIC_BONE if is_selected else GOTHIC_SILVER
+        self._blit_centered(surface, asset_manager.render_text(self.medium_font, weapon_data.name, name_color), (cx, 120))
+
+        # Level indicator
+        if choice['is_new']:
+            level_text = "NEW!"
+            level_color = GOTHIC_GOLD
+        else:
+            level_text = f"Lv {current_level} → {next_level}"
+            level_color = GLOW_ARCANE
+
+        self._blit_centered(surface, asset_manager.render_text(self.small_font, level_text, level_color), (cx, 155))
+
+        # Stats
+        level_idx = next_level - 1
+        damage = weapon_data.damage_per_level[level_idx]
+        cooldown = weapon_data.cooldown_per_level[level_idx]
+
+        stats_text = [
+            f"Damage: {int(damage)}",
+            f"Cooldown: {cooldown:.1f}s",
+        ]
+
+        stat_y = 190
+        for stat in stats_text:
+            self._blit_centered(surface, asset_manager.render_text(self.small_font, stat, GOTHIC_BONE), (cx, stat_y))
+            stat_y += 25
+
+        # Description
+        desc_y = stat_y + 10
+        for line in self._wrap_text(weapon_data.description, 28):
+            self._blit_centered(surface, asset_manager.render_text(self.small_font, line, GOTHIC_MIST), (cx, desc_y))
+            desc_y += 20
+
     def _render_level_up(self):
         """Render level-up weapon selection screen with Gothic UI (Sprint 24)"""
-        # Render game in background (paused)
-        self.world.update(0)
-
-        # Gothic dark overlay
-        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
-        overlay.fill(OVERLAY_DARK)
-        self.screen.blit(overlay, (0, 0))
+        # Game in background (paused): darkened snapshot, no world update
+        self._draw_frozen_frame()
 
         # Gothic title
         GothicHeader.draw(self.screen, "LEVEL UP!", 60, self.large_font, GOTHIC_GOLD, decoration=True)
 
         # Instructions (Sprint 28: Replace arrow emojis with text)
-        inst = self.small_font.render("LEFT/RIGHT to Select | SPACE to Choose", True, GOTHIC_SILVER)
+        inst = asset_manager.render_text(self.small_font, "LEFT/RIGHT to Select | SPACE to Choose", GOTHIC_SILVER)
         inst_rect = inst.get_rect(center=(WINDOW_WIDTH // 2, 115))
         self.screen.blit(inst, inst_rect)
 
@@ -849,6 +1033,8 @@ class DarkSanctum:
             # Check if this is an evolution choice
             is_evolution = choice.get('is_evolution', False)
 
+            card_rect = pygame.Rect(x, start_y, card_width, card_height)
+
             if is_evolution:
                 # Evolution card rendering
                 evolution_data = choice['evolution_data']
@@ -860,134 +1046,23 @@ class DarkSanctum:
                 border_color = GOTHIC_GOLD if is_selected else (200, 150, 50)  # Golden
                 border_width = BORDER_ORNATE if is_selected else BORDER_THICK
 
-                card_rect = pygame.Rect(x, start_y, card_width, card_height)
-                GothicPanel.draw(self.screen, card_rect, card_color, border_color, border_width)
-
-                # EVOLUTION banner
-                evo_banner = self.medium_font.render("⚡ EVOLUTION ⚡", True, (255, 215, 0))
-                evo_rect = evo_banner.get_rect(center=(x + card_width // 2, start_y + 30))
-                self.screen.blit(evo_banner, evo_rect)
-
-                # Evolved icon (Sprint 28: Pixel art sprite)
-                from src.core.asset_manager import asset_manager
-                weapon_icon = asset_manager.get_sprite(f'weapon_{choice["weapon_id"]}')
-                if weapon_icon:
-                    # Scale up 2x for better visibility (32x32 → 64x64)
-                    scaled_icon = pygame.transform.scale(weapon_icon, (64, 64))
-                    icon_rect = scaled_icon.get_rect(center=(x + card_width // 2, start_y + 80))
-                    self.screen.blit(scaled_icon, icon_rect)
-                else:
-                    # Fallback: emoji (if sprite not found)
-                    icon_surf = self.title_font.render(evolution_data.evolved_icon, True, GOTHIC_BONE)
-                    icon_rect = icon_surf.get_rect(center=(x + card_width // 2, start_y + 80))
-                    self.screen.blit(icon_surf, icon_rect)
-
-                # Evolved name
-                name_surf = self.medium_font.render(evolution_data.evolved_name, True, GOTHIC_GOLD)
-                name_rect = name_surf.get_rect(center=(x + card_width // 2, start_y + 130))
-                self.screen.blit(name_surf, name_rect)
-
-                # Stats preview
-                damage = evolved_weapon.damage_per_level[0]
-                cooldown = evolved_weapon.cooldown_per_level[0]
-
-                stats_text = [
-                    f"Damage: {int(damage)}",
-                    f"Cooldown: {cooldown:.1f}s",
-                ]
-
-                stat_y = start_y + 170
-                for stat in stats_text:
-                    stat_surf = self.small_font.render(stat, True, (255, 215, 0))
-                    stat_rect = stat_surf.get_rect(center=(x + card_width // 2, stat_y))
-                    self.screen.blit(stat_surf, stat_rect)
-                    stat_y += 25
-
-                # Description
-                desc_lines = self._wrap_text(evolution_data.evolved_description, 28)
-                desc_y = stat_y + 10
-                for line in desc_lines:
-                    desc_surf = self.small_font.render(line, True, (220, 220, 220))
-                    desc_rect = desc_surf.get_rect(center=(x + card_width // 2, desc_y))
-                    self.screen.blit(desc_surf, desc_rect)
-                    desc_y += 20
+                self._draw_card(card_rect, (card_color, border_color, border_width),
+                                ("evolution", choice['weapon_id'], evolution_data.evolved_id),
+                                lambda surf, ch=choice, w=evolved_weapon: self._draw_evolution_card_content(surf, ch, w))
 
             else:
                 # Regular weapon card with Gothic UI
                 weapon_data = choice['weapon_data']
-                current_level = choice['current_level']
-                next_level = choice['next_level']
-                is_new = choice['is_new']
 
                 # Gothic card background
                 card_color = weapon_data.color if is_selected else GOTHIC_SHADOW
                 border_color = GOTHIC_GOLD if is_selected else GOTHIC_PURPLE
                 border_width = BORDER_THICK if is_selected else BORDER_MEDIUM
 
-                card_rect = pygame.Rect(x, start_y, card_width, card_height)
-                GothicPanel.draw(self.screen, card_rect, card_color, border_color, border_width)
-
-                # Weapon icon (Sprint 28: Pixel art sprite instead of emoji)
-                from src.core.asset_manager import asset_manager
-                weapon_icon = asset_manager.get_sprite(f'weapon_{choice["weapon_id"]}')
-                if weapon_icon:
-                    # Scale up 2x for better visibility (32x32 → 64x64)
-                    scaled_icon = pygame.transform.scale(weapon_icon, (64, 64))
-                    icon_rect = scaled_icon.get_rect(center=(x + card_width // 2, start_y + 60))
-                    self.screen.blit(scaled_icon, icon_rect)
-                    # Debug: print to console (Sprint 29)
-                    print(f"✅ Rendered weapon icon: {choice['weapon_id']} at ({icon_rect.centerx}, {icon_rect.centery})")
-                else:
-                    # Fallback: emoji (if sprite not found)
-                    icon_surf = self.title_font.render(weapon_data.icon, True, GOTHIC_BONE)
-                    icon_rect = icon_surf.get_rect(center=(x + card_width // 2, start_y + 60))
-                    self.screen.blit(icon_surf, icon_rect)
-                    # Debug: print warning (Sprint 29)
-                    print(f"⚠️ Weapon icon NOT FOUND: {choice['weapon_id']}, using emoji fallback")
-
-                # Weapon name
-                name_color = GOTHIC_BONE if is_selected else GOTHIC_SILVER
-                name_surf = self.medium_font.render(weapon_data.name, True, name_color)
-                name_rect = name_surf.get_rect(center=(x + card_width // 2, start_y + 120))
-                self.screen.blit(name_surf, name_rect)
-
-                # Level indicator
-                if is_new:
-                    level_text = "NEW!"
-                    level_color = GOTHIC_GOLD
-                else:
-                    level_text = f"Lv {current_level} → {next_level}"
-                    level_color = GLOW_ARCANE
-
-                level_surf = self.small_font.render(level_text, True, level_color)
-                level_rect = level_surf.get_rect(center=(x + card_width // 2, start_y + 155))
-                self.screen.blit(level_surf, level_rect)
-
-                # Stats
-                level_idx = next_level - 1
-                damage = weapon_data.damage_per_level[level_idx]
-                cooldown = weapon_data.cooldown_per_level[level_idx]
-
-                stats_text = [
-                    f"Damage: {int(damage)}",
-                    f"Cooldown: {cooldown:.1f}s",
-                ]
-
-                stat_y = start_y + 190
-                for stat in stats_text:
-                    stat_surf = self.small_font.render(stat, True, GOTHIC_BONE)
-                    stat_rect = stat_surf.get_rect(center=(x + card_width // 2, stat_y))
-                    self.screen.blit(stat_surf, stat_rect)
-                    stat_y += 25
-
-                # Description
-                desc_lines = self._wrap_text(weapon_data.description, 28)
-                desc_y = stat_y + 10
-                for line in desc_lines:
-                    desc_surf = self.small_font.render(line, True, GOTHIC_MIST)
-                    desc_rect = desc_surf.get_rect(center=(x + card_width // 2, desc_y))
-                    self.screen.blit(desc_surf, desc_rect)
-                    desc_y += 20
+                content_key = ("weapon", choice['weapon_id'], choice['current_level'],
+                               choice['next_level'], choice['is_new'], is_selected)
+                self._draw_card(card_rect, (card_color, border_color, border_width), content_key,
+                                lambda surf, ch=choice, sel=is_selected: self._draw_weapon_card_content(surf, ch, sel))
 
         # Sprint 28: Visual arrow indicators (pixel art triangles)
         arrow_y = start_y + card_height // 2
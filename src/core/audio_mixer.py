@@ -0,0 +1,83 @@
+"""
+DARK SANCTUM - Audio Mixer
+Matrix Team: Audio Director + Technical Director
+
+Pooled mixer channels with per-sound voice caps and reserved channels
+"""
+
+import math
+from typing import List, Optional, Sequence
+
+import pygame
+
+
+class AudioMixer:
+    """
+    Fixed set of pygame.mixer.Channel objects, created once
+    - The first `reserved` channels only play priority sounds (boss spawn, level up),
+      so a wall of hit sounds can never block them
+    - Every sound name has at most `voices_per_sound` voices at once
+    - When every pooled channel is busy the oldest voice is stolen
+    Volume is set per channel, the shared Sound objects are never touched.
+    """
+
+    def __init__(self, channels: int = 16, reserved: int = 2, voices_per_sound: int = 3,
+                 priority_sounds: Sequence[str] = ()):
+        self.voices_per_sound = voices_per_sound
+        self.priority_sounds = frozenset(priority_sounds)
+        self.play_serial = 0  # Increases on every play, for stealing the oldest voice
+
+        reserved = max(0, min(reserved, channels - 1))
+        pygame.mixer.set_num_channels(channels)
+        pygame.mixer.set_reserved(reserved)  # Keep Sound.play() elsewhere off these too
+
+        self.channels: List[pygame.mixer.Channel] = [pygame.mixer.Channel(i) for i in range(channels)]
+        self.reserved = range(reserved)
+        self.pooled = range(reserved, channels)
+
+        # Per channel: sound name playing on it and its play serial
+        self.playing: List[Optional[str]] = [None] * channels
+        self.started: List[int] = [0] * channels
+
+    def voices(self, name: str) -> List[int]:
+        """Channels still playing a sound name"""
+        return [i for i, playing in enumerate(self.playing)
+                if playing == name and self.channels[i].get_busy()]
+
+    def play(self, name: str, sound: pygame.mixer.Sound, volume: float) -> bool:
+        """Start one voice of a sound (False when its voice cap is reached)"""
+        self.play_serial += 1
+        priority = name in self.priority_sounds
+        if not priority and len(self.voices(name)) >= self.voices_per_sound:
+            return False
+
+        index = self._free_channel(self.reserved if priority and self.reserved else self.pooled)
+        channel = self.channels[index]
+        channel.play(sound)
+        channel.set_volume(max(0.0, min(1.0, volume)))  # After play: playing resets the channel volume
+        self.playing[index] = name
+        self.started[index] = self.play_serial
+        return True
+
+    def _free_channel(self, indices: range) -> int:
+        """An idle channel from indices, else the one whose voice started first"""
+        for i in indices:
+            if not self.channels[i].get_busy():
+                return i
+        return min(indices, key=lambda i: self.started[i])
+
+    def stop(self):
+        """Silence every channel"""
+        for channel in self.channels:
+            channel.stop()
+        self.playing = [None] * len(self.channels)
+
+    @staticmethod
+    def escalate(volume: float, count: int, step: float) -> float:
+        """Volume for count copies of a sound merged into one voice (+step per doubling)"""
+        return volume * (1.0 + step * math.log2(max(1, count)))
+
+
+# === TECHNICAL DIRECTOR NOTE ===
+# No Sound.play(): that grabs any free channel and silently fails when all are busy
+# One play per sound per frame (AudioSystem merges events first), so the mixer stays cheap
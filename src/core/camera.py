@@ -0,0 +1,43 @@
+"""
+DARK SANCTUM - Camera
+Matrix Team: Technical Director + Developer
+
+World view resource: position, screen shake and zoom
+"""
+
+from typing import Tuple
+from config.settings import WINDOW_WIDTH, WINDOW_HEIGHT, WORLD_WIDTH, WORLD_HEIGHT
+
+
+class Camera:
+    """
+    The window's view of the world (registered with World.add_resource)
+    - x, y: world position of the view's top-left corner
+    - shake: screen-space offset applied once to the finished world image
+    - zoom: reserved for scaled views (the render path assumes 1.0)
+    """
+
+    def __init__(self):
+        self.x = 0.0
+        self.y = 0.0
+        self.shake: Tuple[int, int] = (0, 0)
+        self.zoom = 1.0
+
+    def center_on(self, x: float, y: float):
+        """Center the view on a world point (stops at the world edges)"""
+        self.x = max(0.0, min(WORLD_WIDTH - WINDOW_WIDTH, x - WINDOW_WIDTH / 2))
+        self.y = max(0.0, min(WORLD_HEIGHT - WINDOW_HEIGHT, y - WINDOW_HEIGHT / 2))
+
+    def get_offset(self) -> Tuple[int, int]:
+        """World -> screen translation (whole pixels, so the tiled background never shimmers)"""
+        return (-int(self.x), -int(self.y))
+
+    def get_transform(self) -> Tuple[int, int, int, int]:
+        """Everything that moves the picture: (offset x, offset y, shake x, shake y)"""
+        offset_x, offset_y = self.get_offset()
+        return (offset_x, offset_y, self.shake[0], self.shake[1])
+
+
+# === TECHNICAL DIRECTOR NOTE ===
+# Draw code adds get_offset() once per sprite; shake never touches per-entity positions:
+# the render stage scrolls the finished world image by camera.shake before the HUD
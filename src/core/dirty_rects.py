@@ -0,0 +1,81 @@
+"""
+DARK SANCTUM - Dirty Rect Presenter
+Matrix Team: Technical Director + Developer
+
+Optional partial screen updates for software rendering on low-end machines
+"""
+
+import pygame
+from typing import List
+from config.settings import (
+    WINDOW_WIDTH, WINDOW_HEIGHT, DIRTY_RECT_RENDERING, DIRTY_RECT_MAX_COVERAGE
+)
+
+
+class DirtyRectPresenter:
+    """
+    Tracks screen regions touched this frame
+    - Background is restored only under last frame's rects (erases old sprites)
+    - Display is updated with last frame's + this frame's rects
+    - Falls back to a full flip after invalidate() or when the dirty area is too large
+    """
+
+    def __init__(self, enabled: bool = DIRTY_RECT_RENDERING,
+                 max_coverage: float = DIRTY_RECT_MAX_COVERAGE):
+        self.enabled = enabled
+        self.max_area = WINDOW_WIDTH * WINDOW_HEIGHT * max_coverage
+
+        self.rects: List[pygame.Rect] = []      # Touched this frame
+        self.previous: List[pygame.Rect] = []   # Touched last frame
+        self.full_redraw = True
+
+    def mark(self, rect: pygame.Rect):
+        """Record a region drawn this frame"""
+        if self.enabled:
+            self.rects.append(rect)
+
+    def mark_many(self, rects: List[pygame.Rect]):
+        """Record several regions drawn this frame"""
+        if self.enabled:
+            self.rects.extend(rects)
+
+    def invalidate(self):
+        """Repaint and present the whole screen this frame"""
+        self.full_redraw = True
+
+    def restore_background(self, screen: pygame.Surface, background: pygame.Surface):
+        """Draw the background, only under last frame's dirty rects when possible"""
+        if not self.enabled or self.full_redraw:
+            screen.blit(background, (0, 0))
+            return
+
+        for rect in self.previous:
+            screen.blit(background, rect, rect)
+
+    def present(self):
+        """Show this frame (partial update or full flip) and start the next one"""
+        if not self.enabled:
+            pygame.display.flip()
+            return
+
+        update_rects = self.previous + self.rects
+        dirty_area = sum(rect.width * rect.height for rect in update_rects)
+
+        if self.full_redraw or dirty_area > self.max_area:
+            pygame.display.flip()
+        elif update_rects:
+            pygame.display.update(update_rects)
+
+        self.previous = self.rects
+        self.rects = []
+        self.full_redraw = False
+
+
+# Singleton instance
+dirty_rects = DirtyRectPresenter()
+
+
+# === TECHNICAL DIRECTOR NOTE ===
+# Relies on the display surface keeping its pixels between frames (software display)
+# Anything drawn to the screen during PLAYING must be marked, or it will leave trails
+# Menus repaint only when their state changes, then present with one full flip
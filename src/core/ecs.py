@@ -75,6 +75,16 @@ class World:
     def __init__(self):
         self.entities: Dict[str, Entity] = {}
         self.systems: List[System] = []
+        self.resources: Dict[type, Any] = {}  # World-wide singletons (camera, budget, pools), one per type
+
+    def add_resource(self, resource: Any) -> Any:
+        """Register a world-wide resource under its type"""
+        self.resources[type(resource)] = resource
+        return resource
+
+    def get_resource(self, resource_type: type) -> Any:
+        """Resource of a type, or None"""
+        return self.resources.get(resource_type)
 
     def create_entity(self) -> Entity:
         """Create a new entity"""
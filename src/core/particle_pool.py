@@ -0,0 +1,101 @@
+"""
+DARK SANCTUM - Particle Pool
+Matrix Team: Technical Director + Developer
+
+Preallocated NumPy particle storage with a ring allocator
+"""
+
+import math
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+class ParticlePool:
+    """
+    Fixed-capacity particle arrays (position, velocity, life, style)
+    Emits write the next slots of a ring; when it is full the oldest particles
+    are overwritten, so emitting never allocates and never fails.
+    Styles are (color, radius) pairs, stored once and referenced by index.
+    """
+
+    def __init__(self, capacity: int = 4096, damping: float = 0.98):
+        self.capacity = capacity
+        self.damping = damping  # Velocity kept per update (per frame, like the old entity particles)
+
+        self.pos = np.zeros((capacity, 2), dtype=np.float32)
+        self.vel = np.zeros((capacity, 2), dtype=np.float32)
+        self.life = np.zeros(capacity, dtype=np.float32)  # Seconds left, <= 0 is free
+        self.style = np.zeros(capacity, dtype=np.int32)
+
+        self.head = 0  # Next ring slot
+        self.styles: List[Tuple[tuple, int]] = []
+        self.style_ids: Dict[Tuple[tuple, int], int] = {}
+        self.rng = np.random.default_rng()
+
+    def __len__(self) -> int:
+        """Live particles"""
+        return int(np.count_nonzero(self.life > 0))
+
+    def style_id(self, color: tuple, radius: int) -> int:
+        """Index of a (color, radius) style, registered on first use"""
+        key = (tuple(color[:3]), radius)
+        style = self.style_ids.get(key)
+        if style is None:
+            style = len(self.styles)
+            self.styles.append(key)
+            self.style_ids[key] = style
+        return style
+
+    def emit(self, x: float, y: float, count: int, color: tuple, radius: int,
+             speed: Tuple[float, float], lifetime: Tuple[float, float],
+             angle: Tuple[float, float] = (0.0, 2 * math.pi), radius_max: Optional[int] = None):
+        """Burst of count particles from (x, y): uniform angle, speed and lifetime ranges"""
+        count = min(int(count), self.capacity)
+        if count <= 0:
+            return
+
+        slots = (self.head + np.arange(count)) % self.capacity
+        self.head = (self.head + count) % self.capacity
+
+        # Ranges may come reversed (random.uniform accepted that)
+        rng = self.rng
+        angles = rng.uniform(*sorted(angle), count)
+        speeds = rng.uniform(*sorted(speed), count)
+
+        self.pos[slots] = (x, y)
+        self.vel[slots, 0] = np.cos(angles) * speeds
+        self.vel[slots, 1] = np.sin(angles) * speeds
+        self.life[slots] = rng.uniform(*sorted(lifetime), count)
+
+        if radius_max is None:
+            self.style[slots] = self.style_id(color, radius)
+        else:
+            # Mixed sizes: one style per radius
+            ids = np.array([self.style_id(color, r) for r in range(radius, radius_max + 1)])
+            self.style[slots] = ids[rng.integers(0, len(ids), count)]
+
+    def update(self, dt: float):
+        """Age, move and damp every particle (expired ones stay free in place)"""
+        self.life -= dt
+        alive = self.life > 0
+        self.pos[alive] += self.vel[alive] * dt
+        self.vel[alive] *= self.damping
+
+    def visible(self, left: float, top: float, right: float, bottom: float) -> Tuple[np.ndarray, np.ndarray, int]:
+        """Live particles inside a world rect: (positions, style ids, culled count)"""
+        alive = self.life > 0
+        x = self.pos[:, 0]
+        y = self.pos[:, 1]
+        inside = alive & (x >= left) & (x <= right) & (y >= top) & (y <= bottom)
+        return self.pos[inside], self.style[inside], int(np.count_nonzero(alive)) - int(np.count_nonzero(inside))
+
+    def clear(self):
+        """Free every particle"""
+        self.life[:] = 0
+        self.head = 0
+
+
+# === TECHNICAL DIRECTOR NOTE ===
+# No per-particle objects: one emit is a handful of array writes, one update is three vector ops
+# Capacity is a hard cap (MAX_PARTICLES); a full ring recycles the oldest particles first
@@ -0,0 +1,43 @@
+"""
+DARK SANCTUM - Frame Profiler
+Matrix Team: Technical Director + QA Tester
+
+Lightweight per-frame counters for the debug overlay
+"""
+
+from typing import Dict
+
+
+class FrameProfiler:
+    """
+    Named counters that reset every frame
+    Systems add to the current frame, the overlay reads the last complete one
+    """
+
+    def __init__(self):
+        self.counters: Dict[str, int] = {}
+        self.last: Dict[str, int] = {}
+        self.frame = 0
+
+    def begin_frame(self):
+        """Close the previous frame and start counting a new one"""
+        self.last = self.counters
+        self.counters = {}
+        self.frame += 1
+
+    def count(self, name: str, amount: int = 1):
+        """Add to a counter for the current frame"""
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def get(self, name: str) -> int:
+        """Counter value from the last complete frame"""
+        return self.last.get(name, 0)
+
+
+# Singleton instance
+profiler = FrameProfiler()
+
+
+# === QA TESTER NOTE ===
+# Counters are cheap dict increments, safe to leave on in release builds
+# Shown next to the FPS counter when DEBUG_MODE is on
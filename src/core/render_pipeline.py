@@ -0,0 +1,225 @@
+"""
+DARK SANCTUM - Render Pipeline
+Matrix Team: Technical Director + Developer
+
+Per-frame render command lists, drawn inline or on a worker thread
+"""
+
+import threading
+from typing import Callable, List, NamedTuple, Optional, Tuple
+
+import pygame
+from config.settings import THREADED_RENDERING, RENDER_SCALE, UPSCALE_FILTER
+from src.core.dirty_rects import dirty_rects
+
+
+class RenderFrame(NamedTuple):
+    """
+    One frame of render commands, owned by the render stage once submitted
+    - steps: zero-argument draw callables run first (backgrounds, ambient effects)
+    - layers: back-to-front lists of Surface.blits items (surface, dest[, area[, flags]])
+    - world: low-resolution target for layers[:world_layers], upscaled onto target
+      before the remaining (native resolution) layers; None draws everything on target
+    - shake: screen shake, applied by scrolling the target once steps and
+      layers[:shake_layers] are drawn (later layers stay put)
+    - backdrop: fill(target, rects, shake) redraws the background into the bands
+      the scroll exposes (otherwise they keep the pixels scrolled away from)
+    """
+    target: pygame.Surface
+    steps: List[Callable[[], None]]
+    layers: List[list]
+    world: Optional[pygame.Surface] = None
+    world_layers: int = 0
+    shake: Tuple[int, int] = (0, 0)
+    shake_layers: int = 0
+    backdrop: Optional[Callable[[pygame.Surface, List[pygame.Rect], Tuple[int, int]], None]] = None
+
+
+class RenderPipeline:
+    """
+    Render stage fed by the simulation
+    Inline mode draws each frame as soon as it is submitted (main loop presents).
+    Threaded mode draws frame N on a worker while the simulation builds frame N+1;
+    frame N is presented on the main thread when N+1 is submitted (one frame latency).
+    The producer double-buffers its command lists, so it never touches a frame in flight.
+    """
+
+    def __init__(self, threaded: bool = THREADED_RENDERING):
+        self.threaded = threaded
+        self.pending_steps: List[Callable[[], None]] = []
+        self.pending_backdrop: Optional[Callable] = None
+
+        # Worker state (guarded by self.condition)
+        self.condition = threading.Condition()
+        self.frame: Optional[RenderFrame] = None   # Handed to the worker, not started
+        self.busy = False                          # Worker is drawing a frame
+        self.unpresented = False                   # Drawn frame waiting for present()
+        self.error: Optional[BaseException] = None
+        self.worker: Optional[threading.Thread] = None
+
+        # Integer-upscale buffer, when N x the world target overshoots the window
+        self.upscaled: Optional[pygame.Surface] = None
+
+    def draw(self, step: Callable[[], None]):
+        """Run a screen-drawing step now, or queue it ahead of this frame's layers when threaded"""
+        if self.threaded:
+            self.pending_steps.append(step)
+        else:
+            step()
+
+    def backdrop(self, fill: Callable[[pygame.Surface, List[pygame.Rect], Tuple[int, int]], None]):
+        """Register this frame's shake-band fill (the background drawer, with its frame state bound)"""
+        self.pending_backdrop = fill
+
+    def submit(self, target: pygame.Surface, layers: List[list],
+               world: Optional[pygame.Surface] = None, world_layers: int = 0,
+               shake: Tuple[int, int] = (0, 0), shake_layers: int = 0):
+        """Hand this frame's command lists to the render stage"""
+        steps, self.pending_steps = self.pending_steps, []
+        backdrop, self.pending_backdrop = self.pending_backdrop, None
+        frame = RenderFrame(target, steps, layers, world, world_layers, tuple(shake), shake_layers, backdrop)
+
+        if not self.threaded:
+            self._draw_frame(frame)
+            return
+
+        self._ensure_worker()
+        redraw = dirty_rects.full_redraw  # Requested while building this frame
+        self.flush()  # Previous frame: wait, then show it
+        if redraw:
+            dirty_rects.invalidate()
+        with self.condition:
+            self.frame = frame
+            self.busy = True
+            self.condition.notify_all()
+
+    def flush(self):
+        """Wait for the frame in flight and present it (before touching the screen directly)"""
+        if not self.threaded:
+            return
+
+        with self.condition:
+            while self.busy:
+                self.condition.wait()
+            error, self.error = self.error, None
+            unpresented, self.unpresented = self.unpresented, False
+
+        if error is not None:
+            raise error
+        if unpresented:
+            dirty_rects.present()
+
+    def present(self):
+        """End of main loop iteration: show the frame unless one is still in flight"""
+        if self.threaded and (self.busy or self.unpresented):
+            return  # Presented by the next submit() or flush()
+        dirty_rects.present()
+
+    def _ensure_worker(self):
+        """Start the render thread on first threaded submit"""
+        if self.worker is None:
+            self.worker = threading.Thread(target=self._worker_loop, name="render", daemon=True)
+            self.worker.start()
+
+    def _worker_loop(self):
+        """Draw frames as they arrive"""
+        while True:
+            with self.condition:
+                while self.frame is None:
+                    self.condition.wait()
+                frame, self.frame = self.frame, None
+
+            error = None
+            try:
+                self._draw_frame(frame)
+            except BaseException as exc:  # Re-raised on the main thread
+                error = exc
+
+            with self.condition:
+                self.busy = False
+                self.unpresented = True
+                self.error = error
+                self.condition.notify_all()
+
+    def _draw_frame(self, frame: RenderFrame):
+        """Run steps, then one batched blit per layer (recording dirty rects)"""
+        for step in frame.steps:
+            step()
+
+        layers = frame.layers
+        first = 0
+        if frame.world is not None:
+            # Low-resolution world pass, one upscale, then native layers on top
+            for layer in layers[:frame.world_layers]:
+                if layer:
+                    frame.world.blits(layer, doreturn=False)
+            self._upscale(frame.world, frame.target)
+            first = frame.world_layers
+
+        # Shake: scroll the finished world image once (no per-sprite offsets)
+        shake = frame.shake if frame.shake != (0, 0) else None
+
+        blits = frame.target.blits
+        track = dirty_rects.enabled
+        for index in range(first, len(layers)):
+            if shake and index == frame.shake_layers:
+                self._shake(frame)
+                shake = None
+            layer = layers[index]
+            if layer:
+                rects = blits(layer, doreturn=track)
+                if track:
+                    dirty_rects.mark_many(rects)
+
+        if shake:
+            self._shake(frame)
+
+    @staticmethod
+    def _shake(frame: RenderFrame):
+        """Scroll the target by the shake and refill the exposed edge bands"""
+        target = frame.target
+        shake_x, shake_y = frame.shake
+        target.scroll(shake_x, shake_y)
+
+        width, height = target.get_size()
+        bands = []
+        if shake_x:
+            bands.append(pygame.Rect(0 if shake_x > 0 else width + shake_x, 0, abs(shake_x), height))
+        if shake_y:
+            bands.append(pygame.Rect(0, 0 if shake_y > 0 else height + shake_y, width, abs(shake_y)))
+
+        for band in bands:
+            target.fill((0, 0, 0), band)
+        if frame.backdrop is not None:
+            frame.backdrop(target, bands, frame.shake)
+
+    def _upscale(self, world: pygame.Surface, target: pygame.Surface):
+        """Integer-upscale the world target to the window (nearest or scale2x)"""
+        size = (world.get_width() * RENDER_SCALE, world.get_height() * RENDER_SCALE)
+        exact = size == target.get_size()
+        if not exact and (self.upscaled is None or self.upscaled.get_size() != size):
+            self.upscaled = pygame.Surface(size, 0, target)
+        dest = target if exact else self.upscaled
+
+        if UPSCALE_FILTER == "scale2x" and RENDER_SCALE == 2:
+            pygame.transform.scale2x(world, dest)
+        else:
+            pygame.transform.scale(world, size, dest)
+
+        if not exact:
+            target.blit(dest, (0, 0))
+
+
+# Singleton instance
+render_pipeline = RenderPipeline()
+
+
+# === TECHNICAL DIRECTOR NOTE ===
+# Threaded mode rules:
+# - Only the render stage draws on the screen during PLAYING; early drawers go through draw()
+# - Commands reference surfaces, never mutable Rects the simulation reuses
+# - flush() before reading or drawing the screen from the main thread (pause snapshot, menus)
+# - SDL display calls (present) stay on the main thread
+# Low-resolution mode: sprites/background at 1/RENDER_SCALE, health bars, numbers and HUD native
+# Screen shake is one Surface.scroll of the target before the HUD layer (frames with shake flip fully);
+# the background registers a backdrop() to redraw the exposed edge bands (sprites there are skipped)
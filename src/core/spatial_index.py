@@ -0,0 +1,197 @@
+"""
+DARK SANCTUM - Spatial Index
+Matrix Team: Technical Director + Developer
+
+Uniform grid over entity positions for radius and nearest-neighbor queries
+"""
+
+import heapq
+import math
+from typing import Dict, List, Optional, Tuple
+
+
+class SpatialHash:
+    """
+    Uniform grid spatial index
+    Entities are stored in slots (0..n-1) so callers can track
+    sets of entities as integer bitsets (bit i = slot i)
+    """
+
+    def __init__(self, cell_size: float = 128):
+        self.cell_size = cell_size
+        self.cells: Dict[Tuple[int, int], List[int]] = {}
+        self.entities: list = []
+        self.xs: List[float] = []
+        self.ys: List[float] = []
+
+        # Occupied cell bounds (limits ring search)
+        self.min_cx = self.max_cx = 0
+        self.min_cy = self.max_cy = 0
+
+    def __len__(self) -> int:
+        return len(self.entities)
+
+    def clear(self):
+        """Remove all entries"""
+        self.cells.clear()
+        self.entities.clear()
+        self.xs.clear()
+        self.ys.clear()
+
+    def cell_of(self, x: float, y: float) -> Tuple[int, int]:
+        """Grid cell containing a point"""
+        return (int(math.floor(x / self.cell_size)), int(math.floor(y / self.cell_size)))
+
+    def insert(self, entity, x: float, y: float) -> int:
+        """Add an entity at (x, y), return its slot"""
+        slot = len(self.entities)
+        self.entities.append(entity)
+        self.xs.append(x)
+        self.ys.append(y)
+
+        cell = self.cell_of(x, y)
+        bucket = self.cells.get(cell)
+        if bucket is None:
+            self.cells[cell] = [slot]
+        else:
+            bucket.append(slot)
+
+        if slot == 0:
+            self.min_cx = self.max_cx = cell[0]
+            self.min_cy = self.max_cy = cell[1]
+        else:
+            self.min_cx = min(self.min_cx, cell[0])
+            self.max_cx = max(self.max_cx, cell[0])
+            self.min_cy = min(self.min_cy, cell[1])
+            self.max_cy = max(self.max_cy, cell[1])
+
+        return slot
+
+    def rebuild(self, entities: list, position_type):
+        """Re-index entities using their position component"""
+        self.clear()
+        for entity in entities:
+            pos = entity.components[position_type]
+            self.insert(entity, pos.x, pos.y)
+
+    def position(self, slot: int) -> Tuple[float, float]:
+        """Indexed position of a slot"""
+        return (self.xs[slot], self.ys[slot])
+
+    def slot_mask(self, slots) -> int:
+        """Build a bitset from slots"""
+        mask = 0
+        for slot in slots:
+            mask |= 1 << slot
+        return mask
+
+    def _ring(self, cx: int, cy: int, r: int):
+        """Occupied cells at Chebyshev distance r from (cx, cy)"""
+        if r == 0:
+            bucket = self.cells.get((cx, cy))
+            if bucket:
+                yield bucket
+            return
+
+        cells = self.cells
+        for x in range(cx - r, cx + r + 1):
+            for y in (cy - r, cy + r):
+                bucket = cells.get((x, y))
+                if bucket:
+                    yield bucket
+        for y in range(cy - r + 1, cy + r):
+            for x in (cx - r, cx + r):
+                bucket = cells.get((x, y))
+                if bucket:
+                    yield bucket
+
+    def query_radius(self, x: float, y: float, radius: float, exclude: int = 0) -> List[int]:
+        """Slots within radius of (x, y)"""
+        radius_sq = radius * radius
+        min_cx, min_cy = self.cell_of(x - radius, y - radius)
+        max_cx, max_cy = self.cell_of(x + radius, y + radius)
+        xs, ys, entities = self.xs, self.ys, self.entities
+
+        result = []
+        for cx in range(max(min_cx, self.min_cx), min(max_cx, self.max_cx) + 1):
+            for cy in range(max(min_cy, self.min_cy), min(max_cy, self.max_cy) + 1):
+                bucket = self.cells.get((cx, cy))
+                if not bucket:
+                    continue
+                for slot in bucket:
+                    if exclude >> slot & 1 or not entities[slot].active:
+                        continue
+                    dx = xs[slot] - x
+                    dy = ys[slot] - y
+                    if dx * dx + dy * dy <= radius_sq:
+                        result.append(slot)
+        return result
+
+    def query_rect(self, left: float, top: float, right: float, bottom: float) -> List[int]:
+        """Slots inside an axis-aligned rectangle (e.g. the camera view)"""
+        min_cx, min_cy = self.cell_of(left, top)
+        max_cx, max_cy = self.cell_of(right, bottom)
+        xs, ys, entities = self.xs, self.ys, self.entities
+
+        result = []
+        for cx in range(max(min_cx, self.min_cx), min(max_cx, self.max_cx) + 1):
+            for cy in range(max(min_cy, self.min_cy), min(max_cy, self.max_cy) + 1):
+                bucket = self.cells.get((cx, cy))
+                if not bucket:
+                    continue
+                for slot in bucket:
+                    if not entities[slot].active:
+                        continue
+                    if left <= xs[slot] <= right and top <= ys[slot] <= bottom:
+                        result.append(slot)
+        return result
+
+    def nearest(self, x: float, y: float, k: int = 1,
+                max_distance: Optional[float] = None, exclude: int = 0) -> List[Tuple[float, int]]:
+        """
+        k nearest slots to (x, y) as (distance_squared, slot), closest first
+        Searches rings of cells outward and stops once no closer cell can exist,
+        so cost depends on local density rather than total entity count
+        """
+        if k <= 0 or not self.entities:
+            return []
+
+        max_sq = max_distance * max_distance if max_distance is not None else math.inf
+        cx, cy = self.cell_of(x, y)
+        xs, ys, entities = self.xs, self.ys, self.entities
+
+        # Rings needed to cover the occupied grid from this cell
+        max_ring = max(cx - self.min_cx, self.max_cx - cx, cy - self.min_cy, self.max_cy - cy, 0)
+        if max_distance is not None:
+            max_ring = min(max_ring, int(max_distance // self.cell_size) + 1)
+
+        best: List[Tuple[float, int]] = []  # max-heap of (-dist_sq, slot)
+        for r in range(max_ring + 1):
+            for bucket in self._ring(cx, cy, r):
+                for slot in bucket:
+                    if exclude >> slot & 1 or not entities[slot].active:
+                        continue
+                    dx = xs[slot] - x
+                    dy = ys[slot] - y
+                    dist_sq = dx * dx + dy * dy
+                    if dist_sq > max_sq:
+                        continue
+                    if len(best) < k:
+                        heapq.heappush(best, (-dist_sq, slot))
+                    elif dist_sq < -best[0][0]:
+                        heapq.heapreplace(best, (-dist_sq, slot))
+
+            # Cells in ring r+1 are at least r cells away
+            if len(best) == k:
+                reach = r * self.cell_size
+                if -best[0][0] <= reach * reach:
+                    break
+
+        return sorted((-neg_dist, slot) for neg_dist, slot in best)
+
+
+# === TECHNICAL DIRECTOR NOTE ===
+# Grid hashing keeps neighbor queries local:
+# - Rebuilt once per frame (O(n))
+# - Radius, rect and k-nearest queries only touch nearby cells
+# - Slots double as bit positions for cheap "already hit" sets
@@ -0,0 +1,41 @@
+"""
+DARK SANCTUM - Procedural Textures
+Matrix Team: Technical Director + UI/UX Designer
+
+NumPy texture generation (sparse brightness variation) written through pygame.surfarray
+"""
+
+from typing import Optional, Tuple
+
+import numpy as np
+import pygame
+
+
+def variation_field(size: Tuple[int, int], density: float, amount: int,
+                    seed: Optional[int] = None) -> np.ndarray:
+    """
+    Sparse per-pixel brightness offsets, indexed [x, y] like surfarray
+    A density share of pixels gets a uniform offset in [-amount, amount], the rest 0
+    """
+    rng = np.random.default_rng(seed)
+    width, height = size
+    mask = rng.random((width, height)) < density
+    offsets = rng.integers(-amount, amount + 1, (width, height), dtype=np.int16)
+    return np.where(mask, offsets, 0).astype(np.int16)
+
+
+def varied_fill(size: Tuple[int, int], color: tuple, density: float = 0.1, amount: int = 5,
+                seed: Optional[int] = None) -> pygame.Surface:
+    """Opaque surface of color with sparse brightness variation (stone, dirt, cloth)"""
+    pixels = np.empty((size[0], size[1], 3), dtype=np.int16)
+    pixels[:] = color[:3]
+    pixels += variation_field(size, density, amount, seed)[:, :, None]
+
+    surface = pygame.Surface(size)
+    pygame.surfarray.blit_array(surface, np.clip(pixels, 0, 255).astype(np.uint8))
+    return surface
+
+
+# === TECHNICAL DIRECTOR NOTE ===
+# Arrays are [x, y] (surfarray layout), so they drop straight into blit_array
+# Seeded generators: same seed, same texture, on every machine and every run
@@ -5,6 +5,7 @@ Matrix Team: Game Designer + Developer
 Clean entity creation helpers
 """
 
+from typing import Optional
 from src.core.ecs import Entity, World
 from src.components.components import *
 from src.components.character_classes import *
@@ -202,8 +203,12 @@ class EntityFactory:
         return enemy
 
     def create_projectile(self, x: float, y: float, vx: float, vy: float,
-                         team: str, damage: float, color: tuple) -> Entity:
-        """Create projectile entity"""
+                         team: str, damage: float, color: tuple) -> Optional[Entity]:
+        """Create projectile entity (None when the projectile budget is spent)"""
+        from src.systems.budget_system import request_budget
+        if not request_budget(self.world, "projectiles"):
+            return None
+
         projectile = self.world.create_entity()
 
         projectile.add_component(Position(x, y))
@@ -215,6 +220,26 @@ class EntityFactory:
 
         return projectile
 
+    def create_projectiles(self, origins, velocities, teams, damages, color: tuple,
+                           size: float = 8, lifetime: float = 3.0) -> list:
+        """Create a batch of projectiles (one per origin/velocity row, within the projectile budget)"""
+        from src.systems.budget_system import request_budget
+        granted = request_budget(self.world, "projectiles", len(origins))
+        origins = origins[:granted]
+        projectiles = []
+
+        for (x, y), (vx, vy), team, damage in zip(origins, velocities, teams, damages):
+            projectile = self.world.create_entity()
+            projectile.add_component(Position(x, y))
+            projectile.add_component(Velocity(vx, vy))
+            projectile.add_component(Size(size, size))
+            projectile.add_component(Sprite(color, radius=size / 2))
+            projectile.add_component(Projectile(team, damage, lifetime=lifetime))
+            projectile.add_component(Tag("projectile"))
+            projectiles.append(projectile)
+
+        return projectiles
+
 
 # === GAME DESIGNER NOTE ===
 # Factory pattern keeps entity creation consistent and maintainable
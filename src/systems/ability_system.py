@@ -151,24 +151,15 @@ class AbilityInputSystem(System):
 
     def _cast_arcane_missiles(self, player_entity, pos: Position):
         """E - Fire 3 homing missiles"""
-        # Find 3 nearest enemies
-        enemies = self.get_entities(Enemy, Position, Health)
-
-        # Sort by distance
-        enemy_distances = []
-        for enemy in enemies:
-            enemy_pos = enemy.get_component(Position)
-            dx = enemy_pos.x - pos.x
-            dy = enemy_pos.y - pos.y
-            dist = math.sqrt(dx * dx + dy * dy)
-            enemy_distances.append((dist, enemy))
-
-        enemy_distances.sort(key=lambda x: x[0])
+        # Find 3 nearest enemies (shared per-frame targeting query)
+        from src.systems.spatial_system import nearest_k
+        targets = nearest_k(self.world, pos, ABILITY_E_MISSILES)
 
-        # Fire at up to 3 closest enemies
+        # Fire at up to 3 closest enemies (within the projectile budget)
+        from src.systems.budget_system import request_budget
+        targets = targets[:request_budget(self.world, "projectiles", len(targets))]
         missiles_fired = 0
-        for i in range(min(3, len(enemy_distances))):
-            target_enemy = enemy_distances[i][1]
+        for target_enemy in targets:
             self._create_homing_missile(pos.x, pos.y, target_enemy)
             missiles_fired += 1
 
@@ -208,6 +199,9 @@ class AbilityInputSystem(System):
 
     def _create_dash_trail(self, x: float, y: float):
         """Create visual dash trail effect"""
+        from src.systems.budget_system import request_budget
+        if not request_budget(self.world, "vfx"):
+            return
         trail = self.world.create_entity()
         trail.add_component(Position(x, y))
         trail.add_component(Sprite((150, 100, 255, 100), radius=20))
@@ -216,6 +210,9 @@ class AbilityInputSystem(System):
 
     def _create_nova_effect(self, x: float, y: float):
         """Create nova explosion effect"""
+        from src.systems.budget_system import request_budget
+        if not request_budget(self.world, "vfx"):
+            return
         nova = self.world.create_entity()
         nova.add_component(Position(x, y))
         nova.add_component(Sprite(COLOR_BLOOD_RED, radius=ABILITY_W_RADIUS))
@@ -7,8 +7,25 @@ Simple but impactful sound effect system
 
 import pygame
 from src.core.ecs import System
+from src.core.audio_mixer import AudioMixer
+from src.core.profiler import profiler
 from src.components.components import *
-from typing import Dict, Optional
+from config.settings import *
+from typing import Dict, List, Optional
+
+
+# Event type -> base volume (unknown events are ignored)
+SOUND_EVENTS: Dict[str, float] = {
+    'player_hit': 0.4,
+    'enemy_death': 0.3,
+    'ability_cast': 0.5,
+    'boss_spawn': 0.7,
+    'level_up': 0.6,
+    'projectile_fire': 0.2,
+}
+
+# Played on reserved channels, never voice-capped
+PRIORITY_SOUNDS = ('boss_spawn', 'level_up')
 
 
 class AudioSystem(System):
@@ -27,12 +44,17 @@ class AudioSystem(System):
         self.music_volume = 0.5
         self.enabled = True  # Master enable/disable
 
-        # Sound channels
+        # Sound channels (pooled, see AudioMixer)
         self.music_channel = None
-        self.sfx_channels = []
+        self.mixer: Optional[AudioMixer] = None
+        if pygame.mixer.get_init():
+            self.mixer = AudioMixer(AUDIO_CHANNELS, AUDIO_RESERVED_CHANNELS,
+                                    AUDIO_VOICES_PER_SOUND, PRIORITY_SOUNDS)
 
-        # Sound effects cache
+        # Sound effects cache (base sound + pitch variants, rotated on each play)
         self.sounds: Dict[str, pygame.mixer.Sound] = {}
+        self.variants: Dict[str, List[pygame.mixer.Sound]] = {}
+        self.next_variant: Dict[str, int] = {}
 
         # Generate procedural sounds
         self._generate_sounds()
@@ -54,6 +76,8 @@ class AudioSystem(System):
     def toggle_audio(self):
         """Toggle audio on/off"""
         self.enabled = not self.enabled
+        if not self.enabled and self.mixer:
+            self.mixer.stop()
 
     def _generate_sounds(self):
         """Generate simple procedural sound effects"""
@@ -62,22 +86,22 @@ class AudioSystem(System):
 
         try:
             # Player hit (short beep)
-            self.sounds['player_hit'] = self._generate_tone(440, 0.1, 0.3)
+            self._add_sound('player_hit', 440, 0.1, 0.3)
 
             # Enemy death (descending tone)
-            self.sounds['enemy_death'] = self._generate_tone(330, 0.15, 0.4)
+            self._add_sound('enemy_death', 330, 0.15, 0.4)
 
             # Ability cast (ascending chirp)
-            self.sounds['ability_cast'] = self._generate_tone(523, 0.12, 0.5)
+            self._add_sound('ability_cast', 523, 0.12, 0.5)
 
             # Boss spawn (deep rumble)
-            self.sounds['boss_spawn'] = self._generate_tone(110, 0.3, 0.6)
+            self._add_sound('boss_spawn', 110, 0.3, 0.6)
 
             # Level up (triumphant)
-            self.sounds['level_up'] = self._generate_tone(659, 0.2, 0.7)
+            self._add_sound('level_up', 659, 0.2, 0.7)
 
             # Projectile fire (quick blip)
-            self.sounds['projectile_fire'] = self._generate_tone(880, 0.05, 0.2)
+            self._add_sound('projectile_fire', 880, 0.05, 0.2)
 
             print(f"✅ Generated {len(self.sounds)} sound effects")
 
@@ -85,6 +109,20 @@ class AudioSystem(System):
             print(f"⚠️  Warning: Could not generate sounds: {e}")
             # Disable audio if it fails
             self.sounds = {}
+            self.variants = {}
+
+    def _add_sound(self, name: str, frequency: float, duration: float, volume: float):
+        """Generate a sound and its pitch variants (1.0, +4%, -4%, +8%, ...)"""
+        variants = []
+        for i in range(max(1, AUDIO_SOUND_VARIANTS)):
+            step = (i + 1) // 2 * (1 if i % 2 else -1)
+            sound = self._generate_tone(frequency * (1.0 + 0.04 * step), duration, volume)
+            if sound:
+                variants.append(sound)
+
+        if variants:
+            self.sounds[name] = variants[0]
+            self.variants[name] = variants
 
     def _generate_tone(self, frequency: float, duration: float, volume: float) -> Optional[pygame.mixer.Sound]:
         """Generate a simple sine wave tone"""
@@ -119,77 +157,60 @@ class AudioSystem(System):
             return None
 
     def update(self, dt: float):
-        """Process audio events"""
+        """Process audio events (same-type events this frame play once, louder)"""
         from src.components.components import AudioEvent
 
-        # Find and process all audio events
+        # Find and count all audio events
         audio_entities = self.get_entities(AudioEvent)
+        counts: Dict[str, int] = {}
 
         for entity in audio_entities:
             event = entity.get_component(AudioEvent)
 
             if not event.processed:
-                # Play the sound
-                if event.event_type == 'player_hit':
-                    self.play_player_hit()
-                elif event.event_type == 'enemy_death':
-                    self.play_enemy_death()
-                elif event.event_type == 'ability_cast':
-                    self.play_ability_cast()
-                elif event.event_type == 'boss_spawn':
-                    self.play_boss_spawn()
-                elif event.event_type == 'level_up':
-                    self.play_level_up()
-                elif event.event_type == 'projectile_fire':
-                    self.play_projectile_fire()
-
+                counts[event.event_type] = counts.get(event.event_type, 0) + 1
                 event.processed = True
 
             # Destroy event entity after processing
             self.world.destroy_entity(entity)
 
+        # One voice per event type: 40 deaths are one death sound, escalated
+        for event_type, count in counts.items():
+            volume = SOUND_EVENTS.get(event_type)
+            if volume is None:
+                continue
+            self.play_sound(event_type, AudioMixer.escalate(volume, count, AUDIO_ESCALATION))
+            if count > 1:
+                profiler.count("audio_merged", count - 1)
+
     def play_sound(self, sound_name: str, volume: float = 1.0):
         """Play a sound effect with volume control"""
         if not self.enabled:
             return
 
-        if sound_name not in self.sounds:
+        variants = self.variants.get(sound_name)
+        if not variants:
             return
 
-        sound = self.sounds[sound_name]
-        if sound:
-            # Apply master and SFX volume
-            final_volume = volume * self.sfx_volume * self.master_volume
+        # Rotate through the pitch variants so repeats don't sound identical
+        index = self.next_variant.get(sound_name, 0)
+        self.next_variant[sound_name] = (index + 1) % len(variants)
+        sound = variants[index]
+
+        # Apply master and SFX volume
+        final_volume = volume * self.sfx_volume * self.master_volume
+        if self.mixer:
+            if not self.mixer.play(sound_name, sound, final_volume):
+                profiler.count("audio_dropped")
+        else:
             sound.set_volume(final_volume)
             sound.play()
 
-    def play_player_hit(self):
-        """Play player hit sound"""
-        self.play_sound('player_hit', 0.4)
-
-    def play_enemy_death(self):
-        """Play enemy death sound"""
-        self.play_sound('enemy_death', 0.3)
-
-    def play_ability_cast(self):
-        """Play ability cast sound"""
-        self.play_sound('ability_cast', 0.5)
-
-    def play_boss_spawn(self):
-        """Play boss spawn sound"""
-        self.play_sound('boss_spawn', 0.7)
-
-    def play_level_up(self):
-        """Play level up sound"""
-        self.play_sound('level_up', 0.6)
-
-    def play_projectile_fire(self):
-        """Play projectile fire sound"""
-        self.play_sound('projectile_fire', 0.2)
-
 
 # === AUDIO DIRECTOR NOTE ===
 # Simple procedural sound generation keeps the game lightweight
 # No external audio files needed - all sounds generated at runtime
 # Volume levels carefully balanced to not be annoying
+# Same-type events merge per frame (+AUDIO_ESCALATION volume per doubling) and rotate pitch variants
+# Boss spawn / level up get reserved channels; other sounds are capped at AUDIO_VOICES_PER_SOUND voices
 # Future: Add music track, spatial audio, more complex sound effects
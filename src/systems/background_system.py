@@ -8,13 +8,53 @@ Sprint 25: Parallax backgrounds and environmental atmosphere
 import pygame
 import random
 import math
+from functools import partial
 from src.core.ecs import System
-from config.settings import WINDOW_WIDTH, WINDOW_HEIGHT
+from src.core.asset_manager import asset_manager
+from src.core.dirty_rects import dirty_rects
+from src.core.render_pipeline import render_pipeline
+from config.settings import WINDOW_WIDTH, WINDOW_HEIGHT, STAR_TWINKLE_FRAMES
 from config.ui_theme import *
 
 
+def get_fog_sprite(radius: int, color: tuple, alpha: int) -> pygame.Surface:
+    """
+    Radial gradient fog blob (concentric circles, fading outward)
+    Only drawn while baking a fog tile, so it is not cached (large, used once)
+    """
+    fog_surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+    for i in range(radius, 0, -5):
+        ring_alpha = int(alpha * (1.0 - i / radius))
+        pygame.draw.circle(fog_surf, (*color, ring_alpha), (radius, radius), i)
+    return fog_surf
+
+
+def blit_wrapped(target: pygame.Surface, tile: pygame.Surface, offset_x: float, offset_y: float):
+    """Blit a tileable surface scrolled by an offset, as up to four source sub-rects"""
+    w, h = tile.get_size()
+    ox = int(offset_x) % w
+    oy = int(offset_y) % h
+
+    # Tile pixel (u, v) lands at ((u + ox) % w, (v + oy) % h)
+    blit_list = []
+    for src_x, dst_x, width in ((w - ox, 0, ox), (0, ox, w - ox)):
+        if width <= 0:
+            continue
+        for src_y, dst_y, height in ((h - oy, 0, oy), (0, oy, h - oy)):
+            if height <= 0:
+                continue
+            blit_list.append((tile, (dst_x, dst_y), pygame.Rect(src_x, src_y, width, height)))
+
+    target.blits(blit_list, doreturn=False)
+
+
 class BackgroundLayer:
-    """Single parallax background layer"""
+    """
+    Single parallax background layer
+    Everything expensive is prepared at load time:
+    - stars: STAR_TWINKLE_FRAMES pre-rendered brightness sprites per star
+    - fog: blobs baked once into a tileable surface that drifts and scrolls
+    """
 
     def __init__(self, color: tuple, scroll_speed: float, pattern: str = "stars"):
         self.color = color
@@ -23,6 +63,13 @@ class BackgroundLayer:
         self.offset_x = 0.0
         self.offset_y = 0.0
 
+        # Layer-wide fog drift (the baked tile moves as one sheet)
+        self.drift_x = 0.0
+        self.drift_y = 0.0
+        self.drift_vx = 0.0
+        self.drift_vy = 0.0
+        self.tile = None
+
         # Generate pattern elements
         self.elements = []
         if pattern == "stars":
@@ -36,7 +83,8 @@ class BackgroundLayer:
                     'x': x, 'y': y, 'size': size,
                     'brightness': brightness,
                     'twinkle_speed': random.uniform(0.5, 2.0),
-                    'twinkle_offset': random.uniform(0, math.pi * 2)
+                    'twinkle_offset': random.uniform(0, math.pi * 2),
+                    'frames': self._create_star_frames(size, brightness)
                 })
         elif pattern == "fog":
             # Generate fog patches
@@ -45,79 +93,93 @@ class BackgroundLayer:
                 y = random.uniform(-100, WINDOW_HEIGHT + 100)
                 radius = random.randint(80, 200)
                 alpha = random.randint(10, 40)
-                drift_speed = random.uniform(5, 15)
-                drift_direction = random.uniform(0, math.pi * 2)
                 self.elements.append({
                     'x': x, 'y': y, 'radius': radius,
-                    'alpha': alpha,
-                    'drift_speed': drift_speed,
-                    'drift_dir': drift_direction
+                    'alpha': alpha
                 })
 
+            drift_speed = random.uniform(5, 15)
+            drift_direction = random.uniform(0, math.pi * 2)
+            self.drift_vx = math.cos(drift_direction) * drift_speed
+            self.drift_vy = math.sin(drift_direction) * drift_speed
+            self.tile = self._bake_fog_tile()
+
+    def _create_star_frames(self, size: int, brightness: int) -> list:
+        """Star sprites from dimmest (twinkle -1) to brightest (twinkle +1)"""
+        frames = []
+        for i in range(STAR_TWINKLE_FRAMES):
+            twinkle = -1.0 + 2.0 * i / (STAR_TWINKLE_FRAMES - 1)
+            level = int(brightness * (0.7 + 0.3 * twinkle))
+
+            # Drawn locally (each star owns its frames): keeps ~300 tiny circles out of the render cache
+            frame = pygame.Surface((size * 2 + 1, size * 2 + 1), pygame.SRCALPHA)
+            pygame.draw.circle(frame, (level, level, level), (size, size), size)
+            try:
+                frame = frame.convert_alpha()
+            except pygame.error:
+                pass  # No display yet
+            frames.append(frame)
+        return frames
+
+    def _bake_fog_tile(self) -> pygame.Surface:
+        """Bake all fog blobs into one screen-sized tileable surface"""
+        tile = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
+
+        for fog in self.elements:
+            fog_surf = get_fog_sprite(fog['radius'], self.color, fog['alpha'])
+            x = int(fog['x'] - fog['radius'])
+            y = int(fog['y'] - fog['radius'])
+
+            # Draw wrapped copies so blobs crossing an edge tile seamlessly
+            for dx in (-WINDOW_WIDTH, 0, WINDOW_WIDTH):
+                for dy in (-WINDOW_HEIGHT, 0, WINDOW_HEIGHT):
+                    tile.blit(fog_surf, (x + dx, y + dy))
+
+        try:
+            tile = tile.convert_alpha()
+        except pygame.error:
+            # Display not initialized yet, use raw surface
+            pass
+
+        return tile
+
     def update(self, dt: float, camera_offset: tuple):
         """Update layer position based on camera"""
+        # Drift fog sheet
+        self.drift_x += self.drift_vx * dt
+        self.drift_y += self.drift_vy * dt
+
         # Apply parallax scrolling
-        self.offset_x = camera_offset[0] * self.scroll_speed
-        self.offset_y = camera_offset[1] * self.scroll_speed
-
-        # Update animated elements
-        if self.pattern == "fog":
-            for elem in self.elements:
-                # Drift fog patches
-                elem['x'] += math.cos(elem['drift_dir']) * elem['drift_speed'] * dt
-                elem['y'] += math.sin(elem['drift_dir']) * elem['drift_speed'] * dt
-
-                # Wrap around screen
-                if elem['x'] < -elem['radius']:
-                    elem['x'] = WINDOW_WIDTH + elem['radius']
-                elif elem['x'] > WINDOW_WIDTH + elem['radius']:
-                    elem['x'] = -elem['radius']
-                if elem['y'] < -elem['radius']:
-                    elem['y'] = WINDOW_HEIGHT + elem['radius']
-                elif elem['y'] > WINDOW_HEIGHT + elem['radius']:
-                    elem['y'] = -elem['radius']
-
-    def render(self, surface: pygame.Surface, time: float):
-        """Render background layer"""
+        self.offset_x = camera_offset[0] * self.scroll_speed + self.drift_x
+        self.offset_y = camera_offset[1] * self.scroll_speed + self.drift_y
+
+    def render(self, surface: pygame.Surface, time: float, offset: tuple):
+        """Render background layer at a parallax offset (snapshot of offset_x/offset_y)"""
+        offset_x, offset_y = offset
         if self.pattern == "solid":
             # Simple solid color fill
             surface.fill(self.color)
 
         elif self.pattern == "stars":
-            # Render twinkling stars
+            # Twinkling stars: pick the pre-rendered brightness frame, one batched blit
+            last_frame = STAR_TWINKLE_FRAMES - 1
+            blit_list = []
             for star in self.elements:
-                # Calculate twinkle effect
                 twinkle = math.sin(time * star['twinkle_speed'] + star['twinkle_offset'])
-                brightness = int(star['brightness'] * (0.7 + 0.3 * twinkle))
-                color = (brightness, brightness, brightness)
+                frame = star['frames'][int((twinkle + 1.0) * 0.5 * last_frame + 0.5)]
 
                 # Apply parallax offset and wrap
-                x = (star['x'] + self.offset_x) % WINDOW_WIDTH
-                y = (star['y'] + self.offset_y) % WINDOW_HEIGHT
+                x = (star['x'] + offset_x) % WINDOW_WIDTH
+                y = (star['y'] + offset_y) % WINDOW_HEIGHT
 
-                pygame.draw.circle(surface, color, (int(x), int(y)), star['size'])
+                size = star['size']
+                blit_list.append((frame, (int(x) - size, int(y) - size)))
 
-        elif self.pattern == "fog":
-            # Render fog patches
-            for fog in self.elements:
-                # Create fog surface with alpha
-                fog_surf = pygame.Surface((fog['radius'] * 2, fog['radius'] * 2), pygame.SRCALPHA)
-
-                # Draw radial gradient fog
-                for i in range(fog['radius'], 0, -5):
-                    alpha = int(fog['alpha'] * (1.0 - i / fog['radius']))
-                    pygame.draw.circle(
-                        fog_surf,
-                        (*self.color, alpha),
-                        (fog['radius'], fog['radius']),
-                        i
-                    )
-
-                # Apply parallax offset
-                x = fog['x'] + self.offset_x
-                y = fog['y'] + self.offset_y
+            surface.blits(blit_list, doreturn=False)
 
-                surface.blit(fog_surf, (int(x - fog['radius']), int(y - fog['radius'])))
+        elif self.pattern == "fog":
+            # Baked fog sheet, scrolled
+            blit_wrapped(surface, self.tile, offset_x, offset_y)
 
 
 class BackgroundSystem(System):
@@ -125,7 +187,7 @@ class BackgroundSystem(System):
 
     def __init__(self, world, screen: pygame.Surface):
         super().__init__(world)
-        self.priority = 1  # Render first (before everything)
+        self.priority = 12  # Render first (before everything), once the camera has followed the player
         self.screen = screen
         self.time = 0.0
 
@@ -148,16 +210,38 @@ class BackgroundSystem(System):
         """Update and render background layers"""
         self.time += dt
 
-        # Get camera offset (assuming camera follows player)
-        camera_offset = (0, 0)  # TODO: Get from camera system if implemented
+        # Parallax follows the camera (shake is applied to the finished frame)
+        from src.systems.camera_system import get_camera
+        camera = get_camera(self.world)
+        camera_offset = camera.get_offset() if camera else (0, 0)
 
         # Update all layers
         for layer in self.layers:
             layer.update(dt, camera_offset)
 
         # Render layers back to front (Sprint 25: Background renders in update)
-        for layer in self.layers:
-            layer.render(self.screen, self.time)
+        # Offsets are snapshotted: the render stage may still be drawing while the next frame updates them
+        offsets = [(layer.offset_x, layer.offset_y) for layer in self.layers]
+        render_pipeline.draw(partial(self._render_layers, self.time, offsets))
+        render_pipeline.backdrop(partial(self._fill_shake_bands, self.time, offsets))
+
+        # Whole screen changes every frame, no partial presents
+        dirty_rects.invalidate()
+
+    def _render_layers(self, time: float, offsets: list):
+        """Draw all layers (runs on the render stage)"""
+        for layer, offset in zip(self.layers, offsets):
+            layer.render(self.screen, time, offset)
+
+    def _fill_shake_bands(self, time: float, offsets: list, target: pygame.Surface, bands: list, shake: tuple):
+        """Redraw the layers under the window edges a screen shake scrolled away"""
+        clip = target.get_clip()
+        shifted = [(x + shake[0], y + shake[1]) for x, y in offsets]
+        for band in bands:
+            target.set_clip(band)
+            for layer, offset in zip(self.layers, shifted):
+                layer.render(target, time, offset)
+        target.set_clip(clip)
 
 
 class EnvironmentalParticles(System):
@@ -165,11 +249,14 @@ class EnvironmentalParticles(System):
 
     def __init__(self, world, screen: pygame.Surface):
         super().__init__(world)
-        self.priority = 2  # After background, before game entities
+        self.priority = 13  # After background, before game entities
         self.screen = screen
         self.particles = []
         self.spawn_timer = 0.0
 
+        # Mist circles per (size, color, alpha step): bounded (9 sizes x 64 steps), kept out of the render cache
+        self.mist_sprites = {}
+
     def update(self, dt: float):
         """Update and render environmental particles"""
         # Spawn new particles periodically
@@ -179,15 +266,14 @@ class EnvironmentalParticles(System):
             self._spawn_particle()
 
         # Update existing particles
-        for particle in self.particles[:]:
+        for particle in self.particles:
             particle['lifetime'] -= dt
             particle['y'] += particle['vy'] * dt
             particle['x'] += particle['vx'] * dt
             particle['alpha'] = int(255 * (particle['lifetime'] / particle['max_lifetime']))
 
-            # Remove dead particles
-            if particle['lifetime'] <= 0:
-                self.particles.remove(particle)
+        # Remove dead particles
+        self.particles = [p for p in self.particles if p['lifetime'] > 0]
 
         # Render particles (Sprint 25: Render in update for proper layering)
         self._render_particles()
@@ -239,28 +325,32 @@ class EnvironmentalParticles(System):
                 'type': 'mist'
             })
 
+    def _get_mist_sprite(self, size: int, color: tuple, alpha: int) -> pygame.Surface:
+        """Cached soft mist circle (alpha quantized to steps of 4)"""
+        alpha = max(0, min(255, alpha)) & ~3
+        cache_key = (size, tuple(color), alpha)
+        mist_surf = self.mist_sprites.get(cache_key)
+        if mist_surf is None:
+            mist_surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+            pygame.draw.circle(mist_surf, (*color, alpha), (size, size), size)
+            self.mist_sprites[cache_key] = mist_surf
+        return mist_surf
+
     def _render_particles(self):
-        """Render environmental particles"""
+        """Render environmental particles (cached sprites, one batched blit on the render stage)"""
+        blit_list = []
         for particle in self.particles:
+            size = particle['size']
             if particle['type'] == 'mist':
                 # Draw mist as soft circle
-                mist_surf = pygame.Surface((particle['size'] * 2, particle['size'] * 2), pygame.SRCALPHA)
-                pygame.draw.circle(
-                    mist_surf,
-                    (*particle['color'], particle['alpha'] // 3),
-                    (particle['size'], particle['size']),
-                    particle['size']
-                )
-                self.screen.blit(mist_surf, (int(particle['x']), int(particle['y'])))
+                mist_surf = self._get_mist_sprite(size, particle['color'], particle['alpha'] // 3)
+                blit_list.append((mist_surf, (int(particle['x']), int(particle['y']))))
             else:
                 # Draw ash/embers as small circles
-                color_with_alpha = (*particle['color'], particle['alpha'])
-                pygame.draw.circle(
-                    self.screen,
-                    particle['color'],
-                    (int(particle['x']), int(particle['y'])),
-                    particle['size']
-                )
+                dot = asset_manager.get_circle_sprite(particle['color'], size)
+                blit_list.append((dot, (int(particle['x']) - size, int(particle['y']) - size)))
+
+        render_pipeline.draw(partial(self.screen.blits, blit_list, doreturn=False))
 
 
 # === CREATIVE DIRECTOR NOTE ===
@@ -270,4 +360,5 @@ class EnvironmentalParticles(System):
 # - Environmental particles (ash, embers, mist)
 # - Gothic atmosphere maintained throughout
 # - Performance-optimized particle system
+# - Fog baked into tileable sheets, stars/particles blitted from cached sprites
 # - Final visual polish for v3.0 release
@@ -85,9 +85,9 @@ class BossAbilitySystem(System):
         new_x = player_pos.x + math.cos(angle) * distance
         new_y = player_pos.y + math.sin(angle) * distance
 
-        # Clamp to screen
-        new_x = max(100, min(WINDOW_WIDTH - 100, new_x))
-        new_y = max(100, min(WINDOW_HEIGHT - 100, new_y))
+        # Clamp to world bounds
+        new_x = max(100, min(WORLD_WIDTH - 100, new_x))
+        new_y = max(100, min(WORLD_HEIGHT - 100, new_y))
 
         # Teleport particles at old position
         from src.systems.particle_system import create_death_particles
@@ -150,9 +150,9 @@ class BossAbilitySystem(System):
             x = boss_pos.x + math.cos(angle) * distance
             y = boss_pos.y + math.sin(angle) * distance
 
-            # Clamp to screen
-            x = max(50, min(WINDOW_WIDTH - 50, x))
-            y = max(50, min(WINDOW_HEIGHT - 50, y))
+            # Clamp to world bounds
+            x = max(50, min(WORLD_WIDTH - 50, x))
+            y = max(50, min(WORLD_HEIGHT - 50, y))
 
             # Create imp (weak fast enemy)
             from src.entities.factory import EntityFactory
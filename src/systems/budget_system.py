@@ -0,0 +1,118 @@
+"""
+DARK SANCTUM - Budget System
+Matrix Team: Technical Director + Game Designer
+
+Per-category caps on projectiles, damage numbers, VFX and particles
+"""
+
+from typing import Dict, Optional, Tuple
+from src.core.ecs import System
+from src.core.profiler import profiler
+from src.components.components import *
+from config.settings import *
+
+
+# Category -> (cap, priority); lower priorities degrade first once the world holds MAX_ENTITIES
+BUDGET_CATEGORIES: Dict[str, Tuple[int, int]] = {
+    "vfx": (MAX_VFX_ENTITIES, 0),
+    "damage_numbers": (MAX_DAMAGE_NUMBERS, 1),
+    "projectiles": (MAX_PROJECTILES, 2),
+}
+
+# Categories still granted when the world is full (combat keeps working)
+PROTECTED_PRIORITY = 2
+
+
+class BudgetSystem(System):
+    """
+    Count live entities per category once per frame, then grant spawn requests
+    - Projectiles and VFX over their cap are dropped
+    - Damage numbers over their cap are merged into a live number nearby (see create_damage_number)
+    - Particle bursts are thinned to a per-frame emit budget and shortened when the pool fills up
+    Everything refused is reported to the profiler ("dropped" and "dropped_<category>")
+    """
+
+    def __init__(self, world):
+        super().__init__(world)
+        self.priority = 3  # Before input, abilities and weapons spawn anything
+        self.counts: Dict[str, int] = {category: 0 for category in BUDGET_CATEGORIES}
+        self.total = 0
+        self.particle_room = PARTICLE_EMIT_BUDGET
+        self.particle_lifetime_scale = 1.0
+        world.add_resource(self)  # Looked up per spawn: no system scan
+
+    def update(self, dt: float):
+        """Recount live entities (one pass) and refill the particle budget"""
+        from src.systems.screen_effects import DamageNumber
+        from src.systems.vfx_system import TrailEffect, GlowEffect, ImpactEffect
+        projectiles = damage_numbers = vfx = 0
+
+        for entity in self.world.entities.values():
+            components = entity.components
+            if Projectile in components or HomingProjectile in components:
+                projectiles += 1
+            elif DamageNumber in components:
+                damage_numbers += 1
+            elif (Lifetime in components or TrailEffect in components
+                  or GlowEffect in components or ImpactEffect in components):
+                vfx += 1
+
+        self.counts["projectiles"] = projectiles
+        self.counts["damage_numbers"] = damage_numbers
+        self.counts["vfx"] = vfx
+        self.total = len(self.world.entities)
+
+        # Particles: live share of the pool shortens new bursts (down to half length when full)
+        from src.systems.particle_system import get_particle_pool
+        pool = get_particle_pool(self.world)
+        self.particle_room = PARTICLE_EMIT_BUDGET
+        if pool is not None:
+            pressure = len(pool) / pool.capacity
+            self.particle_lifetime_scale = 1.0 - 0.5 * max(0.0, pressure - 0.5) * 2
+        else:
+            self.particle_lifetime_scale = 1.0
+
+    def request(self, category: str, count: int = 1) -> int:
+        """Grant up to count new entities of a category (reports the rest as dropped)"""
+        cap, priority = BUDGET_CATEGORIES[category]
+        room = cap - self.counts[category]
+        if priority < PROTECTED_PRIORITY:
+            room = min(room, MAX_ENTITIES - self.total)
+
+        granted = max(0, min(count, room))
+        self.counts[category] += granted
+        self.total += granted
+        if granted < count:
+            self.report(category, count - granted)
+        return granted
+
+    def request_particles(self, count: int) -> Tuple[int, float]:
+        """Grant part of a particle burst: (particles, lifetime scale)"""
+        granted = max(0, min(count, self.particle_room))
+        self.particle_room -= granted
+        if granted < count:
+            self.report("particles", count - granted)
+        return granted, self.particle_lifetime_scale
+
+    @staticmethod
+    def report(category: str, dropped: int):
+        """Record refused spawns for the debug overlay"""
+        profiler.count("dropped", dropped)
+        profiler.count(f"dropped_{category}", dropped)
+
+
+def get_budget(world) -> Optional[BudgetSystem]:
+    """The world's budget, if it has one"""
+    return world.get_resource(BudgetSystem)
+
+
+def request_budget(world, category: str, count: int = 1) -> int:
+    """Spawn allowance for a category (everything is granted without a BudgetSystem)"""
+    budget = get_budget(world)
+    return budget.request(category, count) if budget is not None else count
+
+
+# === TECHNICAL DIRECTOR NOTE ===
+# Caps: MAX_ENTITIES overall, MAX_PROJECTILES, MAX_DAMAGE_NUMBERS, MAX_VFX_ENTITIES,
+# PARTICLE_EMIT_BUDGET particles per frame (the pool itself holds MAX_PARTICLES)
+# Enemies, pickups and the player are never refused; cosmetics give way first
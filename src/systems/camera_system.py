@@ -0,0 +1,38 @@
+"""
+DARK SANCTUM - Camera System
+Matrix Team: Technical Director + Developer
+
+Camera following the player through a world larger than the window
+"""
+
+from typing import Optional
+from src.core.ecs import System
+from src.core.camera import Camera
+from src.components.components import Player, Position
+
+
+class CameraSystem(System):
+    """Keep the player centered (the Camera resource clamps to the world bounds)"""
+
+    def __init__(self, world):
+        super().__init__(world)
+        self.priority = 11  # After movement (and the dash), before backgrounds: every drawer sees the same view
+        self.camera = world.get_resource(Camera) or world.add_resource(Camera())
+
+    def update(self, dt: float):
+        """Follow the player"""
+        players = self.get_entities(Player, Position)
+        if players:
+            pos = players[0].get_component(Position)
+            self.camera.center_on(pos.x, pos.y)
+
+
+def get_camera(world) -> Optional[Camera]:
+    """The world's camera, if it has one"""
+    return world.get_resource(Camera)
+
+
+# === TECHNICAL DIRECTOR NOTE ===
+# Everything simulates in world coordinates (0..WORLD_WIDTH, 0..WORLD_HEIGHT)
+# The camera transform is applied only at render time (sprites, bars, numbers, background)
+# HUD and menus stay in screen space
@@ -81,6 +81,11 @@ class AutoAttackSystem(System):
         dx /= dist
         dy /= dist
 
+        # Projectile budget (MAX_PROJECTILES)
+        from src.systems.budget_system import request_budget
+        if not request_budget(self.world, "projectiles"):
+            return
+
         # Create projectile entity
         projectile = self.world.create_entity()
         projectile.add_component(Position(from_pos.x, from_pos.y))
@@ -148,7 +153,7 @@ class ProjectileSystem(System):
                 # Create damage number
                 from src.systems.screen_effects import create_damage_number
                 entity_pos = entity.get_component(Position)
-                create_damage_number(self.world, entity_pos.x, entity_pos.y, projectile.damage)
+                create_damage_number(self.world, entity_pos.x, entity_pos.y, projectile.damage, target=entity)
 
                 # Track damage stats (if player projectile)
                 if projectile.owner_team == "player":
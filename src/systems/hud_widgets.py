@@ -0,0 +1,61 @@
+"""
+DARK SANCTUM - HUD Widgets
+Matrix Team: UI/UX Designer + Developer
+
+Retained HUD elements that only re-render when their bound value changes
+"""
+
+import pygame
+from typing import Any, Optional
+
+
+class TextWidget:
+    """
+    Text label bound to a value
+    The surface is rendered once per distinct value, then reused every frame
+    """
+
+    def __init__(self, font: pygame.font.Font, color: tuple, template: str = "{}",
+                 anchor: str = "topleft", pos: tuple = (0, 0)):
+        self.font = font
+        self.color = color
+        self.template = template
+        self.anchor = anchor  # Any pygame.Rect position attribute (topleft, center, topright...)
+        self.pos = pos
+
+        self.value: Any = None
+        self.surface: Optional[pygame.Surface] = None
+        self.rect = pygame.Rect(0, 0, 0, 0)
+
+    def set(self, value: Any) -> "TextWidget":
+        """Bind a new value (re-renders only if it changed); tuples fill several fields"""
+        if value != self.value or self.surface is None:
+            self.value = value
+            text = self.template.format(*value) if isinstance(value, tuple) else self.template.format(value)
+            self.surface = self.font.render(text, True, self.color)
+            self.rect = self.surface.get_rect(**{self.anchor: self.pos})
+        return self
+
+
+class BarWidget:
+    """
+    Horizontal fill bar drawn from one pre-filled strip
+    Fill width is applied with a source area, so changing values never allocate
+    """
+
+    def __init__(self, color: tuple, rect: pygame.Rect, inset: int = 0):
+        self.rect = pygame.Rect(rect).inflate(-2 * inset, -2 * inset)
+        self.inset = inset
+        self.strip = pygame.Surface(self.rect.size)
+        self.strip.fill(color)
+        self.area = pygame.Rect(0, 0, 0, self.rect.height)
+
+    def set(self, fill_width: int) -> "BarWidget":
+        """Set the filled width (measured on the outer rect, like the old draw calls)"""
+        self.area.width = max(0, min(fill_width, self.rect.width + self.inset) - self.inset)
+        return self
+
+
+# === UI/UX DESIGNER NOTE ===
+# Widgets hold their last surface; RenderSystem only blits them
+# Static parts (slot frames, labels, bar backgrounds) are baked once into HUD layers
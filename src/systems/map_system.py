@@ -59,12 +59,12 @@ class MapManager(System):
             angle = random.uniform(0, 2 * math.pi)
             distance = random.uniform(150, 400)  # Distance from center
 
-            x = WINDOW_WIDTH / 2 + math.cos(angle) * distance
-            y = WINDOW_HEIGHT / 2 + math.sin(angle) * distance
+            x = WORLD_WIDTH / 2 + math.cos(angle) * distance
+            y = WORLD_HEIGHT / 2 + math.sin(angle) * distance
 
-            # Clamp to screen bounds
-            x = max(hazard_data.radius, min(WINDOW_WIDTH - hazard_data.radius, x))
-            y = max(hazard_data.radius, min(WINDOW_HEIGHT - hazard_data.radius, y))
+            # Clamp to world bounds
+            x = max(hazard_data.radius, min(WORLD_WIDTH - hazard_data.radius, x))
+            y = max(hazard_data.radius, min(WORLD_HEIGHT - hazard_data.radius, y))
 
             # Create hazard entity
             hazard = self.world.create_entity()
@@ -8,7 +8,7 @@ Handles all entity movement with velocity and collision
 import pygame
 from src.core.ecs import System
 from src.components.components import Position, Velocity, Size
-from config.settings import WINDOW_WIDTH, WINDOW_HEIGHT
+from config.settings import WORLD_WIDTH, WORLD_HEIGHT
 
 
 class MovementSystem(System):
@@ -31,13 +31,13 @@ class MovementSystem(System):
             pos.x += vel.vx * dt
             pos.y += vel.vy * dt
 
-            # Screen bounds clamping
+            # World bounds clamping
             if size:
                 half_width = size.width / 2
                 half_height = size.height / 2
 
-                pos.x = max(half_width, min(WINDOW_WIDTH - half_width, pos.x))
-                pos.y = max(half_height, min(WINDOW_HEIGHT - half_height, pos.y))
+                pos.x = max(half_width, min(WORLD_WIDTH - half_width, pos.x))
+                pos.y = max(half_height, min(WORLD_HEIGHT - half_height, pos.y))
 
 
 class PlayerInputSystem(System):
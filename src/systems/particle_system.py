@@ -5,136 +5,65 @@ Matrix Team: Creative Director + Developer
 Simple particle effects for game juice
 """
 
-import random
-import math
+from typing import Optional
 from src.core.ecs import System
+from src.core.particle_pool import ParticlePool
 from src.components.components import *
 from config.settings import *
 
 
-class ParticleComponent(Component):
-    """Particle with lifetime and fade"""
-
-    def __init__(self, lifetime: float, velocity_x: float = 0, velocity_y: float = 0):
-        self.lifetime = lifetime
-        self.max_lifetime = lifetime
-        self.vx = velocity_x
-        self.vy = velocity_y
-
-    def update(self, dt: float) -> bool:
-        """Return True if expired"""
-        self.lifetime -= dt
-        return self.lifetime <= 0
-
-    @property
-    def alpha(self) -> float:
-        """Fade out over lifetime"""
-        return self.lifetime / self.max_lifetime
-
-
 class ParticleSystem(System):
-    """Update and clean up particles"""
+    """Update the particle pool (particles are array rows, not entities)"""
 
-    def __init__(self, world):
+    def __init__(self, world, capacity: int = MAX_PARTICLES):
         super().__init__(world)
         self.priority = 66  # After lifetime system
+        self.pool = world.add_resource(ParticlePool(capacity))  # Looked up per burst: no system scan
 
     def update(self, dt: float):
-        """Update all particles"""
-        particles = self.get_entities(ParticleComponent, Position, Velocity)
+        """Update all particles (vectorized lifetime, movement and damping)"""
+        self.pool.update(dt)
+
+
+def get_particle_pool(world) -> Optional[ParticlePool]:
+    """The world's particle pool (None when the world has no ParticleSystem)"""
+    return world.get_resource(ParticlePool)
+
 
-        for particle in particles:
-            particle_comp = particle.get_component(ParticleComponent)
+def emit_particles(world, x: float, y: float, count: int, color: tuple, radius: int,
+                   speed: tuple, lifetime: tuple, **options):
+    """Budgeted burst: thinned to the frame's emit budget, shortened when the pool is filling up"""
+    pool = get_particle_pool(world)
+    if pool is None:
+        return
 
-            # Update lifetime
-            if particle_comp.update(dt):
-                self.world.destroy_entity(particle)
-                continue
+    from src.systems.budget_system import get_budget
+    budget = get_budget(world)
+    if budget is not None:
+        count, lifetime_scale = budget.request_particles(count)
+        lifetime = (lifetime[0] * lifetime_scale, lifetime[1] * lifetime_scale)
 
-            # Apply gravity/velocity damping
-            vel = particle.get_component(Velocity)
-            vel.vx *= 0.98  # Damping
-            vel.vy *= 0.98
+    pool.emit(x, y, count, color, radius, speed, lifetime, **options)
 
 
 def create_hit_particles(world, x: float, y: float, color: tuple, count: int = 8):
     """Create particle burst on hit"""
-    for i in range(count):
-        angle = random.uniform(0, 2 * math.pi)
-        speed = random.uniform(50, 150)
-
-        particle = world.create_entity()
-        particle.add_component(Position(x, y))
-        particle.add_component(Velocity(
-            math.cos(angle) * speed,
-            math.sin(angle) * speed
-        ))
-        particle.add_component(Size(4, 4))
-        particle.add_component(Sprite(color, radius=2))
-        particle.add_component(ParticleComponent(
-            lifetime=random.uniform(0.3, 0.6)
-        ))
-        particle.add_component(Tag("particle"))
+    emit_particles(world, x, y, count, color, 2, speed=(50, 150), lifetime=(0.3, 0.6))
 
 
 def create_death_particles(world, x: float, y: float, color: tuple, count: int = 20):
     """Create particle explosion on death"""
-    for i in range(count):
-        angle = random.uniform(0, 2 * math.pi)
-        speed = random.uniform(100, 250)
-
-        particle = world.create_entity()
-        particle.add_component(Position(x, y))
-        particle.add_component(Velocity(
-            math.cos(angle) * speed,
-            math.sin(angle) * speed
-        ))
-        particle.add_component(Size(6, 6))
-        particle.add_component(Sprite(color, radius=3))
-        particle.add_component(ParticleComponent(
-            lifetime=random.uniform(0.5, 1.0)
-        ))
-        particle.add_component(Tag("particle"))
+    emit_particles(world, x, y, count, color, 3, speed=(100, 250), lifetime=(0.5, 1.0))
 
 
 def create_level_up_particles(world, x: float, y: float, count: int = 30):
     """Create golden particle burst on level up"""
-    for i in range(count):
-        angle = random.uniform(0, 2 * math.pi)
-        speed = random.uniform(150, 300)
-
-        particle = world.create_entity()
-        particle.add_component(Position(x, y))
-        particle.add_component(Velocity(
-            math.cos(angle) * speed,
-            math.sin(angle) * speed
-        ))
-        particle.add_component(Size(8, 8))
-        particle.add_component(Sprite(COLOR_GOLD, radius=4))
-        particle.add_component(ParticleComponent(
-            lifetime=random.uniform(0.8, 1.5)
-        ))
-        particle.add_component(Tag("particle"))
+    emit_particles(world, x, y, count, COLOR_GOLD, 4, speed=(150, 300), lifetime=(0.8, 1.5))
 
 
 def create_ability_particles(world, x: float, y: float, color: tuple, count: int = 20, spread: float = 50):
     """Create particle burst for ability effects"""
-    for i in range(count):
-        angle = random.uniform(0, 2 * math.pi)
-        speed = random.uniform(50, spread * 3)
-
-        particle = world.create_entity()
-        particle.add_component(Position(x, y))
-        particle.add_component(Velocity(
-            math.cos(angle) * speed,
-            math.sin(angle) * speed
-        ))
-        particle.add_component(Size(5, 5))
-        particle.add_component(Sprite(color, radius=2.5))
-        particle.add_component(ParticleComponent(
-            lifetime=random.uniform(0.4, 0.8)
-        ))
-        particle.add_component(Tag("particle"))
+    emit_particles(world, x, y, count, color, 2, speed=(50, spread * 3), lifetime=(0.4, 0.8))
 
 
 # === CREATIVE DIRECTOR NOTE ===
@@ -143,3 +72,4 @@ def create_ability_particles(world, x: float, y: float, color: tuple, count: int
 # - Death explosions feel satisfying
 # - Level up celebrations
 # - All using simple circles and velocity
+# - Particles live in a preallocated ParticlePool (MAX_PARTICLES), drawn by RenderSystem
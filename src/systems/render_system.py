@@ -6,185 +6,407 @@ Dark gothic aesthetic with minimal HUD
 """
 
 import pygame
+from typing import Dict, Optional
 from src.core.ecs import System
 from src.components.components import *
 from config.settings import *
 from src.core.asset_manager import asset_manager
+from src.core.profiler import profiler
+from src.core.dirty_rects import dirty_rects
+from src.core.render_pipeline import render_pipeline
+from src.systems.hud_widgets import TextWidget, BarWidget
+from src.systems.camera_system import get_camera
+from src.systems.particle_system import get_particle_pool
+
+
+# Render layers, drawn back to front (one Surface.blits call each)
+LAYER_HAZARDS = 0
+LAYER_PICKUPS = 1
+LAYER_ENEMIES = 2
+LAYER_PROJECTILES = 3
+LAYER_PLAYER = 4
+LAYER_VFX = 5
+LAYER_UI = 6
+LAYER_HUD = 7  # Screen-space: boss bar, HUD, FPS (no camera offset)
+RENDER_LAYER_COUNT = 8
+
+
+def get_view_bounds(camera_offset: tuple[float, float] = (0, 0),
+                    margin: float = CULL_MARGIN) -> tuple[float, float, float, float]:
+    """World-space (left, top, right, bottom) of the camera view, padded by margin"""
+    left = -camera_offset[0] - margin
+    top = -camera_offset[1] - margin
+    return (left, top, left + WINDOW_WIDTH + 2 * margin, top + WINDOW_HEIGHT + 2 * margin)
 
 
 class RenderSystem(System):
     """Render all visible entities"""
 
-    def __init__(self, world, screen: pygame.Surface):
+    def __init__(self, world, screen: pygame.Surface, world_target: pygame.Surface = None):
         super().__init__(world)
         self.priority = 100  # Render last
         self.screen = screen
-        self.font = None
+
+        # Optional low-resolution target for sprite layers (upscaled by the render stage)
+        self.world_target = world_target
+        self.world_scale = RENDER_SCALE if world_target is not None else 1
         # Initialize fonts
+        self.font = pygame.font.Font(None, 24)
         self.small_font = pygame.font.Font(None, 20)
         self.medium_font = pygame.font.Font(None, 32)
         self.large_font = pygame.font.Font(None, 48)
 
+        # Render command lists: blits items per layer, rebuilt every frame
+        # Double-buffered: the render stage may still be drawing the other set
+        self.layer_buffers = [[[] for _ in range(RENDER_LAYER_COUNT)] for _ in range(2)]
+        self.buffer_index = 0
+        self.render_layers = self.layer_buffers[0]
+
+        # Camera culling: view bounds and on-screen enemies for this frame
+        self.view_bounds = get_view_bounds()
+        self.visible_enemies = []
+        self.last_camera_transform = None
+
+        # Particle dot sprites, index = particle pool style id
+        self.particle_sprites = []
+
+        # Health bars: empty frame per bar width + one fill strip (kept out of the shared render cache)
+        self.health_bar_frames: Dict[int, pygame.Surface] = {}
+        self.health_bar_fill: Optional[pygame.Surface] = None
+
+        # Retained HUD: widgets + pre-baked static layers
+        self._build_hud()
+
     def update(self, dt: float):
         """Render frame"""
-        # Get screen shake offset
-        camera_offset = self._get_camera_offset()
-
-        # Background is now handled by BackgroundSystem (priority 1) - Sprint 25
+        # Camera position + screen shake
+        camera = get_camera(self.world)
+        transform = camera.get_transform() if camera else (0, 0, 0, 0)
+        if transform != self.last_camera_transform:
+            self.last_camera_transform = transform
+            dirty_rects.invalidate()  # Whole view moves: full flip
+        camera_offset = transform[:2]
+
+        # Background is now handled by BackgroundSystem (priority 12) - Sprint 25
         # No need to fill screen here
 
-        # Render all sprites (with camera offset)
-        self._render_sprites(camera_offset)
+        # Cull against the camera view
+        self.view_bounds = get_view_bounds(camera_offset)
 
-        # Render health bars
+        # Fill the free command buffer
+        self.buffer_index ^= 1
+        self.render_layers = self.layer_buffers[self.buffer_index]
+        for layer in self.render_layers:
+            layer.clear()
+
+        # Build render list: sprites, health bars, damage numbers (camera offset, no shake)
+        self._render_sprites(camera_offset)
+        self._render_particles(camera_offset)
         self._render_health_bars(camera_offset)
+        self._render_damage_numbers(camera_offset)
 
         # Render boss health bar (top of screen)
         self._render_boss_health()
 
-        # Render damage numbers
-        self._render_damage_numbers(camera_offset)
-
         # Render HUD (not affected by camera shake)
         self._render_hud()
 
         if SHOW_FPS:
             self._render_fps(1.0 / dt if dt > 0 else 0)
 
-    def _get_camera_offset(self) -> tuple[float, float]:
-        """Get camera offset from screen shake system"""
-        from src.systems.screen_effects import ScreenEffectsSystem
-        for system in self.world.systems:
-            if isinstance(system, ScreenEffectsSystem):
-                return system.get_camera_offset()
-        return (0, 0)
+        # Render stage draws one batched blit per layer (inline or on the render thread),
+        # then shakes everything below the HUD with a single scroll
+        render_pipeline.submit(self.screen, self.render_layers, self.world_target, LAYER_UI,
+                               shake=transform[2:], shake_layers=LAYER_HUD)
+
+    def _blit(self, surface: pygame.Surface, dest, area=None):
+        """Queue a screen-space blit on the HUD layer"""
+        if area is None:
+            self.render_layers[LAYER_HUD].append((surface, dest))
+        else:
+            self.render_layers[LAYER_HUD].append((surface, dest, area))
+
+    @staticmethod
+    def _layer_of(components: dict) -> int:
+        """Render layer for an entity's component set"""
+        if Player in components:
+            return LAYER_PLAYER
+        if Enemy in components:
+            return LAYER_ENEMIES
+        if Projectile in components or HomingProjectile in components:
+            return LAYER_PROJECTILES
+        if PowerUp in components:
+            return LAYER_PICKUPS
+        if EnvironmentalHazard in components:
+            return LAYER_HAZARDS
+        return LAYER_VFX
 
     def _render_sprites(self, camera_offset: tuple[float, float] = (0, 0)):
-        """Render all entities with sprites (Sprint 26: Real sprite images!)"""
-        entities = self.get_entities(Position, Sprite, Size)
+        """Queue all visible entities with sprites (Sprint 26: Real sprite images!)"""
+        left, top, right, bottom = self.view_bounds
+        culled = 0
+        visible_enemies = []  # On-screen enemies, for health bars
+
+        # One pass over live entities: this frame's spawns show up, destroyed ones are gone
+        for entity in self.get_entities(Position, Sprite, Size):
+            components = entity.components
+            pos = components[Position]
+            if not (left <= pos.x <= right and top <= pos.y <= bottom):
+                culled += 1
+                continue
+            self._queue_sprite(components, camera_offset)
+            if Enemy in components and Health in components:
+                visible_enemies.append(entity)
+
+        self.visible_enemies = visible_enemies
+        profiler.count("culled", culled)
+
+    def _queue_sprite(self, components: dict, camera_offset: tuple[float, float]):
+        """Add one entity's sprite to its render layer"""
+        from src.systems.screen_effects import HitFlash
+        pos = components[Position]
+        sprite = components[Sprite]
+        size = components[Size]
+
+        # Apply camera offset (and the low-resolution target divisor); shake is applied to the finished frame
+        scale = self.world_scale
+        render_x = int((pos.x + camera_offset[0]) / scale)
+        render_y = int((pos.y + camera_offset[1]) / scale)
+        sprite_scale = SPRITE_SCALE / scale
+
+        # Check for hit flash
+        hit_flash = components.get(HitFlash)
+        flashing = hit_flash is not None and hit_flash.active
+
+        # Check if boss (render glow)
+        enemy = components.get(Enemy)
+        is_boss = enemy is not None and enemy.is_boss
+
+        # Try to get sprite image from asset manager
+        # Sprint 27: Scale sprites 1.5x for better visibility (cached, scaled once)
+        # Hit flash and boss glow are cached variants too: one blit, no per-frame surfaces
+        surface = None
+        if sprite.sprite_key:
+            if flashing:
+                variant = "flash"
+            elif is_boss:
+                variant = "glow"
+            else:
+                variant = "normal"
+
+            # Packed atlas: blit a sub-rect of a shared page
+            region = asset_manager.get_atlas_region(sprite.sprite_key, sprite_scale, variant)
+            if region:
+                page, area = region
+                self.render_layers[self._layer_of(components)].append(
+                    (page, (render_x - area.width // 2, render_y - area.height // 2), area)
+                )
+                return
+
+            surface = asset_manager.get_scaled_sprite(sprite.sprite_key, sprite_scale, variant)
+
+        if surface is None:
+            # FALLBACK: Old circle rendering (if sprite not found), as cached shapes
+            if sprite.radius:
+                color = (255, 255, 255) if flashing else sprite.color
+                surface = asset_manager.get_circle_sprite(
+                    color, int(sprite.radius / scale), BOSS_GLOW_COLOR if is_boss else None
+                )
+            else:
+                surface = asset_manager.get_rect_sprite(sprite.color, int(size.width / scale),
+                                                        int(size.height / scale))
 
-        for entity in entities:
-            pos = entity.get_component(Position)
-            sprite = entity.get_component(Sprite)
-            size = entity.get_component(Size)
+        self.render_layers[self._layer_of(components)].append(
+            (surface, (render_x - surface.get_width() // 2, render_y - surface.get_height() // 2))
+        )
 
-            # Apply camera offset for screen shake
-            render_x = int(pos.x + camera_offset[0])
-            render_y = int(pos.y + camera_offset[1])
-
-            # Check for hit flash
-            from src.systems.screen_effects import HitFlash
-            hit_flash = entity.get_component(HitFlash) if entity.has_component(HitFlash) else None
+    def _render_particles(self, camera_offset: tuple[float, float]):
+        """Queue visible pool particles as cached dots on the VFX layer"""
+        pool = get_particle_pool(self.world)
+        if pool is None:
+            return
 
-            # Check if boss (render glow)
-            enemy = entity.get_component(Enemy)
-            is_boss = enemy and enemy.is_boss
-
-            # Try to get sprite image from asset manager
-            sprite_image = None
-            if hasattr(sprite, 'sprite_key') and sprite.sprite_key:
-                sprite_image = asset_manager.get_sprite(sprite.sprite_key)
-
-            if sprite_image:
-                # RENDER SPRITE IMAGE (Sprint 26: Real sprites, Sprint 27: 1.5x larger!)
-                # Sprint 27: Scale sprites 1.5x for better visibility
-                SPRITE_SCALE = 1.5
-                scaled_size = (int(sprite_image.get_width() * SPRITE_SCALE),
-                              int(sprite_image.get_height() * SPRITE_SCALE))
-                scaled_sprite = pygame.transform.scale(sprite_image, scaled_size)
-                sprite_rect = scaled_sprite.get_rect(center=(render_x, render_y))
-
-                # Apply hit flash effect
-                if hit_flash and hit_flash.active:
-                    # Create white flash surface
-                    flash_surf = scaled_sprite.copy()
-                    flash_surf.fill((255, 255, 255, 180), special_flags=pygame.BLEND_RGB_ADD)
-                    self.screen.blit(flash_surf, sprite_rect)
-                else:
-                    # Boss glow effect
-                    if is_boss:
-                        # Render glow behind sprite
-                        glow_size = (int(sprite_rect.width * 1.3), int(sprite_rect.height * 1.3))
-                        glow_surf = pygame.Surface(glow_size, pygame.SRCALPHA)
-                        pygame.draw.circle(
-                            glow_surf,
-                            BOSS_GLOW_COLOR + (120,),
-                            (glow_size[0] // 2, glow_size[1] // 2),
-                            glow_size[0] // 2
-                        )
-                        glow_rect = glow_surf.get_rect(center=(render_x, render_y))
-                        self.screen.blit(glow_surf, glow_rect)
-
-                    # Render scaled sprite
-                    self.screen.blit(scaled_sprite, sprite_rect)
+        positions, styles, culled = pool.visible(*self.view_bounds)
+        profiler.count("culled", culled)
+        if not len(styles):
+            return
 
-            else:
-                # FALLBACK: Old circle rendering (if sprite not found)
-                flash_color = (255, 255, 255) if (hit_flash and hit_flash.active) else sprite.color
-
-                if sprite.radius:
-                    # Boss glow effect
-                    if is_boss:
-                        pygame.draw.circle(
-                            self.screen,
-                            BOSS_GLOW_COLOR,
-                            (render_x, render_y),
-                            int(sprite.radius + 5),
-                            3
-                        )
-
-                    # Draw as circle (with hit flash)
-                    pygame.draw.circle(
-                        self.screen,
-                        flash_color,
-                        (render_x, render_y),
-                        int(sprite.radius)
-                    )
-                else:
-                    # Draw as rectangle
-                    rect = pygame.Rect(
-                        int(render_x - size.width / 2),
-                        int(render_y - size.height / 2),
-                        int(size.width),
-                        int(size.height)
-                    )
-                    pygame.draw.rect(self.screen, sprite.color, rect)
+        # Dot sprite per style (radius in target pixels)
+        scale = self.world_scale
+        sprites = self.particle_sprites
+        for color, radius in pool.styles[len(sprites):]:
+            dot_radius = max(1, int(radius / scale))
+            sprites.append((asset_manager.get_circle_sprite(color, dot_radius), dot_radius))
+
+        # Top-left corners, vectorized
+        xs = ((positions[:, 0] + camera_offset[0]) / scale).astype(int).tolist()
+        ys = ((positions[:, 1] + camera_offset[1]) / scale).astype(int).tolist()
+        self.render_layers[LAYER_VFX].extend(
+            (sprites[style][0], (x - sprites[style][1], y - sprites[style][1]))
+            for style, x, y in zip(styles.tolist(), xs, ys)
+        )
+
+    def _health_bar_frame(self, bar_width: int) -> pygame.Surface:
+        """Empty health bar (background + border) for a width, built once"""
+        surface = self.health_bar_frames.get(bar_width)
+        if surface is None:
+            bar_rect = pygame.Rect(0, 0, bar_width, 4)
+            surface = pygame.Surface(bar_rect.size)
+            # Background (dark red)
+            surface.fill((40, 10, 10))
+            # Border
+            pygame.draw.rect(surface, (80, 20, 20), bar_rect, 1)
+            self.health_bar_frames[bar_width] = surface
+        return surface
+
+    def _health_bar_fill_strip(self, bar_width: int) -> pygame.Surface:
+        """Foreground (blood red) strip, cropped to the fill with area= (grown for wider bars)"""
+        strip = self.health_bar_fill
+        if strip is None or strip.get_width() < bar_width:
+            strip = pygame.Surface((bar_width, 2))
+            strip.fill(COLOR_BLOOD_RED)
+            self.health_bar_fill = strip
+        return strip
 
     def _render_health_bars(self, camera_offset: tuple[float, float] = (0, 0)):
-        """Render health bars above entities"""
-        entities = self.get_entities(Position, Health, Size)
+        """Queue health bars above visible entities (on-screen enemies + player)"""
+        left, top, right, bottom = self.view_bounds
+        players = [
+            entity for entity in self.get_entities(Player, Position, Health, Size)
+            if left <= entity.components[Position].x <= right
+            and top <= entity.components[Position].y <= bottom
+        ]
+        ui_layer = self.render_layers[LAYER_UI]
 
-        for entity in entities:
-            pos = entity.get_component(Position)
-            health = entity.get_component(Health)
-            size = entity.get_component(Size)
+        for entity in self.visible_enemies + players:
+            components = entity.components
+            health = components[Health]
+            size = components.get(Size)
 
             # Skip if full health
-            if health.percent >= 0.99:
+            if size is None or health.percent >= 0.99:
                 continue
 
+            pos = components[Position]
+
             # Apply camera offset
             render_x = pos.x + camera_offset[0]
             render_y = pos.y + camera_offset[1]
 
             # Health bar position (above entity, with camera offset)
-            bar_width = size.width
-            bar_height = 4
-            bar_x = int(render_x - bar_width / 2)
+            bar_width = int(size.width)
+            bar_x = int(render_x - size.width / 2)
             bar_y = int(render_y - size.height / 2 - 10)
+            fg_width = int(size.width * health.percent)
+
+            # Frame, then the fill inside the 1px border (same pixels as fill-then-border)
+            ui_layer.append((self._health_bar_frame(bar_width), (bar_x, bar_y)))
+            fill_width = min(fg_width, bar_width - 1) - 1
+            if fill_width > 0:
+                ui_layer.append((self._health_bar_fill_strip(bar_width), (bar_x + 1, bar_y + 1),
+                                 (0, 0, fill_width, 2)))
+
+    def _build_hud(self):
+        """Create HUD widgets and bake the static HUD parts (frames, labels, bar backgrounds)"""
+        # Layout (Bottom Left health, bottom XP bar, bottom center abilities)
+        self.health_bar_rect = pygame.Rect(20, WINDOW_HEIGHT - 50, 200, 20)
+        self.xp_bar_rect = pygame.Rect(0, WINDOW_HEIGHT - 15, WINDOW_WIDTH, 10)
+
+        self.ability_keys = ['Q', 'W', 'E', 'R']
+        self.ability_names = ['Dash', 'Nova', 'Missiles', 'Freeze']
+        self.ability_colors = [
+            (150, 100, 255),  # Q - Purple (mobility)
+            (180, 20, 20),    # W - Red (damage)
+            (80, 120, 255),   # E - Blue (burst)
+            (255, 215, 0)     # R - Gold (ultimate)
+        ]
+        self.ability_max_cooldowns = {
+            'Q': ABILITY_Q_COOLDOWN,
+            'W': ABILITY_W_COOLDOWN,
+            'E': ABILITY_E_COOLDOWN,
+            'R': ABILITY_R_COOLDOWN
+        }
+        self.slot_size = 50
+        slot_spacing = 10
+        total_width = len(self.ability_keys) * (self.slot_size + slot_spacing)
+        start_x = (WINDOW_WIDTH - total_width) // 2
+        self.slot_y = WINDOW_HEIGHT - 80
+        self.slot_xs = [start_x + i * (self.slot_size + slot_spacing) for i in range(len(self.ability_keys))]
+
+        # Static background band (drawn first): bar backgrounds/frames and ability slots
+        band_top = self.slot_y
+        self.hud_band_pos = (0, band_top)
+        self.hud_background = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT - band_top), pygame.SRCALPHA)
+
+        health_rect = self.health_bar_rect.move(0, -band_top)
+        pygame.draw.rect(self.hud_background, (40, 10, 10), health_rect)
+        pygame.draw.rect(self.hud_background, (120, 40, 40), health_rect, 2)
+        pygame.draw.rect(self.hud_background, (20, 20, 40), self.xp_bar_rect.move(0, -band_top))
+
+        for i, x in enumerate(self.slot_xs):
+            slot_rect = pygame.Rect(x, 0, self.slot_size, self.slot_size)
+            pygame.draw.rect(self.hud_background, (30, 20, 40), slot_rect)
+            pygame.draw.rect(self.hud_background, self.ability_colors[i], slot_rect, 2)
+
+        # Static overlay (drawn last): ability names sit on top of the XP bar
+        self.hud_labels = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT - band_top), pygame.SRCALPHA)
+        for i, x in enumerate(self.slot_xs):
+            name_surf = self.small_font.render(self.ability_names[i], True, (150, 150, 150))
+            name_rect = name_surf.get_rect(center=(x + self.slot_size // 2, self.slot_size + 15))
+            self.hud_labels.blit(name_surf, name_rect)
+
+        try:
+            self.hud_background = self.hud_background.convert_alpha()
+            self.hud_labels = self.hud_labels.convert_alpha()
+        except pygame.error:
+            pass
+
+        # Dynamic fills (inset keeps the baked 2px frame visible)
+        self.health_fill = BarWidget(COLOR_BLOOD_RED, self.health_bar_rect, inset=2)
+        self.xp_fill = BarWidget(COLOR_GOLD, self.xp_bar_rect)
+
+        # Cooldown overlay (cropped to the remaining cooldown height)
+        self.cooldown_overlay = pygame.Surface((self.slot_size, self.slot_size))
+        self.cooldown_overlay.set_alpha(180)
+        self.cooldown_overlay.fill((10, 5, 15))
+
+        # Text widgets
+        self.health_text = TextWidget(self.small_font, COLOR_WHITE, "HP: {}/{}",
+                                      "topleft", (20, WINDOW_HEIGHT - 80))
+        self.level_text = TextWidget(self.font, COLOR_GOLD, "LEVEL {}", "topleft", (20, 20))
+        self.enemy_text = TextWidget(self.small_font, COLOR_WHITE, "ENEMIES: {}",
+                                     "topright", (WINDOW_WIDTH - 20, 20))
+        self.fps_text = TextWidget(self.font, (100, 100, 100), "{}", "topright",
+                                   (WINDOW_WIDTH - 20, WINDOW_HEIGHT - 30))
+
+        slot_centers = [(x + self.slot_size // 2, self.slot_y + self.slot_size // 2) for x in self.slot_xs]
+        self.cooldown_texts = [
+            TextWidget(self.small_font, COLOR_WHITE, "{:.1f}", "center", center) for center in slot_centers
+        ]
+        self.key_texts = [
+            TextWidget(self.font, self.ability_colors[i], "{}", "center", center).set(key)
+            for i, (key, center) in enumerate(zip(self.ability_keys, slot_centers))
+        ]
 
-            # Background (dark red)
-            bg_rect = pygame.Rect(bar_x, bar_y, bar_width, bar_height)
-            pygame.draw.rect(self.screen, (40, 10, 10), bg_rect)
+        # Boss health bar (top center): background + thick border baked, fill clipped inside
+        self.boss_bar_rect = pygame.Rect((WINDOW_WIDTH - 400) // 2, 20, 400, 30)
+        self.boss_bar_frame = pygame.Surface(self.boss_bar_rect.size)
+        self.boss_bar_frame.fill((40, 10, 10))
+        pygame.draw.rect(self.boss_bar_frame, COLOR_BLOOD_RED, self.boss_bar_frame.get_rect(), 3)
+        self.boss_fill = BarWidget(BOSS_GLOW_COLOR, self.boss_bar_rect, inset=3)
 
-            # Foreground (blood red)
-            fg_width = int(bar_width * health.percent)
-            if fg_width > 0:
-                fg_rect = pygame.Rect(bar_x, bar_y, fg_width, bar_height)
-                pygame.draw.rect(self.screen, COLOR_BLOOD_RED, fg_rect)
+        # Boss bar labels
+        self.boss_name_text = TextWidget(self.font, BOSS_GLOW_COLOR, "{}", "center", (WINDOW_WIDTH // 2, 5))
+        self.boss_health_text = TextWidget(self.small_font, COLOR_WHITE, "{}/{}", "center",
+                                           (WINDOW_WIDTH // 2, 35))
 
-            # Border
-            pygame.draw.rect(self.screen, (80, 20, 20), bg_rect, 1)
+    def _blit_widget(self, widget):
+        """Queue a text widget's cached surface"""
+        self._blit(widget.surface, widget.rect)
+
+    def _blit_bar(self, bar: BarWidget):
+        """Queue the filled part of a bar widget (area copied: the widget reuses its Rect)"""
+        self._blit(bar.strip, bar.rect.topleft, bar.area.copy())
 
     def _render_boss_health(self):
         """Render boss health bar at top of screen"""
@@ -203,49 +425,16 @@ class RenderSystem(System):
         # Get boss health
         health = boss.get_component(Health)
 
-        # Boss health bar (top center)
-        bar_width = 400
-        bar_height = 30
-        bar_x = (WINDOW_WIDTH - bar_width) // 2
-        bar_y = 20
-
-        # Background
-        pygame.draw.rect(self.screen, (40, 10, 10),
-                        (bar_x, bar_y, bar_width, bar_height))
-
-        # Foreground
-        fg_width = int(bar_width * health.percent)
-        if fg_width > 0:
-            pygame.draw.rect(self.screen, BOSS_GLOW_COLOR,
-                            (bar_x, bar_y, fg_width, bar_height))
-
-        # Border (thick)
-        pygame.draw.rect(self.screen, COLOR_BLOOD_RED,
-                        (bar_x, bar_y, bar_width, bar_height), 3)
-
-        # Boss name
-        if not self.font:
-            self.font = pygame.font.Font(None, 32)
-
-        boss_text = "💀 BLOOD TITAN 💀"
-        boss_surf = self.font.render(boss_text, True, BOSS_GLOW_COLOR)
-        boss_rect = boss_surf.get_rect(center=(WINDOW_WIDTH // 2, bar_y - 15))
-        self.screen.blit(boss_surf, boss_rect)
-
-        # Health text
-        health_text = f"{int(health.current)}/{int(health.max_health)}"
-        if not self.small_font:
-            self.small_font = pygame.font.Font(None, 24)
-        health_surf = self.small_font.render(health_text, True, COLOR_WHITE)
-        health_rect = health_surf.get_rect(center=(WINDOW_WIDTH // 2, bar_y + bar_height // 2))
-        self.screen.blit(health_surf, health_rect)
+        # Boss health bar (top center): baked background + border, fill inside the border
+        self._blit(self.boss_bar_frame, self.boss_bar_rect.topleft)
+        self._blit_bar(self.boss_fill.set(int(self.boss_bar_rect.width * health.percent)))
 
-    def _render_hud(self):
-        """Render minimal HUD"""
-        if not self.font:
-            self.font = pygame.font.Font(None, 32)
-            self.small_font = pygame.font.Font(None, 24)
+        # Boss name + health text (cached widgets)
+        self._blit_widget(self.boss_name_text.set("💀 BLOOD TITAN 💀"))
+        self._blit_widget(self.boss_health_text.set((int(health.current), int(health.max_health))))
 
+    def _render_hud(self):
+        """Render minimal HUD (baked static layers + cached widgets)"""
         # Find player
         player_entities = self.get_entities(Player, Health, Experience)
         if not player_entities:
@@ -255,142 +444,72 @@ class RenderSystem(System):
         health = player.get_component(Health)
         xp = player.get_component(Experience)
 
-        # === HEALTH BAR (Bottom Left) ===
-        health_text = f"HP: {int(health.current)}/{int(health.max_health)}"
-        text_surf = self.small_font.render(health_text, True, COLOR_WHITE)
-        self.screen.blit(text_surf, (20, WINDOW_HEIGHT - 80))
-
-        # Health bar
-        bar_width = 200
-        bar_height = 20
-        bar_x = 20
-        bar_y = WINDOW_HEIGHT - 50
-
-        # Background
-        pygame.draw.rect(self.screen, (40, 10, 10),
-                        (bar_x, bar_y, bar_width, bar_height))
+        # Static frames, bar backgrounds and ability slots
+        self._blit(self.hud_background, self.hud_band_pos)
 
-        # Foreground
-        fg_width = int(bar_width * health.percent)
-        pygame.draw.rect(self.screen, COLOR_BLOOD_RED,
-                        (bar_x, bar_y, fg_width, bar_height))
-
-        # Border
-        pygame.draw.rect(self.screen, (120, 40, 40),
-                        (bar_x, bar_y, bar_width, bar_height), 2)
+        # === HEALTH BAR (Bottom Left) ===
+        self._blit_widget(self.health_text.set((int(health.current), int(health.max_health))))
+        self._blit_bar(self.health_fill.set(int(self.health_bar_rect.width * health.percent)))
 
         # === XP BAR (Bottom of screen) ===
         xp_percent = xp.current_xp / xp.xp_to_next_level
-        xp_bar_height = 10
-        xp_bar_y = WINDOW_HEIGHT - 15
-
-        # Background
-        pygame.draw.rect(self.screen, (20, 20, 40),
-                        (0, xp_bar_y, WINDOW_WIDTH, xp_bar_height))
-
-        # Foreground
-        xp_width = int(WINDOW_WIDTH * xp_percent)
-        pygame.draw.rect(self.screen, COLOR_GOLD,
-                        (0, xp_bar_y, xp_width, xp_bar_height))
+        self._blit_bar(self.xp_fill.set(int(WINDOW_WIDTH * xp_percent)))
 
         # === LEVEL (Top Left) ===
-        level_text = f"LEVEL {xp.level}"
-        level_surf = self.font.render(level_text, True, COLOR_GOLD)
-        self.screen.blit(level_surf, (20, 20))
+        self._blit_widget(self.level_text.set(xp.level))
 
         # === WAVE & TIME (Top Center) ===
         # Get wave count from game
         # Note: This will be passed from main game loop
 
         # === ENEMY COUNT (Top Right) ===
-        enemy_count = len(self.get_entities(Enemy))
-        enemy_text = f"ENEMIES: {enemy_count}"
-        enemy_surf = self.small_font.render(enemy_text, True, COLOR_WHITE)
-        text_rect = enemy_surf.get_rect()
-        text_rect.topright = (WINDOW_WIDTH - 20, 20)
-        self.screen.blit(enemy_surf, text_rect)
+        self._blit_widget(self.enemy_text.set(len(self.get_entities(Enemy))))
 
         # === ABILITY COOLDOWNS (Bottom Center) ===
         abilities = player.get_component(Abilities)
         self._render_abilities(abilities)
 
-    def _render_abilities(self, abilities: Abilities):
-        """Render ability cooldowns"""
-        ability_keys = ['Q', 'W', 'E', 'R']
-        ability_names = ['Dash', 'Nova', 'Missiles', 'Freeze']
-        ability_colors = [
-            (150, 100, 255),  # Q - Purple (mobility)
-            (180, 20, 20),    # W - Red (damage)
-            (80, 120, 255),   # E - Blue (burst)
-            (255, 215, 0)     # R - Gold (ultimate)
-        ]
-
-        # Position at bottom center
-        slot_size = 50
-        slot_spacing = 10
-        total_width = len(ability_keys) * (slot_size + slot_spacing)
-        start_x = (WINDOW_WIDTH - total_width) // 2
-        y = WINDOW_HEIGHT - 80
-
-        for i, key in enumerate(ability_keys):
-            x = start_x + i * (slot_size + slot_spacing)
+        # Ability names (drawn over the XP bar)
+        self._blit(self.hud_labels, self.hud_band_pos)
 
-            # Background slot
-            slot_rect = pygame.Rect(x, y, slot_size, slot_size)
-            pygame.draw.rect(self.screen, (30, 20, 40), slot_rect)
-            pygame.draw.rect(self.screen, ability_colors[i], slot_rect, 2)
-
-            # Cooldown overlay
+    def _render_abilities(self, abilities: Abilities):
+        """Render ability cooldowns (slots and names are pre-baked)"""
+        for i, key in enumerate(self.ability_keys):
             cooldown = abilities.cooldowns[key]
             if cooldown > 0:
-                # Calculate cooldown percentage
-                max_cooldown = {
-                    'Q': ABILITY_Q_COOLDOWN,
-                    'W': ABILITY_W_COOLDOWN,
-                    'E': ABILITY_E_COOLDOWN,
-                    'R': ABILITY_R_COOLDOWN
-                }[key]
-
-                cd_percent = cooldown / max_cooldown
-                overlay_height = int(slot_size * cd_percent)
-
-                # Dark overlay
+                # Dark overlay over the remaining cooldown fraction
+                cd_percent = cooldown / self.ability_max_cooldowns[key]
+                overlay_height = int(self.slot_size * cd_percent)
+
                 if overlay_height > 0:
-                    overlay_rect = pygame.Rect(x, y + (slot_size - overlay_height),
-                                               slot_size, overlay_height)
-                    overlay_surf = pygame.Surface((slot_size, overlay_height))
-                    overlay_surf.set_alpha(180)
-                    overlay_surf.fill((10, 5, 15))
-                    self.screen.blit(overlay_surf, overlay_rect)
-
-                # Cooldown text
-                cd_text = f"{cooldown:.1f}"
-                cd_surf = self.small_font.render(cd_text, True, COLOR_WHITE)
-                cd_rect = cd_surf.get_rect(center=(x + slot_size // 2, y + slot_size // 2))
-                self.screen.blit(cd_surf, cd_rect)
+                    dest = (self.slot_xs[i], self.slot_y + (self.slot_size - overlay_height))
+                    self._blit(self.cooldown_overlay, dest, (0, 0, self.slot_size, overlay_height))
+
+                # Cooldown text (re-rendered only when the tenths digit changes)
+                self._blit_widget(self.cooldown_texts[i].set(round(cooldown, 1)))
             else:
                 # Ready - show key
-                key_surf = self.font.render(key, True, ability_colors[i])
-                key_rect = key_surf.get_rect(center=(x + slot_size // 2, y + slot_size // 2))
-                self.screen.blit(key_surf, key_rect)
-
-            # Ability name below
-            name_surf = self.small_font.render(ability_names[i], True, (150, 150, 150))
-            name_rect = name_surf.get_rect(center=(x + slot_size // 2, y + slot_size + 15))
-            self.screen.blit(name_surf, name_rect)
+                self._blit_widget(self.key_texts[i])
 
     def _render_damage_numbers(self, camera_offset: tuple[float, float] = (0, 0)):
-        """Render floating damage numbers"""
+        """Queue floating damage numbers (composed from cached digit glyphs)"""
         from src.systems.screen_effects import DamageNumber
         damage_entities = self.get_entities(DamageNumber, Position)
+        ui_layer = self.render_layers[LAYER_UI]
+
+        # Color/size based on damage type
+        normal_atlas = asset_manager.get_glyph_atlas(24, (255, 100, 100))    # Red for normal
+        critical_atlas = asset_manager.get_glyph_atlas(32, (255, 215, 0))    # Gold for critical
 
-        if not self.font:
-            self.font = pygame.font.Font(None, 24)
+        left, top, right, bottom = self.view_bounds
 
         for entity in damage_entities:
             damage_num = entity.get_component(DamageNumber)
             pos = entity.get_component(Position)
 
+            if not (left <= pos.x <= right and top <= pos.y <= bottom):
+                continue
+
             # Apply camera offset
             render_x = int(pos.x + camera_offset[0])
             render_y = int(pos.y + camera_offset[1])
@@ -399,36 +518,15 @@ class RenderSystem(System):
             alpha = int(255 * (1.0 - damage_num.elapsed / damage_num.lifetime))
             alpha = max(0, min(255, alpha))
 
-            # Color based on damage type
-            if damage_num.is_critical:
-                color = (255, 215, 0)  # Gold for critical
-                font_size = 32
-            else:
-                color = (255, 100, 100)  # Red for normal
-                font_size = 24
-
-            # Create font and render text
-            damage_font = pygame.font.Font(None, font_size)
-            damage_text = str(int(damage_num.damage))
-            damage_surf = damage_font.render(damage_text, True, color)
-
-            # Apply alpha
-            damage_surf.set_alpha(alpha)
-
-            # Center text on position
-            text_rect = damage_surf.get_rect(center=(render_x, render_y))
-            self.screen.blit(damage_surf, text_rect)
+            atlas = critical_atlas if damage_num.is_critical else normal_atlas
+            atlas.compose(str(int(damage_num.damage)), (render_x, render_y), alpha, ui_layer)
 
     def _render_fps(self, fps: float):
         """Render FPS counter"""
-        if not self.font:
-            self.font = pygame.font.Font(None, 24)
-
         fps_text = f"FPS: {int(fps)}"
-        fps_surf = self.font.render(fps_text, True, (100, 100, 100))
-        text_rect = fps_surf.get_rect()
-        text_rect.topright = (WINDOW_WIDTH - 20, WINDOW_HEIGHT - 30)
-        self.screen.blit(fps_surf, text_rect)
+        if DEBUG_MODE:
+            fps_text += f"  CULLED: {profiler.get('culled')}  DROPPED: {profiler.get('dropped')}"
+        self._blit_widget(self.fps_text.set(fps_text))
 
 
 # === UI/UX DESIGNER NOTE ===
@@ -439,3 +537,9 @@ class RenderSystem(System):
 # - Minimal HUD keeps focus on gameplay
 # - Health bars only show when damaged
 # - Clean, readable fonts
+# - Layered render list: hazards < pickups < enemies < projectiles < player < VFX < UI < HUD
+# - Command lists are double-buffered so the render stage can draw on its own thread
+# - Sprites blit area= sub-rects of the packed atlas pages when an atlas is built
+# - RENDER_SCALE > 1: sprite layers go to a low-res target, bars/numbers/HUD stay native
+# - Off-screen entities culled against the camera view before any surface work
+# - Retained HUD: static parts baked once, text widgets re-render only on change
@@ -9,6 +9,7 @@ import random
 import math
 from src.core.ecs import System, Component
 from src.components.components import *
+from config.settings import DAMAGE_MERGE_RADIUS, DAMAGE_COALESCE_WINDOW, DAMAGE_NUMBER_SPAWN_BUDGET
 
 
 class ScreenShake(Component):
@@ -76,6 +77,12 @@ class ScreenEffectsSystem(System):
         else:
             self.camera_offset = (0, 0)
 
+        # Hand the shake to the camera (applied once to the finished world image)
+        from src.core.camera import Camera
+        camera = self.world.get_resource(Camera)
+        if camera is not None:
+            camera.shake = (int(self.camera_offset[0]), int(self.camera_offset[1]))
+
         # Update hit flash effects
         entities_with_flash = self.get_entities(HitFlash)
         for entity in entities_with_flash:
@@ -92,10 +99,6 @@ class ScreenEffectsSystem(System):
         else:
             self.screen_shake = ScreenShake(intensity, duration)
 
-    def get_camera_offset(self) -> tuple[float, float]:
-        """Get current camera offset for rendering"""
-        return self.camera_offset
-
 
 class HitFlashSystem(System):
     """Add flash effects when entities take damage"""
@@ -148,6 +151,7 @@ class DamageNumber(Component):
         self.lifetime = 1.0
         self.elapsed = 0.0
         self.velocity_y = -50  # Float upward
+        self.target_id = None  # Entity whose hits accumulate here
 
     def update(self, dt: float) -> bool:
         """Update lifetime, return True if expired"""
@@ -156,14 +160,22 @@ class DamageNumber(Component):
 
 
 class DamageNumberSystem(System):
-    """Display floating damage numbers"""
+    """
+    Display floating damage numbers
+    Hits on one target within DAMAGE_COALESCE_WINDOW add up in a single number;
+    at most DAMAGE_NUMBER_SPAWN_BUDGET new numbers appear per frame.
+    """
 
     def __init__(self, world):
         super().__init__(world)
         self.priority = 42  # After hit flash
+        self.by_target = {}  # Target entity id -> its accumulating number entity
+        self.spawned = 0     # New numbers since the last update
+        world.add_resource(self)  # Looked up per hit: no system scan
 
     def update(self, dt: float):
         """Update damage numbers"""
+        self.spawned = 0
         damage_entities = self.get_entities(DamageNumber, Position)
 
         for entity in damage_entities:
@@ -176,17 +188,86 @@ class DamageNumberSystem(System):
             # Check lifetime
             if damage_num.update(dt):
                 self.world.destroy_entity(entity)
+                if self.by_target.get(damage_num.target_id) is entity:
+                    del self.by_target[damage_num.target_id]
+
+    def coalesce(self, target_id: str, x: float, y: float, damage: float, is_critical: bool):
+        """Add a hit to the target's recent number (re-anchored, fade restarted); None if there is none"""
+        entity = self.by_target.get(target_id)
+        if entity is None or not entity.active:
+            return None
+
+        number = entity.components[DamageNumber]
+        if number.elapsed > DAMAGE_COALESCE_WINDOW:
+            return None  # Hits stopped for a while: the old number floats away on its own
+
+        number.damage += damage
+        number.is_critical = number.is_critical or is_critical
+        number.elapsed = 0.0
+        pos = entity.components[Position]
+        pos.x, pos.y = x, y
+        return entity
+
+
+def get_damage_number_system(world):
+    """The world's DamageNumberSystem, if it has one"""
+    return world.get_resource(DamageNumberSystem)
+
+
+def create_damage_number(world, x: float, y: float, damage: float, is_critical: bool = False,
+                         target=None):
+    """
+    Create floating damage number
+    With a target, hits within the coalesce window accumulate on one number;
+    over the per-frame or live budget, damage merges into the nearest live number
+    """
+    numbers = get_damage_number_system(world)
+    if numbers is not None and target is not None:
+        merged = numbers.coalesce(target.id, x, y, damage, is_critical)
+        if merged is not None:
+            return merged
+
+    if numbers is not None and numbers.spawned >= DAMAGE_NUMBER_SPAWN_BUDGET:
+        from src.systems.budget_system import BudgetSystem
+        BudgetSystem.report("damage_numbers", 1)
+        return _merge_damage_number(world, x, y, damage, is_critical)
+
+    from src.systems.budget_system import request_budget
+    if not request_budget(world, "damage_numbers"):
+        return _merge_damage_number(world, x, y, damage, is_critical)
 
-
-def create_damage_number(world, x: float, y: float, damage: float, is_critical: bool = False):
-    """Create floating damage number"""
     entity = world.create_entity()
     entity.add_component(Position(x, y))
     entity.add_component(DamageNumber(damage, is_critical))
     entity.add_component(Tag("damage_number"))
+
+    if numbers is not None:
+        numbers.spawned += 1
+        if target is not None:
+            entity.components[DamageNumber].target_id = target.id
+            numbers.by_target[target.id] = entity
     return entity
 
 
+def _merge_damage_number(world, x: float, y: float, damage: float, is_critical: bool):
+    """Add damage to the closest live number within DAMAGE_MERGE_RADIUS (dropped if none)"""
+    nearest = None
+    nearest_dist = DAMAGE_MERGE_RADIUS * DAMAGE_MERGE_RADIUS
+    for entity in world.get_entities_with_components(DamageNumber, Position):
+        pos = entity.components[Position]
+        dist = (pos.x - x) ** 2 + (pos.y - y) ** 2
+        if dist <= nearest_dist:
+            nearest, nearest_dist = entity, dist
+
+    if nearest is None:
+        return None
+
+    number = nearest.components[DamageNumber]
+    number.damage += damage
+    number.is_critical = number.is_critical or is_critical
+    return nearest
+
+
 # Trigger screen shake on specific events
 def trigger_screen_shake(world, intensity: float, duration: float):
     """Trigger screen shake effect"""
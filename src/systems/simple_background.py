@@ -5,49 +5,62 @@ Matrix Team: UI/UX Designer + Technical Director
 Sprint 27: Visual clarity improvements - tiled background
 """
 
+from functools import partial
+
 import pygame
 from src.core.ecs import System
-from config.settings import WINDOW_WIDTH, WINDOW_HEIGHT
+from src.core.dirty_rects import dirty_rects
+from src.core.render_pipeline import render_pipeline
+from src.core.textures import varied_fill
+from config.settings import (
+    WINDOW_WIDTH, WINDOW_HEIGHT, WORLD_WIDTH, WORLD_HEIGHT, RENDER_SCALE,
+    BACKGROUND_CHUNK_SIZE, BACKGROUND_CHUNK_MARGIN
+)
+
+
+# Stone tile variants mixed across the world (variant 0 is the original tile)
+TILE_VARIANTS = 4
 
 
 class SimpleBackgroundSystem(System):
-    """Simple tiled background for maximum gameplay clarity (Vampire Survivors style)"""
+    """
+    Simple tiled background for maximum gameplay clarity (Vampire Survivors style)
+    The world floor is cached in chunks, built from the tiles around the camera
+    and evicted once the camera has moved far away.
+    """
 
     def __init__(self, world, screen: pygame.Surface):
         super().__init__(world)
-        self.priority = 1  # Render first (before everything)
+        self.priority = 12  # Render first (before everything), once the camera has followed the player
         self.screen = screen
 
-        # Create gothic stone tile texture
+        # Low-resolution world target: chunks are built at 1/RENDER_SCALE
+        self.scale = RENDER_SCALE if screen.get_size() != (WINDOW_WIDTH, WINDOW_HEIGHT) else 1
+
+        # Create gothic stone tile textures
         self.tile_size = 64
-        self.tile = self._create_gothic_tile()
+        self.tiles = [self._create_gothic_tile(42 + variant) for variant in range(TILE_VARIANTS)]
 
-        # Pre-render tiled background surface for performance
-        self.background_surface = self._create_tiled_background()
+        # Chunk cache: (chunk x, chunk y) -> Surface
+        self.chunk_size = BACKGROUND_CHUNK_SIZE
+        self.chunk_pixels = -(-self.chunk_size // self.scale)
+        self.chunks = {}
+        self.chunk_columns = -(-WORLD_WIDTH // self.chunk_size)
+        self.chunk_rows = -(-WORLD_HEIGHT // self.chunk_size)
 
-    def _create_gothic_tile(self) -> pygame.Surface:
-        """Create a gothic stone tile texture"""
-        tile = pygame.Surface((self.tile_size, self.tile_size))
+        # Visible chunk blits for the current camera offset
+        self.view_offset = None
+        self.chunk_blits = []
 
-        # Base dark stone color
+        # Dirty-rect mode: the view composed from chunks, restored under last frame's rects
+        self.background_surface = pygame.Surface(screen.get_size())
+        self.composed_offset = None
+
+    def _create_gothic_tile(self, seed: int = 42) -> pygame.Surface:
+        """Create a gothic stone tile texture"""
+        # Base dark stone color with subtle texture variation (10% of pixels, +-5)
         base_color = (20, 15, 25)  # Dark purple-gray
-        tile.fill(base_color)
-
-        # Add subtle texture variation
-        import random
-        random.seed(42)  # Consistent pattern
-
-        for y in range(self.tile_size):
-            for x in range(self.tile_size):
-                # Add random slight color variation for texture
-                if random.random() < 0.1:
-                    variation = random.randint(-5, 5)
-                    color = (
-                        max(0, min(255, base_color[0] + variation)),
-                        max(0, min(255, base_color[1] + variation)),
-                        max(0, min(255, base_color[2] + variation))
-                    )
-                    tile.set_at((x, y), color)
+        tile = varied_fill((self.tile_size, self.tile_size), base_color, 0.1, 5, seed)  # Consistent per variant
 
         # Draw tile borders (subtle)
         border_color = (30, 25, 35)  # Slightly lighter
@@ -62,21 +75,116 @@ class SimpleBackgroundSystem(System):
 
         return tile
 
-    def _create_tiled_background(self) -> pygame.Surface:
-        """Create full tiled background surface"""
-        bg = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-
-        # Tile across entire screen
-        for y in range(0, WINDOW_HEIGHT, self.tile_size):
-            for x in range(0, WINDOW_WIDTH, self.tile_size):
-                bg.blit(self.tile, (x, y))
-
-        return bg
+    def _tile_variant(self, tile_x: int, tile_y: int) -> pygame.Surface:
+        """Stable tile choice for a world tile coordinate"""
+        return self.tiles[((tile_x * 73856093) ^ (tile_y * 19349663)) % TILE_VARIANTS]
+
+    def _create_chunk(self, chunk_x: int, chunk_y: int) -> pygame.Surface:
+        """Tile one world chunk"""
+        chunk = pygame.Surface((self.chunk_size, self.chunk_size))
+        first_x = chunk_x * self.chunk_size // self.tile_size
+        first_y = chunk_y * self.chunk_size // self.tile_size
+
+        for y in range(0, self.chunk_size, self.tile_size):
+            for x in range(0, self.chunk_size, self.tile_size):
+                chunk.blit(self._tile_variant(first_x + x // self.tile_size,
+                                              first_y + y // self.tile_size), (x, y))
+
+        # Low-resolution world target: shrink once, upscaled with the sprites every frame
+        if self.scale != 1:
+            chunk = pygame.transform.scale(chunk, (self.chunk_pixels, self.chunk_pixels))
+
+        return chunk.convert(self.screen)
+
+    def _stream_chunks(self, offset: tuple) -> list:
+        """Load chunks around the view, evict far ones, return the visible chunk blits"""
+        view_x, view_y = -offset[0], -offset[1]
+        first_x = max(0, view_x // self.chunk_size)
+        first_y = max(0, view_y // self.chunk_size)
+        last_x = min(self.chunk_columns - 1, (view_x + WINDOW_WIDTH - 1) // self.chunk_size)
+        last_y = min(self.chunk_rows - 1, (view_y + WINDOW_HEIGHT - 1) // self.chunk_size)
+
+        # Stream in the view plus a margin ring (camera rarely waits on a new chunk)
+        margin = BACKGROUND_CHUNK_MARGIN
+        for chunk_y in range(max(0, first_y - margin), min(self.chunk_rows, last_y + margin + 1)):
+            for chunk_x in range(max(0, first_x - margin), min(self.chunk_columns, last_x + margin + 1)):
+                if (chunk_x, chunk_y) not in self.chunks:
+                    self.chunks[(chunk_x, chunk_y)] = self._create_chunk(chunk_x, chunk_y)
+
+        # Evict one ring further out (no thrashing when the camera hovers on a boundary)
+        keep = margin + 1
+        for key in [key for key in self.chunks
+                    if not (first_x - keep <= key[0] <= last_x + keep
+                            and first_y - keep <= key[1] <= last_y + keep)]:
+            del self.chunks[key]
+
+        return self._view_blits(offset)
+
+    def _view_blits(self, offset: tuple) -> list:
+        """Blits of the loaded chunks under the view at offset, in target pixels"""
+        view_x, view_y = -offset[0], -offset[1]
+        first_x = max(0, view_x // self.chunk_size)
+        first_y = max(0, view_y // self.chunk_size)
+        last_x = min(self.chunk_columns - 1, (view_x + WINDOW_WIDTH - 1) // self.chunk_size)
+        last_y = min(self.chunk_rows - 1, (view_y + WINDOW_HEIGHT - 1) // self.chunk_size)
+
+        scale = self.scale
+        blits = []
+        for chunk_y in range(first_y, last_y + 1):
+            for chunk_x in range(first_x, last_x + 1):
+                chunk = self.chunks.get((chunk_x, chunk_y))
+                if chunk is not None:
+                    blits.append((chunk, (int((chunk_x * self.chunk_size + offset[0]) / scale),
+                                          int((chunk_y * self.chunk_size + offset[1]) / scale))))
+        return blits
 
     def update(self, dt: float):
-        """Render static tiled background"""
-        # Blit pre-rendered background (very fast)
-        self.screen.blit(self.background_surface, (0, 0))
+        """Render the world floor under the camera"""
+        from src.systems.camera_system import get_camera
+        camera = get_camera(self.world)
+        offset = camera.get_offset() if camera else (0, 0)
+
+        if offset != self.view_offset:
+            self.view_offset = offset
+            self.chunk_blits = self._stream_chunks(offset)
+            dirty_rects.invalidate()  # Camera moved: whole view changes
+
+        # Blit cached chunks (very fast), on the render stage
+        render_pipeline.draw(partial(self._draw_background, self.chunk_blits, offset))
+        render_pipeline.backdrop(partial(self._fill_shake_bands, offset))
+
+    def _draw_background(self, chunk_blits: list, offset: tuple):
+        """Chunk blits; dirty-rect mode only restores regions drawn over last frame"""
+        if not dirty_rects.enabled:
+            self.screen.blits(chunk_blits, doreturn=False)
+            return
+
+        if offset != self.composed_offset:
+            self.background_surface.blits(chunk_blits, doreturn=False)
+            self.composed_offset = offset
+        dirty_rects.restore_background(self.screen, self.background_surface)
+
+    def _fill_shake_bands(self, offset: tuple, target: pygame.Surface, bands: list, shake: tuple):
+        """Floor under the window edges a screen shake scrolled away (margin-ring chunks)"""
+        # The shaken picture shows the floor as if the camera were offset by the shake
+        blits = self._view_blits((offset[0] + shake[0], offset[1] + shake[1]))
+        scale = self.scale
+        clip = target.get_clip()
+
+        for band in bands:
+            target.set_clip(band)
+            if scale == 1:
+                target.blits(blits, doreturn=False)
+                continue
+
+            # Low-resolution chunks: compose the band at 1/scale, upscale it into place
+            left, top = band.x // scale, band.y // scale
+            small = pygame.Surface((-(-band.right // scale) - left, -(-band.bottom // scale) - top))
+            small.blits([(chunk, (x - left, y - top)) for chunk, (x, y) in blits], doreturn=False)
+            target.blit(pygame.transform.scale(small, (small.get_width() * scale, small.get_height() * scale)),
+                        (left * scale, top * scale))
+
+        target.set_clip(clip)
 
 
 # === UI/UX DESIGNER NOTE ===
@@ -86,3 +194,7 @@ class SimpleBackgroundSystem(System):
 # - Simple solid color background
 # - Vampire Survivors approach: gameplay clarity > visual flair
 # - Result: Players can easily see projectiles and enemies
+# Large world: floor streamed in BACKGROUND_CHUNK_SIZE chunks around the camera
+# - Tile variants picked per world tile, so chunks differ and stay stable when rebuilt
+# - Only the camera view is drawn; chunks beyond the margin ring are dropped
+# - Screen shake edge bands are refilled from the margin ring (no duplicated strips)
@@ -0,0 +1,97 @@
+"""
+DARK SANCTUM - Spatial Index & Targeting System
+Matrix Team: Technical Director + Developer
+
+Per-frame spatial index of enemies and shared nearest-target queries
+"""
+
+import heapq
+from typing import List, Tuple
+from src.core.ecs import System, Entity
+from src.core.spatial_index import SpatialHash
+from src.components.components import Enemy, Position, Health
+from config.settings import SPATIAL_CELL_SIZE
+
+
+# Default targeting filter (what the enemy index holds)
+ENEMY_TARGETS = (Enemy, Position, Health)
+
+
+class SpatialIndexSystem(System):
+    """Rebuild the enemy spatial index once per frame and serve targeting queries"""
+
+    def __init__(self, world, cell_size: float = SPATIAL_CELL_SIZE):
+        super().__init__(world)
+        self.priority = 20  # After movement, before AI and weapons
+        self.enemy_index = SpatialHash(cell_size)
+
+        # (x, y, filters) -> (k requested, nearest entities); reset every frame
+        self._nearest_cache = {}
+
+    def update(self, dt: float):
+        """Re-index all living enemy positions"""
+        self.enemy_index.rebuild(self.get_entities(*ENEMY_TARGETS), Position)
+        self._nearest_cache.clear()
+
+    def nearest_k(self, position: Position, k: int, filters: Tuple = ENEMY_TARGETS) -> List[Entity]:
+        """k nearest entities to position (closest first), shared by everyone firing this frame"""
+        key = (position.x, position.y, filters)
+        cached = self._nearest_cache.get(key)
+        if cached is None or cached[0] < k:
+            cached = self._query(key, position, k, filters)
+
+        targets = [entity for entity in cached[1][:k] if entity.active]
+        if len(targets) < min(k, len(cached[1])):
+            # Some died since the cached query (combat, death): re-query the survivors
+            targets = self._query(key, position, k, filters)[1]
+        return targets
+
+    def _query(self, key: Tuple, position: Position, k: int, filters: Tuple) -> Tuple[int, List[Entity]]:
+        """Run a nearest query (the index skips inactive entries) and cache it for the frame"""
+        if filters == ENEMY_TARGETS:
+            index = self.enemy_index
+            targets = [index.entities[slot] for _, slot in index.nearest(position.x, position.y, k)]
+        else:
+            targets = select_nearest(self.get_entities(*filters), position, k)
+        cached = (k, targets)
+        self._nearest_cache[key] = cached
+        return cached
+
+
+def select_nearest(entities: List[Entity], position: Position, k: int) -> List[Entity]:
+    """Partial selection of the k closest entities on squared distance (O(n log k))"""
+    px, py = position.x, position.y
+
+    def distance_sq(entity):
+        pos = entity.components[Position]
+        dx = pos.x - px
+        dy = pos.y - py
+        return dx * dx + dy * dy
+
+    return heapq.nsmallest(k, entities, key=distance_sq)
+
+
+def nearest_k(world, position: Position, k: int, filters: Tuple = ENEMY_TARGETS) -> List[Entity]:
+    """Shared targeting service: k nearest entities matching filters"""
+    for system in world.systems:
+        if isinstance(system, SpatialIndexSystem):
+            return system.nearest_k(position, k, filters)
+
+    # No index registered: linear partial selection
+    return select_nearest(world.get_entities_with_components(*filters), position, k)
+
+
+def get_enemy_index(world) -> SpatialHash:
+    """Get this frame's enemy index (builds a temporary one if no system is registered)"""
+    for system in world.systems:
+        if isinstance(system, SpatialIndexSystem):
+            return system.enemy_index
+
+    index = SpatialHash(SPATIAL_CELL_SIZE)
+    index.rebuild(world.get_entities_with_components(*ENEMY_TARGETS), Position)
+    return index
+
+
+# === TECHNICAL DIRECTOR NOTE ===
+# Enemies spawned later in the frame become targetable on the next rebuild
+# Systems running before priority 20 (ability input) see last frame's index
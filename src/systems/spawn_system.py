@@ -7,6 +7,7 @@ Wave-based enemy spawning like Vampire Survivors but MORE tactical
 
 import math
 import random
+import numpy as np
 from src.core.ecs import System
 from src.components.components import *
 from config.settings import *
@@ -94,9 +95,9 @@ class WaveSpawnSystem(System):
         x = player_pos.x + math.cos(angle) * distance
         y = player_pos.y + math.sin(angle) * distance
 
-        # Clamp to screen bounds with padding
-        x = max(50, min(WINDOW_WIDTH - 50, x))
-        y = max(50, min(WINDOW_HEIGHT - 50, y))
+        # Clamp to world bounds with padding
+        x = max(50, min(WORLD_WIDTH - 50, x))
+        y = max(50, min(WORLD_HEIGHT - 50, y))
 
         # 10% chance to spawn elite (after wave 3)
         is_elite = False
@@ -121,9 +122,9 @@ class WaveSpawnSystem(System):
         x = player_pos.x + math.cos(angle) * distance
         y = player_pos.y + math.sin(angle) * distance
 
-        # Clamp to screen bounds
-        x = max(100, min(WINDOW_WIDTH - 100, x))
-        y = max(100, min(WINDOW_HEIGHT - 100, y))
+        # Clamp to world bounds
+        x = max(100, min(WORLD_WIDTH - 100, x))
+        y = max(100, min(WORLD_HEIGHT - 100, y))
 
         # Create boss entity
         boss = self.world.create_entity()
@@ -162,7 +163,9 @@ class WaveSpawnSystem(System):
 
 
 class AISystem(System):
-    """Simple chase AI for enemies"""
+    """Chase and ranged AI for enemies (vectorized with NumPy)"""
+
+    ENEMY_PROJECTILE_SPEED = 200
 
     def __init__(self, world):
         super().__init__(world)
@@ -176,96 +179,99 @@ class AISystem(System):
             return
 
         player_pos = player_entities[0].get_component(Position)
+        target = np.array((player_pos.x, player_pos.y))
 
         # Update all chase AI
         chase_entities = self.get_entities(AIChase, Position, Velocity)
-
-        for entity in chase_entities:
-            # Check if slowed
-            slow_mult = 1.0
-            if entity.has_component(Slowed):
-                slowed = entity.get_component(Slowed)
-                slow_mult = 1.0 - slowed.slow_percent
-
-            ai = entity.get_component(AIChase)
-            pos = entity.get_component(Position)
-            vel = entity.get_component(Velocity)
-
-            # Calculate direction to player
-            dx = player_pos.x - pos.x
-            dy = player_pos.y - pos.y
-            dist = math.sqrt(dx * dx + dy * dy)
-
-            if dist > 0:
-                # Normalize and apply speed (with slow)
-                vel.vx = (dx / dist) * ai.speed * slow_mult
-                vel.vy = (dy / dist) * ai.speed * slow_mult
+        if chase_entities:
+            self._update_chase(chase_entities, target)
 
         # Update ranged AI
         ranged_entities = self.get_entities(AIRanged, Position, Velocity, Team, Damage)
-
-        for entity in ranged_entities:
-            # Check if slowed
-            slow_mult = 1.0
-            if entity.has_component(Slowed):
-                slowed = entity.get_component(Slowed)
-                slow_mult = 1.0 - slowed.slow_percent
-
-            ai = entity.get_component(AIRanged)
-            pos = entity.get_component(Position)
-            vel = entity.get_component(Velocity)
-            team = entity.get_component(Team)
-            damage = entity.get_component(Damage)
-
-            # Calculate distance to player
-            dx = player_pos.x - pos.x
-            dy = player_pos.y - pos.y
-            dist = math.sqrt(dx * dx + dy * dy)
-
-            if dist > 0:
-                # If too close, move away
-                if dist < ai.keep_distance:
-                    # Move away from player
-                    vel.vx = -(dx / dist) * ai.speed * slow_mult
-                    vel.vy = -(dy / dist) * ai.speed * slow_mult
-                # If far enough, stop
-                elif dist > ai.keep_distance + 50:
-                    # Move toward player (but slowly)
-                    vel.vx = (dx / dist) * ai.speed * 0.5 * slow_mult
-                    vel.vy = (dy / dist) * ai.speed * 0.5 * slow_mult
-                else:
-                    # Stay still
-                    vel.vx = 0
-                    vel.vy = 0
-
-                # Attack if in range
-                ai.time_since_attack += dt
-                if dist <= ai.attack_range and ai.time_since_attack >= ai.attack_cooldown:
-                    self._shoot_projectile(pos, player_pos, team.team, damage.amount)
-                    ai.time_since_attack = 0.0
-
-    def _shoot_projectile(self, from_pos: Position, to_pos: Position, team: str, damage: float):
-        """Create enemy projectile"""
-        # Calculate direction
-        dx = to_pos.x - from_pos.x
-        dy = to_pos.y - from_pos.y
-        dist = math.sqrt(dx * dx + dy * dy)
-
-        if dist == 0:
-            return
-
-        dx /= dist
-        dy /= dist
-
-        # Create projectile
-        speed = 200  # Enemy projectile speed
-        projectile = self.world.create_entity()
-        projectile.add_component(Position(from_pos.x, from_pos.y))
-        projectile.add_component(Velocity(dx * speed, dy * speed))
-        projectile.add_component(Size(6, 6))
-        projectile.add_component(Sprite(RANGED_ENEMY_COLOR, radius=3))
-        projectile.add_component(Projectile(team, damage, lifetime=5.0))
-        projectile.add_component(Tag("projectile"))
+        if ranged_entities:
+            self._update_ranged(ranged_entities, target, dt)
+
+    def _pack(self, entities: list, ai_type) -> tuple:
+        """Pack AI components into (ai list, positions, speeds, slow multipliers)"""
+        ais = [entity.components[ai_type] for entity in entities]
+        positions = np.array([(entity.components[Position].x, entity.components[Position].y)
+                              for entity in entities], dtype=float)
+        speeds = np.fromiter((ai.speed for ai in ais), dtype=float, count=len(ais))
+
+        # Slowed enemies move at (1 - slow_percent) speed
+        slow_mult = np.fromiter(
+            (1.0 - slowed.slow_percent if slowed else 1.0
+             for slowed in (entity.components.get(Slowed) for entity in entities)),
+            dtype=float, count=len(entities)
+        )
+
+        return ais, positions, speeds, slow_mult
+
+    def _write_velocities(self, entities: list, velocities: np.ndarray, mask: np.ndarray):
+        """Scatter velocity rows back into Velocity components where mask is set"""
+        for entity, (vx, vy), apply in zip(entities, velocities.tolist(), mask.tolist()):
+            if apply:
+                vel = entity.components[Velocity]
+                vel.vx = vx
+                vel.vy = vy
+
+    def _update_chase(self, entities: list, target: np.ndarray):
+        """Steer every chaser straight at the player"""
+        _, positions, speeds, slow_mult = self._pack(entities, AIChase)
+
+        # Directions and distances for all chasers at once
+        delta = target - positions
+        dist = np.hypot(delta[:, 0], delta[:, 1])
+        moving = dist > 0
+
+        # Normalize and apply speed (with slow)
+        scale = np.divide(speeds * slow_mult, dist, out=np.zeros_like(dist), where=moving)
+        self._write_velocities(entities, delta * scale[:, None], moving)
+
+    def _update_ranged(self, entities: list, target: np.ndarray, dt: float):
+        """Kite at keep-distance and collect attackers ready to fire"""
+        ais, positions, speeds, slow_mult = self._pack(entities, AIRanged)
+        keep_distance = np.fromiter((ai.keep_distance for ai in ais), dtype=float, count=len(ais))
+        attack_range = np.fromiter((ai.attack_range for ai in ais), dtype=float, count=len(ais))
+        attack_cooldown = np.fromiter((ai.attack_cooldown for ai in ais), dtype=float, count=len(ais))
+        time_since_attack = np.fromiter((ai.time_since_attack for ai in ais), dtype=float, count=len(ais))
+
+        delta = target - positions
+        dist = np.hypot(delta[:, 0], delta[:, 1])
+        valid = dist > 0
+        direction = np.divide(delta, dist[:, None], out=np.zeros_like(delta), where=valid[:, None])
+
+        # Too close: back away. Too far: approach (but slowly). Otherwise hold still.
+        too_close = dist < keep_distance
+        too_far = dist > keep_distance + 50
+        factor = np.select([too_close, too_far], [-speeds, speeds * 0.5], default=0.0) * slow_mult
+        self._write_velocities(entities, direction * factor[:, None], valid)
+
+        # Attack if in range
+        time_since_attack = np.where(valid, time_since_attack + dt, time_since_attack)
+        ready = valid & (dist <= attack_range) & (time_since_attack >= attack_cooldown)
+        time_since_attack[ready] = 0.0
+
+        for ai, elapsed in zip(ais, time_since_attack.tolist()):
+            ai.time_since_attack = elapsed
+
+        if ready.any():
+            shooters = [entity for entity, fire in zip(entities, ready.tolist()) if fire]
+            self._shoot_projectiles(shooters, positions[ready], direction[ready])
+
+    def _shoot_projectiles(self, shooters: list, origins: np.ndarray, directions: np.ndarray):
+        """Hand a batch of enemy shots to the bulk projectile spawner"""
+        from src.entities.factory import EntityFactory
+        factory = EntityFactory(self.world)
+        factory.create_projectiles(
+            origins.tolist(),
+            (directions * self.ENEMY_PROJECTILE_SPEED).tolist(),
+            [shooter.components[Team].team for shooter in shooters],
+            [shooter.components[Damage].amount for shooter in shooters],
+            RANGED_ENEMY_COLOR,
+            size=6,
+            lifetime=5.0
+        )
 
 
 class DeathSystem(System):
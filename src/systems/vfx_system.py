@@ -8,9 +8,14 @@ Sprint 23: Advanced visual effects for weapons and abilities
 import pygame
 import math
 import random
+import copy
+from functools import partial
 from src.core.ecs import System
 from src.components.components import *
 from config.settings import *
+from src.core.profiler import profiler
+from src.core.dirty_rects import dirty_rects
+from src.core.render_pipeline import render_pipeline
 
 
 class VFXSystem(System):
@@ -60,9 +65,20 @@ class VFXRenderer(System):
         super().__init__(world)
         self.priority = 98  # Just before main render
         self.screen = screen
+        self.view_bounds = None
+        self.camera_offset = (0, 0)
+
+        # Trail dot sprites per color, indexed by radius (1-4)
+        self.trail_dots = {}
 
     def update(self, dt: float):
         """Render all VFX"""
+        from src.systems.render_system import get_view_bounds
+        from src.systems.camera_system import get_camera
+        camera = get_camera(self.world)
+        self.camera_offset = camera.get_offset() if camera else (0, 0)
+        self.view_bounds = get_view_bounds(self.camera_offset)
+
         # Render trails
         self._render_trails()
 
@@ -72,63 +88,77 @@ class VFXRenderer(System):
         # Render impact effects
         self._render_impacts()
 
+    def _in_view(self, x: float, y: float, margin: float = 0) -> bool:
+        """Is a point inside the (padded) camera view"""
+        left, top, right, bottom = self.view_bounds
+        return left - margin <= x <= right + margin and top - margin <= y <= bottom + margin
+
+    def _blit_batch(self, render_list: list):
+        """One batched blit, recording dirty rects (runs on the render stage)"""
+        rects = self.screen.blits(render_list, doreturn=dirty_rects.enabled)
+        if rects:
+            dirty_rects.mark_many(rects)
+
+    def _get_trail_dots(self, color: tuple) -> list:
+        """Dot sprites for one trail color, index = radius"""
+        dots = self.trail_dots.get(color)
+        if dots is None:
+            from src.core.asset_manager import asset_manager
+            dots = [None] + [asset_manager.get_circle_sprite(color, size) for size in range(1, 5)]
+            self.trail_dots[color] = dots
+        return dots
+
     def _render_trails(self):
-        """Render trail effects"""
+        """Render trail effects (cached dot sprites, one batched blits per frame)"""
         trail_entities = self.get_entities(TrailEffect, Position)
+        render_list = []
+        append = render_list.append
+        offset_x, offset_y = self.camera_offset
 
         for entity in trail_entities:
             trail = entity.get_component(TrailEffect)
 
+            # Cull whole trail when no segment is on-screen
+            if not any(self._in_view(x, y) for x, y, _ in trail.positions):
+                profiler.count("culled")
+                continue
+
             # Draw trail segments
+            dots = self._get_trail_dots(trail.color)
+            count = len(trail.positions)
             for i, (x, y, alpha) in enumerate(trail.positions):
                 if alpha <= 0:
                     continue
 
                 # Size decreases along trail
-                size = max(1, int((i + 1) / len(trail.positions) * 4))
+                size = max(1, int((i + 1) / count * 4))
+                append((dots[size], (int(x + offset_x) - size, int(y + offset_y) - size)))
 
-                # Create surface with alpha
-                color_with_alpha = (*trail.color, int(alpha))
-
-                # Draw circle for each trail segment
-                pygame.draw.circle(
-                    self.screen,
-                    trail.color,
-                    (int(x), int(y)),
-                    size
-                )
+        if render_list:
+            render_pipeline.draw(partial(self._blit_batch, render_list))
 
     def _render_glows(self):
-        """Render glow effects"""
+        """Render glow effects (pre-rendered per quantized radius/color/intensity)"""
+        from src.core.asset_manager import asset_manager
         glow_entities = self.get_entities(GlowEffect, Position, Size)
+        render_list = []
+        offset_x, offset_y = self.camera_offset
 
         for entity in glow_entities:
             glow = entity.get_component(GlowEffect)
             pos = entity.get_component(Position)
             size = entity.get_component(Size)
 
-            intensity = glow.get_current_intensity()
-
-            # Draw multiple circles for glow effect
-            for i in range(3):
-                radius = int(size.width / 2 + i * 5 * intensity)
-                alpha = int(100 * intensity * (1.0 - i / 3.0))
-
-                # Create glow surface
-                glow_surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
-                pygame.draw.circle(
-                    glow_surface,
-                    (*glow.color, alpha),
-                    (radius, radius),
-                    radius
-                )
-
-                # Blit to screen
-                self.screen.blit(
-                    glow_surface,
-                    (int(pos.x - radius), int(pos.y - radius)),
-                    special_flags=pygame.BLEND_ADD
-                )
+            if not self._in_view(pos.x, pos.y, size.width):
+                profiler.count("culled")
+                continue
+
+            sprite, outer = asset_manager.get_glow_sprite(glow.color, size.width / 2,
+                                                          glow.get_current_intensity())
+            render_list.append((sprite, (int(pos.x + offset_x - outer), int(pos.y + offset_y - outer)), None, pygame.BLEND_ADD))
+
+        if render_list:
+            render_pipeline.draw(partial(self._blit_batch, render_list))
 
     def _render_impacts(self):
         """Render impact effects"""
@@ -138,13 +168,23 @@ class VFXRenderer(System):
             impact = entity.get_component(ImpactEffect)
             pos = entity.get_component(Position)
 
+            if not self._in_view(pos.x, pos.y):
+                profiler.count("culled")
+                continue
+
             # Different rendering based on effect type
+            # Drawn on the render stage from screen-space copies (the simulation keeps mutating the originals)
             if impact.effect_type == "spark":
-                self._render_spark_impact(pos, impact)
+                render = self._render_spark_impact
             elif impact.effect_type == "explosion":
-                self._render_explosion_impact(pos, impact)
+                render = self._render_explosion_impact
             elif impact.effect_type == "slash":
-                self._render_slash_impact(pos, impact)
+                render = self._render_slash_impact
+            else:
+                continue
+            render_pipeline.draw(partial(render, Position(pos.x + self.camera_offset[0],
+                                                         pos.y + self.camera_offset[1]),
+                                         copy.copy(impact)))
 
     def _render_spark_impact(self, pos: Position, impact: ImpactEffect):
         """Render spark-style impact"""
@@ -157,13 +197,13 @@ class VFXRenderer(System):
             end_x = pos.x + math.cos(angle) * size
             end_y = pos.y + math.sin(angle) * size
 
-            pygame.draw.line(
+            dirty_rects.mark(pygame.draw.line(
                 self.screen,
                 (255, 255, 200),
                 (int(pos.x), int(pos.y)),
                 (int(end_x), int(end_y)),
                 2
-            )
+            ))
 
     def _render_explosion_impact(self, pos: Position, impact: ImpactEffect):
         """Render explosion-style impact"""
@@ -171,13 +211,13 @@ class VFXRenderer(System):
         radius = int(15 * impact.scale)
 
         # Draw expanding circle
-        pygame.draw.circle(
+        dirty_rects.mark(pygame.draw.circle(
             self.screen,
             (255, 100, 50),
             (int(pos.x), int(pos.y)),
             radius,
             3
-        )
+        ))
 
     def _render_slash_impact(self, pos: Position, impact: ImpactEffect):
         """Render slash-style impact"""
@@ -189,19 +229,22 @@ class VFXRenderer(System):
         end_x = pos.x + math.cos(angle) * length
         end_y = pos.y + math.sin(angle) * length
 
-        pygame.draw.line(
+        dirty_rects.mark(pygame.draw.line(
             self.screen,
             (200, 200, 255),
             (int(pos.x), int(pos.y)),
             (int(end_x), int(end_y)),
             4
-        )
+        ))
 
 
 # === VFX HELPER FUNCTIONS ===
 
 def create_weapon_trail(world, x: float, y: float, color: tuple, length: int = 10):
-    """Create a trail effect entity"""
+    """Create a trail effect entity (None over the VFX budget)"""
+    from src.systems.budget_system import request_budget
+    if not request_budget(world, "vfx"):
+        return None
     trail_entity = world.create_entity()
     trail_entity.add_component(Position(x, y))
     trail_entity.add_component(TrailEffect(color, length, fade_speed=0.5))
@@ -210,7 +253,10 @@ def create_weapon_trail(world, x: float, y: float, color: tuple, length: int = 1
 
 
 def create_glow_effect(world, x: float, y: float, size: float, color: tuple, intensity: float = 1.0):
-    """Create a glow effect entity"""
+    """Create a glow effect entity (None over the VFX budget)"""
+    from src.systems.budget_system import request_budget
+    if not request_budget(world, "vfx"):
+        return None
     glow_entity = world.create_entity()
     glow_entity.add_component(Position(x, y))
     glow_entity.add_component(Size(size, size))
@@ -220,7 +266,10 @@ def create_glow_effect(world, x: float, y: float, size: float, color: tuple, int
 
 
 def create_impact_effect(world, x: float, y: float, effect_type: str = "spark"):
-    """Create an impact effect"""
+    """Create an impact effect (None over the VFX budget)"""
+    from src.systems.budget_system import request_budget
+    if not request_budget(world, "vfx"):
+        return None
     impact_entity = world.create_entity()
     impact_entity.add_component(Position(x, y))
     impact_entity.add_component(ImpactEffect(effect_type, duration=0.3))
@@ -231,38 +280,21 @@ def create_impact_effect(world, x: float, y: float, effect_type: str = "spark"):
 def create_enhanced_particles(world, x: float, y: float, color: tuple, count: int = 15,
                               particle_type: str = "burst", speed_mult: float = 1.0):
     """Create enhanced particle effects"""
-    for i in range(count):
-        if particle_type == "burst":
-            # Radial burst
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(100, 300) * speed_mult
-        elif particle_type == "fountain":
-            # Upward fountain
-            angle = random.uniform(-math.pi * 0.3, -math.pi * 0.7)
-            speed = random.uniform(150, 350) * speed_mult
-        elif particle_type == "trail":
-            # Directional trail
-            angle = random.uniform(-0.2, 0.2)
-            speed = random.uniform(50, 150) * speed_mult
-        else:
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(100, 200) * speed_mult
-
-        particle = world.create_entity()
-        particle.add_component(Position(x, y))
-        particle.add_component(Velocity(
-            math.cos(angle) * speed,
-            math.sin(angle) * speed
-        ))
-        particle.add_component(Size(random.randint(3, 7), random.randint(3, 7)))
-        particle.add_component(Sprite(color, radius=random.uniform(2, 4)))
-
-        # Enhanced particle component
-        from src.systems.particle_system import ParticleComponent
-        particle.add_component(ParticleComponent(
-            lifetime=random.uniform(0.4, 1.2)
-        ))
-        particle.add_component(Tag("particle"))
+    from src.systems.particle_system import emit_particles
+    if particle_type == "burst":
+        # Radial burst
+        angle, speed = (0, 2 * math.pi), (100, 300)
+    elif particle_type == "fountain":
+        # Upward fountain
+        angle, speed = (-math.pi * 0.7, -math.pi * 0.3), (150, 350)
+    elif particle_type == "trail":
+        # Directional trail
+        angle, speed = (-0.2, 0.2), (50, 150)
+    else:
+        angle, speed = (0, 2 * math.pi), (100, 200)
+
+    emit_particles(world, x, y, count, color, 2, speed=(speed[0] * speed_mult, speed[1] * speed_mult),
+                   lifetime=(0.4, 1.2), angle=angle, radius_max=3)
 
 
 # === CREATIVE DIRECTOR NOTE ===
@@ -272,5 +304,6 @@ def create_enhanced_particles(world, x: float, y: float, color: tuple, count: in
 # - Impact effects for satisfying hit feedback
 # - Enhanced particle system with different emission types
 # - All effects designed to improve game juice without tanking performance
+# - Glows and trail dots come from cached sprites, blitted in one batch each
 
 
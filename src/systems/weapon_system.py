@@ -71,24 +71,14 @@ class WeaponFireSystem(System):
 
     def _fire_homing_missiles(self, player_pos: Position, damage: float, range_: float, count: int, color: tuple):
         """Fire homing missiles at nearest enemies"""
-        # Find nearest enemies
-        enemies = self.get_entities(Enemy, Position, Health)
-        if not enemies:
-            return
-
-        # Sort by distance
-        def distance_to_player(enemy):
-            pos = enemy.get_component(Position)
-            dx = pos.x - player_pos.x
-            dy = pos.y - player_pos.y
-            return math.sqrt(dx * dx + dy * dy)
-
-        enemies.sort(key=distance_to_player)
-
-        # Fire missiles at nearest enemies
-        for i in range(min(count, len(enemies))):
-            target = enemies[i]
-
+        # Find nearest enemies (shared per-frame targeting query)
+        from src.systems.spatial_system import nearest_k
+        targets = nearest_k(self.world, player_pos, count)
+
+        # Fire missiles at nearest enemies (within the projectile budget)
+        from src.systems.budget_system import request_budget
+        targets = targets[:request_budget(self.world, "projectiles", len(targets))]
+        for target in targets:
             # Create homing missile
             missile = self.world.create_entity()
             missile.add_component(Position(player_pos.x, player_pos.y))
@@ -102,7 +92,9 @@ class WeaponFireSystem(System):
         """Create orbiting blade entities"""
         # This would create persistent blade entities that orbit the player
         # For simplicity, we'll create projectiles that move in a circle
-        for i in range(count):
+        from src.systems.budget_system import request_budget
+        granted = request_budget(self.world, "projectiles", count)
+        for i in range(granted):
             angle = (2 * math.pi / count) * i + (self.world.time if hasattr(self.world, 'time') else 0)
 
             # Calculate position on orbit
@@ -141,57 +133,34 @@ class WeaponFireSystem(System):
 
     def _fire_chain_lightning(self, player_pos: Position, damage: float, range_: float, count: int, color: tuple):
         """Fire chain lightning that bounces between enemies"""
-        # Find nearest enemy
-        enemies = self.get_entities(Enemy, Position, Health)
-        if not enemies:
+        from src.systems.spatial_system import get_enemy_index
+        index = get_enemy_index(self.world)
+        if not len(index):
             return
 
-        # Sort by distance
-        def distance_to_player(enemy):
-            pos = enemy.get_component(Position)
-            dx = pos.x - player_pos.x
-            dy = pos.y - player_pos.y
-            return math.sqrt(dx * dx + dy * dy)
-
-        enemies.sort(key=distance_to_player)
+        # Walk the chain once: each bounce is a nearest-neighbor query that skips
+        # already-hit slots (hit set is an integer bitset over index slots)
+        chain = []
+        hit_mask = 0
+        current_x, current_y = player_pos.x, player_pos.y
 
-        # Start chain from player position
-        for chain_num in range(count):
-            if not enemies:
+        # Chain up to 5 times
+        for bounce in range(5):
+            nearest = index.nearest(current_x, current_y, 1, max_distance=range_, exclude=hit_mask)
+            if not nearest:
                 break
 
-            current_pos = player_pos
-            hit_enemies = set()
-
-            # Chain up to 5 times
-            for bounce in range(5):
-                # Find nearest unaffected enemy
-                nearest = None
-                nearest_dist = float('inf')
-
-                for enemy in enemies:
-                    if enemy.id in hit_enemies:
-                        continue
-
-                    enemy_pos = enemy.get_component(Position)
-                    dx = enemy_pos.x - current_pos.x
-                    dy = enemy_pos.y - current_pos.y
-                    dist = math.sqrt(dx * dx + dy * dy)
+            slot = nearest[0][1]
+            chain.append(slot)
+            hit_mask |= 1 << slot
+            current_x, current_y = index.position(slot)
 
-                    if dist <= range_ and dist < nearest_dist:
-                        nearest = enemy
-                        nearest_dist = dist
-
-                if not nearest:
-                    break
-
-                # Damage enemy
-                health = nearest.get_component(Health)
+        # Every chain follows the same path from the player
+        for chain_num in range(count):
+            for bounce, slot in enumerate(chain):
+                health = index.entities[slot].get_component(Health)
                 health.damage(damage * (0.8 ** bounce))  # 20% less damage per bounce
 
-                hit_enemies.add(nearest.id)
-                current_pos = nearest.get_component(Position)
-
 
 class LevelUpChoiceSystem(System):
     """Handle level-up weapon choices"""
@@ -0,0 +1,126 @@
+"""
+DARK SANCTUM - Sprite Atlas Builder
+Matrix Team: Technical Director + UI/UX Designer
+
+Packs character, enemy, boss and weapon-icon sprites (plus their scaled,
+hit-flash and boss-glow render variants) into a few large RGBA pages.
+Writes one .npz file: page pixels + a JSON rect table + a hash of the
+sources, loaded at startup by AssetManager with a single decode.
+
+Run from the repository root after changing sprites or icons:
+    python tools/build_atlas.py
+A stale atlas (hash mismatch) is ignored at startup with a warning and the
+game falls back to the source sprites and generated icons.
+"""
+
+import json
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pygame
+
+# Display needed for convert_alpha in the asset manager
+pygame.init()
+pygame.display.set_mode((1, 1))
+
+from config.settings import ATLAS_PATH, SPRITE_SCALE, RENDER_SCALE
+from src.core.asset_manager import asset_manager, atlas_entry, atlas_source_hash, SPRITE_FILES, WEAPON_ICON_IDS
+
+# Atlas page size (pixels) and gap between packed images
+PAGE_SIZE = 1024
+PADDING = 1
+
+# Level-up cards show weapon icons at 2x
+ICON_CARD_SCALE = 2.0
+
+
+def collect_images() -> dict:
+    """Every sprite render variant the game draws: atlas entry -> Surface"""
+    # Build from sources, never from a previously built atlas
+    asset_manager.atlas_pages.clear()
+    asset_manager.atlas_rects.clear()
+    asset_manager.sprites.clear()
+    asset_manager.load_source_sprites()
+
+    images = {}
+    for key in SPRITE_FILES:
+        source = asset_manager.get_sprite(key)
+        images[atlas_entry(key)] = source
+
+        # In-game render variants (RenderSystem: SPRITE_SCALE, flash on hit, glow for bosses)
+        # plus the low-resolution target's scale when RENDER_SCALE > 1
+        variants = ["normal", "flash"] + (["glow"] if key.startswith("boss_") else [])
+        for scale in sorted({SPRITE_SCALE, SPRITE_SCALE / RENDER_SCALE}):
+            for variant in variants:
+                images[atlas_entry(key, scale, variant)] = \
+                    asset_manager._build_render_surface(source, scale, variant)
+
+    for weapon_id in WEAPON_ICON_IDS:
+        key = f'weapon_{weapon_id}'
+        source = asset_manager.get_sprite(key)
+        images[atlas_entry(key)] = source
+        images[atlas_entry(key, ICON_CARD_SCALE)] = \
+            asset_manager._build_render_surface(source, ICON_CARD_SCALE, "normal")
+
+    return images
+
+
+def pack(images: dict) -> tuple:
+    """Shelf-pack images (tallest first) into pages, return (pages, rect table)"""
+    order = sorted(images, key=lambda entry: (-images[entry].get_height(), entry))
+
+    pages = []
+    table = {}
+    page = None
+    x = y = shelf_height = 0
+
+    for entry in order:
+        image = images[entry]
+        w, h = image.get_size()
+        if w + PADDING > PAGE_SIZE or h + PADDING > PAGE_SIZE:
+            raise ValueError(f"{entry} ({w}x{h}) does not fit in a {PAGE_SIZE}px atlas page")
+
+        # Next shelf, or next page
+        if page is not None and x + w > PAGE_SIZE:
+            x = 0
+            y += shelf_height + PADDING
+            shelf_height = 0
+        if page is None or y + h > PAGE_SIZE:
+            page = pygame.Surface((PAGE_SIZE, PAGE_SIZE), pygame.SRCALPHA)
+            pages.append(page)
+            x = y = shelf_height = 0
+
+        # RGBA_MAX onto a transparent page copies pixels exactly (no blending)
+        page.blit(image, (x, y), special_flags=pygame.BLEND_RGBA_MAX)
+        table[entry] = [len(pages) - 1, x, y, w, h]
+
+        x += w + PADDING
+        shelf_height = max(shelf_height, h)
+
+    return pages, table
+
+
+def build_atlas(path: str = ATLAS_PATH):
+    """Build and save the atlas file"""
+    print("🎨 Building sprite atlas...")
+    images = collect_images()
+    pages, table = pack(images)
+
+    pixels = np.stack([
+        np.frombuffer(pygame.image.tobytes(page, "RGBA"), dtype=np.uint8).reshape(PAGE_SIZE, PAGE_SIZE, 4)
+        for page in pages
+    ])
+    np.savez_compressed(path, pages=pixels, rects=np.array(json.dumps(table, sort_keys=True)),
+                        source_hash=np.array(atlas_source_hash(asset_manager.sprites_dir)))
+
+    print(f"✅ Packed {len(table)} images into {len(pages)} page(s)")
+    print(f"📁 Saved to: {path} ({os.path.getsize(path) // 1024} KB)")
+
+
+if __name__ == '__main__':
+    build_atlas()